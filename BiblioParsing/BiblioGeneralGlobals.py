@@ -5,17 +5,22 @@ __all__ = ['ACCENT_CHANGE',
            'ALIAS_UK',
            'ALIAS_USA',
            'APOSTROPHE_CHANGE',
+           'COMPACT_CATEGORY_RATIO',
            'COUNTRIES',
+           'COUNTRIES_ALIAS',
            'COUNTRIES_CODES',
            'COUNTRIES_CONTINENT',
            'COUNTRIES_GPS',
            'DASHES_CHANGE',
            'IN_TO_MM',
            'LANG_CHAR_CHANGE',
+           'NORM_NAME_CACHE_SIZE',
            'PONCT_CHANGE',
+           'PROGRESS_MIN_INTERVAL',
            'SYMB_CHANGE',
            'SYMB_DROP',
            'REP_UTILS',
+           'STD_ADDRESS_CACHE_SIZE',
            'TITLE_SYMB_CHANGE_DIC',
            'USA_STATES',
            'ZIP_CODES',]
@@ -107,6 +112,22 @@ ALIAS_BLR = [x.strip() for x in ALIAS_BLR.split(',')]
 ALIAS_TUR = '''Turkiye'''
 ALIAS_TUR = [x.strip() for x in ALIAS_TUR.split(',')]
 
+# Normalized country names keyed by the exact country names and aliases
+# (the substring rules are applied by the `normalize_country` function)
+COUNTRIES_ALIAS = {country: country for country in COUNTRIES}
+for aliases_list, country in [(ALIAS_UK, 'United Kingdom'),
+                              (ALIAS_USA, 'United States'),
+                              (['Russia'], 'Russian Federation'),
+                              (['U Arab Emirates'], 'United Arab Emirates'),
+                              (['Vietnam'], 'Viet Nam'),
+                              (['Palestine'], 'Palestinian Territory'),
+                              (ALIAS_FR, 'France'),
+                              (ALIAS_BLR, 'Belarus'),
+                              (ALIAS_TUR, 'Turkey'),
+                             ]:
+    for alias in aliases_list:
+        COUNTRIES_ALIAS.setdefault(alias, country)
+
 #To Do : Check if this global is still used
 # Character replacements
 ACCENT_CHANGE_DIC = {'À': 'A', 'Á': 'A', 'Â': 'A', 'Ã': 'A', 'Ä': 'A',
@@ -197,3 +218,15 @@ TITLE_SYMB_CHANGE_DIC = {" - ": "-",
 
 # Conversion factor for inch to millimeter
 IN_TO_MM = 25.4
+
+# Maximum number of normalized author names cached by `normalize_name` function
+NORM_NAME_CACHE_SIZE = 2**18
+
+# Maximum number of standardized addresses cached by `standardize_address` function
+STD_ADDRESS_CACHE_SIZE = 2**16
+
+# Maximum ratio of distinct values to rows number of a column to be cast to category by `compact_item_df` function
+COMPACT_CATEGORY_RATIO = 0.5
+
+# Minimum time in seconds between two progress reports of the progress hooks
+PROGRESS_MIN_INTERVAL = 0.5
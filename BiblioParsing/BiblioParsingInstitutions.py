@@ -8,12 +8,18 @@ __all__ = ['address_inst_full_list',
 
 
 # Standard library imports
+import copy
+import math
+import os
 import re
 from pathlib import Path
 from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from string import Template
 
 # 3rd party imports
+import numpy as np
 import openpyxl
 import pandas as pd
 
@@ -21,10 +27,11 @@ import pandas as pd
 import BiblioParsing as bp
 import BiblioParsing.BiblioGeneralGlobals as bp_gg
 import BiblioParsing.BiblioSpecificGlobals as bp_sg
+from BiblioParsing.BiblioParsingProgress import get_progress_hook
 from BiblioParsing.BiblioParsingUtils import remove_special_symbol
 from BiblioParsing.BiblioParsingUtils import rationalize_town_names
 from BiblioParsing.BiblioParsingUtils import build_item_df_from_tup
-from BiblioParsing.BiblioParsingUtils import standardize_address
+from BiblioParsing.BiblioParsingUtils import standardize_addresses
 
 
 def _set_norm_affiliations_cols():
@@ -252,8 +259,8 @@ def address_inst_full_list(full_address, norm_raw_aff_dict, aff_type_dict, towns
     else:
         raw_inst_full_list_str = bp_sg.EMPTY
 
-    # Building a string from the final list of normalized institutions without duplicates
-    norm_inst_full_list = list(set(norm_inst_full_list))
+    # Building a string from the final sorted list of normalized institutions without duplicates
+    norm_inst_full_list = sorted(set(norm_inst_full_list))
     if norm_inst_full_list:
         norm_inst_full_list_str = ";".join(norm_inst_full_list)
     else:
@@ -265,7 +272,7 @@ def address_inst_full_list(full_address, norm_raw_aff_dict, aff_type_dict, towns
     return inst_full_list_tup
 
 
-def extend_author_institutions(item_df, inst_filter_list):
+def extend_author_institutions(item_df, inst_filter_list, sparse=False):
     """Extends the data of authors with affiliation institutions initialy obtained 
     by the parsing of the corpus, with complementary information about institutions
     selected by the user.
@@ -274,54 +281,47 @@ def extend_author_institutions(item_df, inst_filter_list):
     of a normalized institution and the corresponding collumn name. For each normalized 
     institution, the corresponding column is filled with 1 for each of the author 
     affiliated to this institution. Otherwise, it is filled with 0.
+    The affiliation is tested as the presence of the normalized institution 
+    in the string of the author institutions, once for each distinct string. 
+    The columns are of int8 type, sparse with 0 as fill value if 'sparse' is True.
 
     Args:
         item_df (dataframe): The data of authors with affiliation institutions.
         inst_filter_list (list): The list of tuples selected by the user.
+        sparse (bool): True for sparse columns, useful for a long list \
+        of selected institutions (default: False).
     Retruns:
         (dataframe): The extended data with the columns given by the user.
     """
-    # Internal function
-    def _build_complement_inst_list(inst_names_list, institutions):
-        complement_inst_list = []
-        for inst in inst_names_list:
-            if inst in institutions:
-                complement_inst_list.append(1)
-            else:
-                complement_inst_list.append(0)
-        return complement_inst_list
-
-
     # Setting useful column names
     cols_lists_dic, cols_dic = _set_norm_affiliations_cols()
     read_usecols = cols_lists_dic['auth_inst_cols_list'][0:5]
     norm_institution_col = cols_dic['norm_institution_col']
-    temp_col = "temp_col"
 
     # Getting the useful columns of the item df
-    item_df = item_df[read_usecols]
+    item_dg = item_df[read_usecols].reset_index(drop=True)
 
     # Setting an institution name for each of the institutions indicated in the institutions filter
     inst_names_list = [f'{x[0]}' for x in inst_filter_list]
     inst_col_list = [f'{x[1]}' for x in inst_filter_list]
 
-    # Building a list of 0 or 1 in 'temp_col' column added to the initial data using "inst_filter_list"
-    item_dg = item_df.copy()
-    item_dg[temp_col] = item_dg.apply(lambda row: _build_complement_inst_list(inst_names_list,
-                                                                              row[norm_institution_col]),
-                                      axis=1)
-    item_dg.reset_index(inplace=True, drop=True)
-
-    # Distributing the value lists of 'temp_col' column in a dataframe
-    # into columns which names are in 'inst_col_list' list
-    inst_split_df = pd.DataFrame(item_dg[temp_col].sort_index().to_list(),
-                                 columns=inst_col_list)
-
-    # Extending the initial data with the previously built data from 'temp_col' column
-    new_item_df = pd.concat([item_dg, inst_split_df], axis=1)
-
-    # Droping the temp_col column which is no more useful
-    new_item_df.drop([temp_col], axis=1, inplace=True)
+    # Testing the institutions of the filter in the distinct institutions strings
+    inst_codes_array, institutions_index = pd.factorize(item_dg[norm_institution_col])
+    institutions_series = pd.Series(institutions_index, dtype=object).astype(str)
+    known_codes_array = inst_codes_array>=0
+
+    # Building the int8 column of 0 or 1 of each institution of the filter
+    inst_series_list = []
+    for inst_name, inst_col in zip(inst_names_list, inst_col_list):
+        uniques_flags_array = institutions_series.str.contains(inst_name, regex=False).to_numpy(dtype=np.int8)
+        flags_array = np.zeros(len(item_dg), dtype=np.int8)
+        flags_array[known_codes_array] = uniques_flags_array[inst_codes_array[known_codes_array]]
+        if sparse:
+            flags_array = pd.arrays.SparseArray(flags_array, fill_value=0)
+        inst_series_list.append(pd.Series(flags_array, name=inst_col))
+
+    # Extending the initial data with the built columns
+    new_item_df = pd.concat([item_dg] + inst_series_list, axis=1)
     return new_item_df
 
 
@@ -1139,12 +1139,156 @@ def _check_norm_raw_aff_dict(norm_raw_aff_dict, aff_type_dict, user_country_affi
     return wrong_affil_types_dict
 
 
+# Reference dicts and progress hook used by the worker processes resolving the affiliations of addresses
+_RESOLUTION_DICTS = None
+_RESOLUTION_HOOK = None
+
+
+def _init_addresses_resolution(norm_raw_aff_dict, aff_type_dict, towns_dict, progress_hook=None):
+    """Sets the reference dicts and the progress hook used by `_resolve_addresses_chunk` function 
+    of the same module in a worker process.
+
+    Args:
+        norm_raw_aff_dict (dict): The dict built by the `build_norm_raw_affiliations_dict` function.
+        aff_type_dict (dict): The dict built by the `read_inst_types` function.
+        towns_dict (dict): The dict built by the `read_towns_per_country` function.
+        progress_hook (ProgressHook or str): The progress hook reporting the events \
+        as got by the `get_progress_hook` function imported from `BiblioParsingProgress` module \
+        (default: None for the default progress hook).
+    """
+    global _RESOLUTION_DICTS, _RESOLUTION_HOOK
+    _RESOLUTION_DICTS = (norm_raw_aff_dict, aff_type_dict, towns_dict)
+    _RESOLUTION_HOOK = progress_hook
+
+
+def _resolve_addresses_chunk(std_addresses_list):
+    """Resolves the country and the normalized and raw affiliations of standardized addresses 
+    using the `_build_address_affiliations_lists` function of the same module 
+    with the reference dicts and the progress hook set by the `_init_addresses_resolution` function.
+
+    Args:
+        std_addresses_list (list): The standardized addresses (str) to resolve.
+    Returns:
+        (list): The tuples (country (str), normalized affiliations (list), raw affiliations (list)) \
+        of the addresses.
+    """
+    norm_raw_aff_dict, aff_type_dict, towns_dict = _RESOLUTION_DICTS
+    resolved_list = []
+    for std_address in std_addresses_list:
+        try:
+            aff_list_tup = _build_address_affiliations_lists(std_address, norm_raw_aff_dict,
+                                                             aff_type_dict, towns_dict,
+                                                             drop_status=True, verbose=False)
+        except KeyError:
+            get_progress_hook(_RESOLUTION_HOOK).event(f"\n\nError address: {std_address}")
+            aff_list_tup = ("", [], [])
+        resolved_list.append(tuple(aff_list_tup))
+    return resolved_list
+
+
+def _set_progress_updater(steps_nb, progress_param=None, progress_hook=None):
+    """Sets a function reporting the progress of a processing of 'steps_nb' steps 
+    through a progress hook and, with at most a number of updates given 
+    by the global 'PROGRESS_UPDATES_NB', through the ProgressBar tkinter widget.
+
+    Args:
+        steps_nb (int): The number of steps of the processing.
+        progress_param (tup): (Function for updating ProgressBar tkinter widget status, \
+        The initial progress status (int), The final progress status (int)) \
+        (optional, default = None)
+        progress_hook (ProgressHook): The started progress hook (default: None).
+    Returns:
+        (function): The function to call with the number of done steps.
+    """
+    updates_period = max(1, math.ceil(steps_nb / bp_sg.PROGRESS_UPDATES_NB))
+    last_update = [0]
+    if progress_param:
+        progress_callback, init_progress, final_progress = progress_param
+        progress_callback(init_progress)
+
+    def update_progress(step):
+        if progress_hook is not None:
+            progress_hook.update(step)
+        if step - last_update[0]<updates_period and step<steps_nb:
+            return
+        last_update[0] = step
+        if progress_param:
+            progress_callback(init_progress + (final_progress - init_progress) * step / steps_nb)
+
+    return update_progress
+
+
+def _resolve_addresses(std_addresses_list, norm_raw_aff_dict, aff_type_dict, towns_dict,
+                       workers=1, progress_param=None, progress_hook=None):
+    """Resolves the country and the normalized and raw affiliations of distinct standardized 
+    addresses by chunks given by the global 'ADDRESSES_CHUNK_SIZE' using 
+    the `_resolve_addresses_chunk` function of the same module.
+
+    The chunks are resolved in parallel by 'workers' processes when there is 
+    more than one chunk and more than one worker, and serially otherwise 
+    or if the processes pool cannot be started. The worker processes report 
+    their events through a copy of the progress hook which must then be picklable.
+
+    Args:
+        std_addresses_list (list): The distinct standardized addresses (str) to resolve.
+        norm_raw_aff_dict (dict): The dict built by the `build_norm_raw_affiliations_dict` function.
+        aff_type_dict (dict): The dict built by the `read_inst_types` function.
+        towns_dict (dict): The dict built by the `read_towns_per_country` function.
+        workers (int): The number of processes, None for the number of CPUs (default: 1).
+        progress_param (tup): (Function for updating ProgressBar tkinter widget status, \
+        The initial progress status (int), The final progress status (int)) \
+        (optional, default = None)
+        progress_hook (ProgressHook or str): The progress hook reporting the progress and the events \
+        as got by the `get_progress_hook` function imported from `BiblioParsingProgress` module \
+        (default: None for the default progress hook).
+    Returns:
+        (dict): The tuples (country (str), normalized affiliations (list), raw affiliations (list)) \
+        keyed by standardized address.
+    """
+    chunk_size = bp_sg.ADDRESSES_CHUNK_SIZE
+    chunks_list = [std_addresses_list[idx: idx + chunk_size]
+                   for idx in range(0, len(std_addresses_list), chunk_size)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(chunks_list))
+    progress_hook = get_progress_hook(progress_hook)
+    workers_hook = copy.copy(progress_hook)
+    progress_hook.start("        Number of distinct addresses analyzed", len(std_addresses_list))
+    update_progress = _set_progress_updater(len(std_addresses_list), progress_param, progress_hook)
+
+    resolved_dict = {}
+    if workers>1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_addresses_resolution,
+                                     initargs=(norm_raw_aff_dict, aff_type_dict, towns_dict,
+                                               workers_hook)) as executor:
+                for chunk, resolved_list in zip(chunks_list, executor.map(_resolve_addresses_chunk, chunks_list)):
+                    resolved_dict.update(zip(chunk, resolved_list))
+                    update_progress(len(resolved_dict))
+            progress_hook.close()
+            return resolved_dict
+        except (OSError, BrokenProcessPool) as error:
+            progress_hook.event("\nWARNING: Parallel resolution of addresses not available "
+                                f"({error}), switching to serial resolution.")
+            resolved_dict = {}
+
+    _init_addresses_resolution(norm_raw_aff_dict, aff_type_dict, towns_dict, progress_hook)
+    for chunk in chunks_list:
+        resolved_dict.update(zip(chunk, _resolve_addresses_chunk(chunk)))
+        update_progress(len(resolved_dict))
+    progress_hook.close()
+    return resolved_dict
+
+
 def build_norm_raw_institutions(addresses_df, inst_types_file_path=None, country_affiliations_file_path=None,
                                 country_towns_file=None, country_towns_folder_path=None,
-                                verbose=False, progress_param=None):
+                                verbose=False, progress_param=None, workers=1, progress_hook=None):
     """Parses the addresses of each publication of the corpus to retrieve the country, 
     the normalized institutions and the institutions not yet normalized for each address.
 
+    Each distinct standardized address is resolved once using the `_resolve_addresses` 
+    internal function of the same module and the results are mapped back to the addresses.
+
     Args:
         addresses_df (dataframe): the data of the addresses resulting from the parsing of \
         the corpus after concatenation and deduplication of partial parsings.
@@ -1159,6 +1303,14 @@ def build_norm_raw_institutions(addresses_df, inst_types_file_path=None, country
         progress_param (tup): (Function for updating ProgressBar tkinter widget status, \
         The initial progress status (int), The final progress status (int)) \
         (optional, default = None)
+        workers (int): The number of processes used to resolve the addresses, \
+        None for the number of CPUs (default: 1 for a serial resolution); with more than one worker \
+        on the platforms starting the processes by spawning, such as Windows and macOS, \
+        the calling script must be protected by an `if __name__ == "__main__":` guard \
+        and the progress hook must be picklable.
+        progress_hook (ProgressHook or str): The progress hook reporting the progress \
+        of the addresses resolution as got by the `get_progress_hook` function imported \
+        from `BiblioParsingProgress` module (default: None for the default progress hook).
     Returns:
         (tuple): (countries data per address (dataframe), normalized affiliations per address (dataframe), \
         raw institutions per address (dataframe), A dict of wrong type of normalized affiliation \
@@ -1190,61 +1342,39 @@ def build_norm_raw_institutions(addresses_df, inst_types_file_path=None, country
                                                       country_affiliations_file_path)
 
     if not wrong_affil_types_dict:
-        step_nb = len(addresses_df)
-        step = 0
-        if progress_param:
-            progress_callback, init_progress, final_progress = progress_param
-            progress_step = (final_progress-init_progress) / step_nb
-            progress_status = init_progress
-            progress_callback(progress_status)
-
+        # Standardizing the addresses in the order of the publications
+        addresses_df = addresses_df.dropna(subset=[pub_id_col]).sort_values(by=[pub_id_col], kind='stable')
+        std_addresses = standardize_addresses(addresses_df[address_col])
+
+        # Resolving the distinct standardized addresses
+        resolved_dict = _resolve_addresses(pd.unique(std_addresses).tolist(), norm_raw_aff_dict,
+                                           aff_type_dict, towns_dict, workers=workers,
+                                           progress_param=progress_param, progress_hook=progress_hook)
+
+        # Joining the affiliations of the distinct standardized addresses
+        joined_dict = {}
+        for std_address, (address_country, norm_affiliation_list, raw_affiliation_list) in resolved_dict.items():
+            address_norm_affiliations = "; ".join(norm_affiliation_list) if norm_affiliation_list else bp_sg.EMPTY
+            address_raw_affiliations = "; ".join(raw_affiliation_list) if raw_affiliation_list else bp_sg.EMPTY
+            joined_dict[std_address] = (address_country, address_norm_affiliations, address_raw_affiliations)
+
+        # Mapping back the affiliations to the addresses
         countries_list = []
         norm_institutions_list = []
         raw_institutions_list = []
-        for pub_id, pub_id_addresses_dg in addresses_df.groupby(pub_id_col):
-            if verbose:
-                print("\n\nPub_id:", pub_id)
-                print("\npub_id_addresses_dg:\n", pub_id_addresses_dg)
-            for idx, row in pub_id_addresses_dg.iterrows():
-                address_idx = row[address_id_col]
-                raw_address = row[address_col]
-                std_address = standardize_address(raw_address)
-                address_country = ""
-                address_norm_affiliation_list = []
-                address_raw_affiliation_list = []
-                try:
-                    aff_list_tup = _build_address_affiliations_lists(std_address, norm_raw_aff_dict,
-                                                                     aff_type_dict, towns_dict,
-                                                                     drop_status=True, verbose=False)
-                    address_country, address_norm_affiliation_list, address_raw_affiliation_list = aff_list_tup
-                except KeyError:
-                    print("\n\nError Pub_id / idx:", pub_id," / ", idx)
-                    print("\npub_id_addresses_dg:\n", pub_id_addresses_dg[address_col].tolist()[idx])
-                    pass
-                address_norm_affiliations = bp_sg.EMPTY
-                address_raw_affiliations = bp_sg.EMPTY
-                if address_norm_affiliation_list:
-                    address_norm_affiliations = "; ".join(address_norm_affiliation_list)
-                if address_raw_affiliation_list:
-                    address_raw_affiliations = "; ".join(address_raw_affiliation_list)
-                if address_country:
-                    countries_list.append(country(pub_id, address_idx, address_country))
-                norm_institutions_list.append(norm_institution(pub_id, address_idx, address_norm_affiliations))
-                raw_institutions_list.append(raw_institution(pub_id, address_idx, address_raw_affiliations, std_address))
-                step += 1
+        addresses_zip = zip(addresses_df[pub_id_col], addresses_df[address_id_col], std_addresses)
+        for pub_id, address_idx, std_address in addresses_zip:
+            address_country, address_norm_affiliations, address_raw_affiliations = joined_dict[std_address]
+            if address_country:
+                countries_list.append(country(pub_id, address_idx, address_country))
+            norm_institutions_list.append(norm_institution(pub_id, address_idx, address_norm_affiliations))
+            raw_institutions_list.append(raw_institution(pub_id, address_idx, address_raw_affiliations, std_address))
 
-                if verbose:
-                    print('\nIdx address:                       ', address_idx)
-                    print('Country:                           ', address_country)
-                    print('address_norm_affiliation_list:     ', address_norm_affiliations)
-                    print('address_unknown_affiliations_list: ', address_raw_affiliations)
-                    print(f"        Number of addresses analyzed: {step} / {step_nb}")
-                else:
-                    print(f"        Number of addresses analyzed: {step} / {step_nb}", end="\r")
-
-                if progress_param:
-                    progress_status += progress_step
-                    progress_callback(progress_status)
+            if verbose:
+                print('\nPub_id / Idx address:              ', pub_id, ' / ', address_idx)
+                print('Country:                           ', address_country)
+                print('address_norm_affiliation_list:     ', address_norm_affiliations)
+                print('address_unknown_affiliations_list: ', address_raw_affiliations)
 
         # Building a clean countries dataframe and accordingly updating the parsing success rate dict
         country_df, _ = build_item_df_from_tup(countries_list, country_cols_list,
@@ -0,0 +1,231 @@
+"""The BiblioParsingInstrumentation module defines functions for recording
+the wall time, the CPU time, the peak-RSS increase and the rows numbers
+of the stages of the parsing process in a stages report
+and for profiling each of these stages.
+"""
+
+__all__ = ['end_stage',
+           'get_profile_path',
+           'init_stages_report',
+           'save_stages_report',
+           'start_stage',
+           ]
+
+
+# Standard library imports
+import cProfile
+import io
+import json
+import os
+import pstats
+import re
+import sys
+import time
+from collections import namedtuple
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:
+    # The resource module is not available on Windows
+    resource = None
+
+# Local library imports
+import BiblioParsing.BiblioSpecificGlobals as bp_sg
+
+
+# Setting the named tuple of a started stage
+stage_start = namedtuple('stage_start', ['stages_report', 'stage', 'items_list',
+                                         'wall_time', 'cpu_time', 'peak_rss', 'profiler'])
+
+
+def _get_peak_rss():
+    """Gets the peak resident set size of the current process.
+
+    Returns:
+        (float): The peak resident set size in MB or None if not available.
+    """
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # The peak resident set size is given in bytes on macOS and in KB on Linux
+    return peak_rss / 2**20 if sys.platform=='darwin' else peak_rss / 2**10
+
+
+def get_profile_path(profile=None):
+    """Gets the full path to the folder where the profile of each stage is saved.
+
+    Args:
+        profile (path or bool): The full path to the folder, True for the current working \
+        directory, False for no profiling or None for the folder set by the environment \
+        variable given by the global 'PROFILE_ENV_VAR' if any (default: None).
+    Returns:
+        (path): The full path to the folder or None for no profiling.
+    """
+    if profile is None:
+        profile = os.environ.get(bp_sg.PROFILE_ENV_VAR)
+    if not profile:
+        return None
+    if profile is True:
+        return Path.cwd()
+    return Path(profile)
+
+
+def init_stages_report(label, profile_path=None, stages_report=None):
+    """Initializes a stages report to be filled by the `start_stage` and `end_stage`
+    functions of the same module.
+
+    When 'profile_path' is set, each stage is profiled through `cProfile`
+    and its profile is saved in this folder by the `end_stage` function.
+    When 'stages_report' is set, the passed dict is initialized in place
+    so that it can be given as an out-parameter by the instrumented functions.
+
+    Args:
+        label (str): The label of the instrumented process.
+        profile_path (path): The full path to the folder where the profile of each stage \
+        is saved as got by the `get_profile_path` function (default: None for no profiling).
+        stages_report (dict): The dict to initialize as the stages report (default: None for a new dict).
+    Returns:
+        (dict): The stages report with the 'label', 'date', 'cpus number' and 'stages' keys \
+        completed by the 'profile path' key when profiling.
+    """
+    if stages_report is None:
+        stages_report = {}
+    stages_report.clear()
+    stages_report.update({'label'      : label,
+                          'date'       : datetime.now().isoformat(timespec='seconds'),
+                          'cpus number': os.cpu_count(),
+                          'stages'     : [],
+                         })
+    if profile_path:
+        Path(profile_path).mkdir(parents=True, exist_ok=True)
+        stages_report['profile path'] = str(profile_path)
+    return stages_report
+
+
+def start_stage(stages_report, stage, items_list=None):
+    """Starts the recording of a stage in a stages report.
+
+    Nothing is measured if 'stages_report' is None.
+    The stage is profiled if the stages report has been initialized with a profiles folder.
+
+    Args:
+        stages_report (dict): The stages report built by the `init_stages_report` function \
+        or None for no recording.
+        stage (str): The label of the stage.
+        items_list (list): The parsing items (str) built by the stage (default: None).
+    Returns:
+        (namedtuple): The started stage to pass to the `end_stage` function or None.
+    """
+    if stages_report is None:
+        return None
+    profiler = cProfile.Profile() if 'profile path' in stages_report else None
+    started_stage = stage_start(stages_report, stage, list(items_list) if items_list else [],
+                                time.perf_counter(), time.process_time(), _get_peak_rss(), profiler)
+    if profiler is not None:
+        profiler.enable()
+    return started_stage
+
+
+def _save_stage_profile(started_stage, stage_idx, top_nb=bp_sg.PROFILE_TOP_NB):
+    """Saves the profile of a stage in the profiles folder of the stages report
+    and prints the top hotspots of the stage sorted by internal time.
+
+    The profile file is readable by `pstats` and by flamegraph tools such as snakeviz.
+
+    Args:
+        started_stage (namedtuple): The profiled stage started by the `start_stage` function.
+        stage_idx (int): The index of the stage in the stages report.
+        top_nb (int): The number of printed hotspots (default: global 'PROFILE_TOP_NB').
+    Returns:
+        (path): The full path to the profile file.
+    """
+    stages_report = started_stage.stages_report
+    file_label = "_".join([stages_report['label'], f"{stage_idx:02d}", started_stage.stage]
+                          + started_stage.items_list)
+    file_name = re.sub(r"\W+", "_", file_label).strip("_")
+    profile_file_path = Path(stages_report['profile path']) / Path(f"{file_name}.{bp_sg.PROFILE_FILE_EXTENT}")
+    started_stage.profiler.dump_stats(profile_file_path)
+
+    stream = io.StringIO()
+    stats = pstats.Stats(started_stage.profiler, stream=stream)
+    stats.strip_dirs().sort_stats(pstats.SortKey.TIME).print_stats(top_nb)
+    print(f"      - Top {top_nb} hotspots of {started_stage.stage} stage profiled in {profile_file_path.name}")
+    print(stream.getvalue().strip("\n"))
+    return profile_file_path
+
+
+def end_stage(started_stage, parsing_dict=None, rows_dict=None):
+    """Ends the recording of a stage started by the `start_stage` function
+    and adds it to the stages report.
+
+    The rows numbers of the items of the stage are got from 'parsing_dict'
+    and completed by 'rows_dict'.
+
+    Args:
+        started_stage (namedtuple): The started stage or None for no recording.
+        parsing_dict (dict): The data (dataframe) keyed by parsing item (str) (default: None).
+        rows_dict (dict): The rows numbers (int) keyed by item (str) (default: None).
+    Returns:
+        (dict): The stage record with the 'stage', 'items', 'wall time (s)', 'cpu time (s)', \
+        'peak rss delta (MB)' and 'rows' keys, completed by the 'profile file' key \
+        for a profiled stage, or None.
+    """
+    if started_stage is None:
+        return None
+    if started_stage.profiler is not None:
+        started_stage.profiler.disable()
+    wall_time = time.perf_counter() - started_stage.wall_time
+    cpu_time = time.process_time() - started_stage.cpu_time
+    peak_rss = _get_peak_rss()
+    peak_rss_delta = None
+    if peak_rss is not None and started_stage.peak_rss is not None:
+        peak_rss_delta = round(peak_rss - started_stage.peak_rss, 3)
+
+    stage_rows_dict = {}
+    if parsing_dict:
+        for item in started_stage.items_list:
+            item_df = parsing_dict.get(item)
+            if item_df is not None:
+                stage_rows_dict[item] = len(item_df)
+    if rows_dict:
+        stage_rows_dict.update(rows_dict)
+
+    stage_record = {'stage'              : started_stage.stage,
+                    'items'              : started_stage.items_list,
+                    'wall time (s)'      : round(wall_time, 6),
+                    'cpu time (s)'       : round(cpu_time, 6),
+                    'peak rss delta (MB)': peak_rss_delta,
+                    'rows'               : stage_rows_dict,
+                   }
+    if started_stage.profiler is not None:
+        stage_idx = len(started_stage.stages_report['stages'])
+        stage_record['profile file'] = str(_save_stage_profile(started_stage, stage_idx))
+    started_stage.stages_report['stages'].append(stage_record)
+    return stage_record
+
+
+def save_stages_report(stages_report, report_path, append=True):
+    """Saves a stages report in a json file.
+
+    When 'append' is True and the file already exists, the report is added
+    to the list of the reports of the previous runs kept in the file
+    so that the stages timings can be tracked across runs.
+
+    Args:
+        stages_report (dict): The stages report built by the `init_stages_report` function.
+        report_path (path): The full path of the json file.
+        append (bool): False for replacing the file content (default: True).
+    Returns:
+        (list): The list of the reports (dict) saved in the file.
+    """
+    reports_list = []
+    if append and os.path.exists(report_path):
+        with open(report_path, 'r', encoding=bp_sg.ENCODING) as file:
+            saved_reports = json.load(file)
+        reports_list = saved_reports if isinstance(saved_reports, list) else [saved_reports]
+    reports_list.append(stages_report)
+    with open(report_path, 'w', encoding=bp_sg.ENCODING) as file:
+        json.dump(reports_list, file, indent=4)
+    return reports_list
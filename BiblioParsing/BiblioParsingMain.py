@@ -5,6 +5,11 @@ __all__ = ['biblio_parser',
 
 # Local library imports
 import BiblioParsing.BiblioSpecificGlobals as bp_sg
+from BiblioParsing.BiblioParsingInstrumentation import end_stage
+from BiblioParsing.BiblioParsingInstrumentation import get_profile_path
+from BiblioParsing.BiblioParsingInstrumentation import save_stages_report
+from BiblioParsing.BiblioParsingInstrumentation import start_stage
+from BiblioParsing.BiblioParsingUtils import compact_parsing_dict
 from BiblioParsing.BiblioParsingScopus import biblio_parser_scopus
 from BiblioParsing.BiblioParsingScopus import read_database_scopus
 from BiblioParsing.BiblioParsingWos import biblio_parser_wos
@@ -47,7 +52,8 @@ def biblio_parser(rawdata_path, database, inst_filter_list=None,
                   country_affiliations_file_path=None,
                   inst_types_file_path=None,
                   country_towns_file=None,
-                  country_towns_folder_path=None):
+                  country_towns_folder_path=None,
+                  compact=False, report=None, report_path=None, progress_hook=None, profile=None):
     """Parses corpus rawdata using the appropriate parser.
 
     Two parsers are available:
@@ -66,22 +72,54 @@ def biblio_parser(rawdata_path, database, inst_filter_list=None,
         country_towns_file (str): The name of the file of the data of towns per country, optional (default=None).
         country_towns_folder_path (path): The full path to the folder where the 'country_towns_file' file \
         is available, optional (default=None).
+        compact (bool): True for compacting the parsing data through the `compact_parsing_dict` \
+        function imported from `BiblioParsingUtils` module and printing the memory use \
+        of each item before and after compaction (default: False).
+        report (dict): The dict filled in place with the stages report recording the wall time, \
+        the CPU time, the peak-RSS increase and the rows numbers of each parsing stage \
+        through the `start_stage` and `end_stage` functions imported from `BiblioParsingInstrumentation` \
+        module (default: None for no stages report).
+        report_path (path): The full path of the json file where the stages report is added \
+        through the `save_stages_report` function imported from the same module, \
+        which enables the recording (default: None).
+        progress_hook (ProgressHook or str): The progress hook reporting the progress and the events \
+        of the parsing as got by the `get_progress_hook` function imported from `BiblioParsingProgress` \
+        module (default: None for the default progress hook).
+        profile (path or bool): The full path to the folder where the profile of each parsing stage \
+        is saved and its top hotspots are printed through the `start_stage` and `end_stage` \
+        functions imported from `BiblioParsingInstrumentation` module, as got by the `get_profile_path` \
+        function of the same module (default: None for the folder set by the environment variable \
+        given by the global 'PROFILE_ENV_VAR' if any).
     Returns:
         (tup): The tuple of parsing results returned by the used appropriate parser.
     """
+    profile_path = get_profile_path(profile)
+    stages_report = report if report is not None else ({} if report_path or profile_path else None)
     if database==bp_sg.WOS:
         parsing_tup = biblio_parser_wos(rawdata_path, inst_filter_list=inst_filter_list,
                                         country_affiliations_file_path=country_affiliations_file_path,
                                         inst_types_file_path=inst_types_file_path,
                                         country_towns_file=country_towns_file,
-                                        country_towns_folder_path=country_towns_folder_path)
+                                        country_towns_folder_path=country_towns_folder_path,
+                                        report=stages_report, progress_hook=progress_hook,
+                                        profile=profile_path or False)
     elif database==bp_sg.SCOPUS:
         parsing_tup = biblio_parser_scopus(rawdata_path, inst_filter_list=inst_filter_list,
                                            country_affiliations_file_path=country_affiliations_file_path,
                                            inst_types_file_path=inst_types_file_path,
                                            country_towns_file=country_towns_file,
-                                           country_towns_folder_path=country_towns_folder_path)
+                                           country_towns_folder_path=country_towns_folder_path,
+                                           report=stages_report, progress_hook=progress_hook,
+                                           profile=profile_path or False)
     else:
         raise Exception(f"Sorry, unrecognized database {database} : should be {bp_sg.WOS} or {bp_sg.SCOPUS}")
 
+    if compact:
+        stage = start_stage(stages_report, "compaction", list(parsing_tup[0].keys()))
+        compact_dict, _ = compact_parsing_dict(parsing_tup[0], verbose=True)
+        parsing_tup = (compact_dict,) + tuple(parsing_tup[1:])
+        end_stage(stage, compact_dict)
+
+    if report_path:
+        save_stages_report(stages_report, report_path)
     return parsing_tup
\ No newline at end of file
@@ -0,0 +1,219 @@
+"""The BiblioParsingProgress module defines the progress hooks used by the long-running
+functions of the parsing process to report their progress and their events, such as warnings,
+with prints, tqdm progress bars, logging records or silently.
+"""
+
+__all__ = ['LoggingProgressHook',
+           'PROGRESS_HOOKS',
+           'PrintProgressHook',
+           'ProgressHook',
+           'TqdmProgressHook',
+           'get_progress_hook',
+           'set_progress_hook',
+           ]
+
+
+# Standard library imports
+import logging
+import time
+
+# 3rd party imports
+from tqdm import tqdm
+
+# Local library imports
+import BiblioParsing.BiblioGeneralGlobals as bp_gg
+
+
+class ProgressHook:
+    """Silent progress hook that is the base class of the progress hooks.
+
+    A progress is started by the `start` method, advanced by the `update` method
+    with the number of done steps and ended by the `close` method.
+    The updates are rate-limited so that the `_show` method is called at most
+    once per 'min_interval' seconds, the first and the last steps being always shown.
+    The events are reported by the `event` method.
+
+    Args:
+        min_interval (float): The minimum time in seconds between two shown updates \
+        (default: global 'PROGRESS_MIN_INTERVAL').
+    """
+
+    def __init__(self, min_interval=bp_gg.PROGRESS_MIN_INTERVAL):
+        self.min_interval = min_interval
+        self.label = None
+        self.total = 0
+        self.done = 0
+        self._shown_done = None
+        self._shown_time = None
+
+    def start(self, label, total):
+        """Starts the progress of a processing of 'total' steps.
+
+        Args:
+            label (str): The label of the progress.
+            total (int): The number of steps of the processing.
+        Returns:
+            (ProgressHook): The started progress hook.
+        """
+        self.label = label
+        self.total = total
+        self.done = 0
+        self._shown_done = None
+        self._shown_time = None
+        self._start()
+        return self
+
+    def update(self, done):
+        """Updates the progress with the number of done steps.
+
+        Args:
+            done (int): The number of done steps.
+        """
+        self.done = done
+        now = time.monotonic()
+        if (self._shown_time is None or done>=self.total
+            or now - self._shown_time>=self.min_interval):
+            self._shown_time = now
+            self._shown_done = done
+            self._show(done)
+
+    def close(self):
+        """Ends the progress, showing the last number of done steps if not yet shown."""
+        if self.label is None:
+            return
+        if self._shown_done!=self.done:
+            self._show(self.done)
+        self._close()
+        self.label = None
+
+    def event(self, message, level=logging.WARNING):
+        """Reports an event of the processing.
+
+        Args:
+            message (str): The message of the event.
+            level (int): The logging level of the event (default: logging.WARNING).
+        """
+
+    def _start(self):
+        pass
+
+    def _show(self, done):
+        pass
+
+    def _close(self):
+        pass
+
+
+class PrintProgressHook(ProgressHook):
+    """Progress hook printing the progress on a line overwritten at each shown update
+    and printing the events.
+    """
+
+    def _show(self, done):
+        print(f"{self.label}: {done} / {self.total}", end="\r")
+
+    def event(self, message, level=logging.WARNING):
+        print(message)
+
+
+class TqdmProgressHook(ProgressHook):
+    """Progress hook showing the progress in a tqdm progress bar
+    and writing the events through `tqdm.write`.
+
+    Args:
+        min_interval (float): The minimum time in seconds between two shown updates \
+        (default: global 'PROGRESS_MIN_INTERVAL').
+        tqdm_kwargs (dict): The keyword arguments passed to `tqdm.tqdm`.
+    """
+
+    def __init__(self, min_interval=bp_gg.PROGRESS_MIN_INTERVAL, **tqdm_kwargs):
+        super().__init__(min_interval)
+        self.tqdm_kwargs = tqdm_kwargs
+        self._bar = None
+
+    def _start(self):
+        self._bar = tqdm(total=self.total, desc=self.label.strip(), mininterval=self.min_interval,
+                         leave=False, **self.tqdm_kwargs)
+
+    def _show(self, done):
+        self._bar.update(done - self._bar.n)
+
+    def _close(self):
+        self._bar.close()
+        self._bar = None
+
+    def event(self, message, level=logging.WARNING):
+        tqdm.write(message)
+
+
+class LoggingProgressHook(ProgressHook):
+    """Progress hook logging the progress and the events through a logger.
+
+    Args:
+        min_interval (float): The minimum time in seconds between two logged updates \
+        (default: global 'PROGRESS_MIN_INTERVAL').
+        logger (logging.Logger): The logger (default: None for the "BiblioParsing" logger).
+        level (int): The logging level of the progress records (default: logging.INFO).
+    """
+
+    def __init__(self, min_interval=bp_gg.PROGRESS_MIN_INTERVAL, logger=None, level=logging.INFO):
+        super().__init__(min_interval)
+        self.logger = logger if logger is not None else logging.getLogger("BiblioParsing")
+        self.level = level
+
+    def _show(self, done):
+        self.logger.log(self.level, "%s: %d / %d", self.label.strip(), done, self.total)
+
+    def event(self, message, level=logging.WARNING):
+        self.logger.log(level, message.strip())
+
+
+PROGRESS_HOOKS = {'print'  : PrintProgressHook,
+                  'tqdm'   : TqdmProgressHook,
+                  'logging': LoggingProgressHook,
+                  'silent' : ProgressHook,
+                 }
+
+_DEFAULT_PROGRESS_HOOK = PrintProgressHook()
+
+
+def get_progress_hook(progress_hook=None):
+    """Gets a progress hook.
+
+    Args:
+        progress_hook (ProgressHook or str): The progress hook, the name of a progress hook class \
+        of the global 'PROGRESS_HOOKS' of this module or None for the default progress hook \
+        set by the `set_progress_hook` function (default: None).
+    Returns:
+        (ProgressHook): The progress hook.
+    """
+    if progress_hook is None:
+        return _DEFAULT_PROGRESS_HOOK
+    if isinstance(progress_hook, str):
+        if progress_hook not in PROGRESS_HOOKS:
+            raise KeyError(f'Progress hook "{progress_hook}" not available, '
+                           f'available hooks: {list(PROGRESS_HOOKS.keys())}')
+        return PROGRESS_HOOKS[progress_hook]()
+    return progress_hook
+
+
+def set_progress_hook(progress_hook='print', **hook_kwargs):
+    """Sets the default progress hook used by the long-running functions
+    when no progress hook is passed to them.
+
+    Args:
+        progress_hook (ProgressHook or str): The progress hook or the name of a progress hook class \
+        of the global 'PROGRESS_HOOKS' of this module (default: 'print').
+        hook_kwargs (dict): The keyword arguments passed to the progress hook class \
+        when 'progress_hook' is a name, such as 'min_interval'.
+    Returns:
+        (ProgressHook): The default progress hook.
+    """
+    global _DEFAULT_PROGRESS_HOOK
+    if isinstance(progress_hook, str):
+        if progress_hook not in PROGRESS_HOOKS:
+            raise KeyError(f'Progress hook "{progress_hook}" not available, '
+                           f'available hooks: {list(PROGRESS_HOOKS.keys())}')
+        progress_hook = PROGRESS_HOOKS[progress_hook](**hook_kwargs)
+    _DEFAULT_PROGRESS_HOOK = progress_hook
+    return progress_hook
@@ -23,6 +23,11 @@ from BiblioParsing.BiblioParsingInstitutions import build_norm_raw_affiliations_
 from BiblioParsing.BiblioParsingInstitutions import extend_author_institutions
 from BiblioParsing.BiblioParsingInstitutions import read_inst_types
 from BiblioParsing.BiblioParsingInstitutions import read_towns_per_country
+from BiblioParsing.BiblioParsingInstrumentation import end_stage
+from BiblioParsing.BiblioParsingInstrumentation import get_profile_path
+from BiblioParsing.BiblioParsingInstrumentation import init_stages_report
+from BiblioParsing.BiblioParsingInstrumentation import start_stage
+from BiblioParsing.BiblioParsingProgress import get_progress_hook
 from BiblioParsing.BiblioParsingUtils import build_item_df_from_tup
 from BiblioParsing.BiblioParsingUtils import build_pub_db_ids
 from BiblioParsing.BiblioParsingUtils import build_title_keywords
@@ -36,6 +41,7 @@ from BiblioParsing.BiblioParsingUtils import normalize_name
 from BiblioParsing.BiblioParsingUtils import remove_special_symbol
 from BiblioParsing.BiblioParsingUtils import set_unknown_address
 from BiblioParsing.BiblioParsingUtils import standardize_address
+from BiblioParsing.BiblioParsingUtils import standardize_address_variants
 from BiblioParsing.BiblioParsingUtils import standardize_str
 
 
@@ -133,11 +139,8 @@ def _get_author_affiliations_list(raw_author_affiliations_str, affiliations_list
 
     author_std_affiliations_list = []
     for raw_affiliation in affiliations_list:
-        std_affiliation = standardize_address(raw_affiliation,
-                                              add_unknown_country=False)
+        std_affiliation, full_std_affiliation = standardize_address_variants(raw_affiliation)
         if std_affiliation in author_affiliations_str:
-            full_std_affiliation = standardize_address(raw_affiliation,
-                                                       add_unknown_country=True)
             author_std_affiliations_list.append(full_std_affiliation)
     return author, author_std_affiliations_list, author_counter_params
 
@@ -276,7 +279,7 @@ def _build_keywords_scopus(corpus_df, fails_dic, cols_tup):
     return ak_keywords_df, ik_keywords_df, tk_keywords_df
 
 
-def _build_addresses_countries_institutions_scopus(corpus_df, fails_dic, cols_tup):
+def _build_addresses_countries_institutions_scopus(corpus_df, fails_dic, cols_tup, progress_hook=None):
     """Builds the data of addresses, countries and main affiliations 
     per publications of the corpus and updates the parsing success rate data.
 
@@ -317,6 +320,9 @@ def _build_addresses_countries_institutions_scopus(corpus_df, fails_dic, cols_tu
         fails_dic (dict): Parsing success rate data.
         cols_tup (tup): Columns information as built through \
         the `_set_scopus_parsing_cols` internal function.
+        progress_hook (ProgressHook or str): The progress hook reporting the progress and the events \
+        as got by the `get_progress_hook` function imported from `BiblioParsingProgress` module \
+        (default: None for the default progress hook).
     Returns:
         (tup): (The built addresses data (dataframe), tha built countries data (dataframe), \
         The built main affiliations data (dataframe)).
@@ -395,7 +401,7 @@ def _build_addresses_countries_institutions_scopus(corpus_df, fails_dic, cols_tu
     if not(len(address_df)==len(country_df)==len(institution_df)):
         warning = ('\nWARNING: Lengths of "address_df", "country_df" and "institution_df" dataframes are not equal '
                    'in "_build_addresses_countries_institutions_scopus" function of "BiblioParsingScopus.py" module')
-        print(warning)
+        get_progress_hook(progress_hook).event(warning)
     return address_df, country_df, institution_df
 
 
@@ -403,7 +409,8 @@ def _build_authors_countries_institutions_scopus(corpus_df, fails_dic, cols_tup,
                                                  country_affiliations_file_path=None,
                                                  inst_types_file_path=None,
                                                  country_towns_file=None,
-                                                 country_towns_folder_path=None):
+                                                 country_towns_folder_path=None,
+                                                 progress_hook=None):
     """Parses the fields 'Affiliations' and 'Authors with affiliations' of the corpus to build 
     the data of authors their addresses, country and normalized affiliations per publication of the corpus. 
 
@@ -474,6 +481,9 @@ def _build_authors_countries_institutions_scopus(corpus_df, fails_dic, cols_tup,
         country_towns_file (str): The name of the file of the data of towns per country, optional (default=None).
         country_towns_folder_path (path): The full path to the folder where the 'country_towns_file' file \
         is available, optional (default=None).
+        progress_hook (ProgressHook or str): The progress hook reporting the progress and the events \
+        as got by the `get_progress_hook` function imported from `BiblioParsingProgress` module \
+        (default: None for the default progress hook).
     Returns:
         (dataframe): The built data.
     Notes:
@@ -508,9 +518,10 @@ def _build_authors_countries_institutions_scopus(corpus_df, fails_dic, cols_tup,
     pub_nb = len(corpus_df[pub_id_col])
     pub_num = 0
     addr_country_inst_list = []
+    progress_hook = get_progress_hook(progress_hook).start("    Publications number", pub_nb)
     for pub_id, affiliations_str, authors_affiliations_str in corpus_series_zip:
         pub_num += 1
-        print("    Publications number:", pub_num, f"/ {pub_nb}", end="\r")
+        progress_hook.update(pub_num)
         # Initializing the authors' counter and the last-author name
         author_counter_params = [-1, '']
 
@@ -535,6 +546,8 @@ def _build_authors_countries_institutions_scopus(corpus_df, fails_dic, cols_tup,
                 addr_country_inst_list.append(addr_country_inst(pub_id, author_idx, author_std_affiliation, author_country,
                                                                 author_institutions_tup.norm_inst_list,
                                                                 author_institutions_tup.raw_inst_list,))
+    progress_hook.close()
+
     # Building a clean author-country-institutions data and accordingly updating the parsing success rate dict
     addr_country_inst_df, fails_dic = build_item_df_from_tup(addr_country_inst_list, auth_inst_cols_list[:-1],
                                                              norm_institution_col, pub_id_col, fails_dic)
@@ -886,6 +899,80 @@ def _build_articles_scopus(corpus_df, cols_tup):
     return articles_df
 
 
+def _parse_reference_scopus(field):
+    """Parses a Scopus cited reference in a single pass over the precompiled 
+    regular expressions of the reference items.
+
+    The new Scopus coding of the references (since 07-2023) is detected 
+    through the `RE_DETECT_SCOPUS_NEW` regular expression, otherwise the old 
+    coding is used. Each item is searched once through the `search` method 
+    of the compiled pattern which returns the first match as the `re.findall` 
+    function did previously.
+
+    Args:
+        field (str): The cited reference as given in the Scopus rawdata.
+    Returns:
+        (tup): (author (str), year (str), journal (str), volume (str), page (str)) \
+        with author set to the global PARTIAL if the author or the journal \
+        of the reference is unknown.
+    """
+    year = bp_rg.RE_REF_YEAR_SCOPUS.search(field)
+    year = year.group() if year else 0
+
+    if bp_rg.RE_DETECT_SCOPUS_NEW.search(field):
+        # Using new SCOPUS coding 2023
+        author = bp_rg.RE_REF_AUTHOR_SCOPUS_NEW.search(field)
+        author = normalize_name(author.group()) if author else bp_sg.UNKNOWN
+
+        page = bp_rg.RE_REF_PAGE_SCOPUS_NEW.search(field)
+        page = page.group().split('p.')[1] if page else 0
+
+        journal_vol = bp_rg.RE_REF_JOURNAL_SCOPUS_NEW.search(field)
+        if journal_vol:
+            journal_split = journal_vol.group().split(',')
+            journal = journal_split[0]
+            vol = journal_split[1]
+        else:
+            journal = bp_sg.UNKNOWN
+            vol = 0
+
+    else:
+        # Using old parsing
+        author = bp_rg.RE_REF_AUTHOR_SCOPUS.search(field)
+        author = normalize_name(author.group()) if author else bp_sg.UNKNOWN
+
+        proceeding = re.findall(bp_rg.RE_REF_PROC_SCOPUS, field)
+        if not proceeding:
+            journal = bp_rg.RE_REF_JOURNAL_SCOPUS.search(field)
+            if journal:
+                journal = journal.group()
+                if ',' in journal:
+                    journal = journal[6:-1]
+                else:
+                    journal = journal[6:]
+            else:
+                journal = bp_sg.UNKNOWN
+        else:
+            journal = proceeding
+
+        vol = bp_rg.RE_REF_VOL_SCOPUS.search(field)
+        if vol:
+            vol = vol.group()
+            if ',' in vol:
+                vol = re.search(r'\d{1,6}', vol).group()
+            else:
+                vol = vol.strip()
+        else:
+            vol = 0
+
+        page = bp_rg.RE_REF_PAGE_SCOPUS.search(field)
+        page = page.group().split('p.')[1] if page else 0
+
+    if author==bp_sg.UNKNOWN or journal==bp_sg.UNKNOWN:
+        author = bp_sg.PARTIAL
+    return (author, year, journal, vol, page)
+
+
 def _build_references_scopus(corpus_df, cols_tup):
     """Builds the data of cited references per publication of the corpus.
 
@@ -898,6 +985,12 @@ def _build_references_scopus(corpus_df, cols_tup):
             0    Nishinaka H  2020   Energy Fuels              31    10933
             0    Bellouard Q  2018   Int. J. Hydrog. Energy    44    19193
 
+    The cited references are parsed using the `_parse_reference_scopus` internal 
+    function, the parsing results being cached for the references cited 
+    by several publications.
+    As previously, only the last cited reference of the references field 
+    is kept per publication.
+
     Args:
         corpus_df (dataframe): The selected rawdata of the corpus.
         cols_tup (tup): Columns information as built through \
@@ -912,93 +1005,21 @@ def _build_references_scopus(corpus_df, cols_tup):
     pub_id_col = cols_dic['pub_id_col']
     scopus_ref_col = scopus_cols_dic['scopus_ref_col']
 
-    # Setting named tuple
-    article_ref = namedtuple('article_ref', ref_cols_list)
-
-    refs_list =[]
-    refs_dic = {}
+    parsed_refs_dict = {}
+    pub_ids_list, refs_list = [], []
     for pub_id, row in zip(list(corpus_df[pub_id_col]),
                                 corpus_df[scopus_ref_col]):
         if isinstance(row, str):
             # If the reference field is not empty and not an URL
-            for field in row.split(";"):
-                if bp_rg.RE_DETECT_SCOPUS_NEW.search(field):
-                    # Using new SCOPUS coding 2023
-                    year = re.findall(bp_rg.RE_REF_YEAR_SCOPUS, field)
-                    if len(year):
-                        year = year[0]
-                    else:
-                        year = 0
-
-                    author = re.findall(bp_rg.RE_REF_AUTHOR_SCOPUS_NEW, field)
-                    if len(author):
-                        author = normalize_name(author[0])
-                    else:
-                        author = bp_sg.UNKNOWN
-
-                    page = re.findall(bp_rg.RE_REF_PAGE_SCOPUS_NEW, field)
-                    if len(page) == 0:
-                        page = 0
-                    else:
-                        page = page[0].split('p.')[1]
-
-                    journal_vol =  re.findall(bp_rg.RE_REF_JOURNAL_SCOPUS_NEW , field)
-                    if journal_vol:
-                        journal_split = journal_vol[0].split(',')
-                        journal = journal_split[0]
-                        vol  = journal_split[1]
-                    else:
-                        journal = bp_sg.UNKNOWN
-                        vol = 0
-
-                else:
-                    # Using old parsing
-                    year = re.findall(bp_rg.RE_REF_YEAR_SCOPUS, field)
-                    if len(year):
-                        year = year[0]
-                    else:
-                        year = 0
-
-                    author = re.findall(bp_rg.RE_REF_AUTHOR_SCOPUS, field)
-                    if len(author):
-                        author = normalize_name(author[0])
-                    else:
-                        author = bp_sg.UNKNOWN
-
-                    proceeding = re.findall(bp_rg.RE_REF_PROC_SCOPUS, field)
-                    if not proceeding:
-                        journal = re.findall(bp_rg.RE_REF_JOURNAL_SCOPUS, field)
-                        if journal:
-                            if ',' in journal[0] :
-                                journal = journal[0][6:-1]
-                            else:
-                                journal = journal[0][6:]
-                        else:
-                            journal = bp_sg.UNKNOWN
-                    else:
-                        journal = proceeding
-
-                    vol = re.findall(bp_rg.RE_REF_VOL_SCOPUS, field)
-                    if len(vol):
-                        if ',' in vol[0]:
-                            vol = re.findall(r'\d{1,6}',vol[0])[0]
-                        else:
-                            vol = vol[0].strip()
-                    else:
-                        vol = 0
-
-                    page = re.findall(bp_rg.RE_REF_PAGE_SCOPUS, field)
-                    if len(page) == 0:
-                        page = 0
-                    else:
-                        page = page[0].split('p.')[1]
-
-            if author==bp_sg.UNKNOWN or journal==bp_sg.UNKNOWN:
-                author = bp_sg.PARTIAL 
-            refs_list.append(article_ref(pub_id, author, year, journal, vol, page))
+            field = row.rsplit(";", 1)[-1]
+            if field not in parsed_refs_dict:
+                parsed_refs_dict[field] = _parse_reference_scopus(field)
+            pub_ids_list.append(pub_id)
+            refs_list.append(parsed_refs_dict[field])
 
     references_df = pd.DataFrame.from_dict({label:[s[idx] for s in refs_list]
-                                            for idx, label in enumerate(ref_cols_list)})
+                                            for idx, label in enumerate(ref_cols_list[1:])})
+    references_df.insert(0, ref_cols_list[0], pub_ids_list)
     return references_df
 
 
@@ -1007,6 +1028,9 @@ def _check_authors_with_affiliations(corpus_df, check_cols, verbose=False):
     when irregular sequence of separators induces a discrepancy between number 
     of authors and number of authors-with-affiliations.
 
+    The corrected values are computed over the plain lists of the column values 
+    and the corrected columns are assigned once to the returned data.
+
     Args:
         corpus_df (dataframe): The full rawdata of the corpus.
         check_cols (list): The column names where the authors \
@@ -1017,28 +1041,31 @@ def _check_authors_with_affiliations(corpus_df, check_cols, verbose=False):
         (tup): (The corrected full rawdata of the corpus (dataframe), \
         The data (dataframe) of corrected affiliations).
     """
+    # Internal functions
+    def _correct_affil_list(init_affil_list):
+        correct_affil_list = []
+        for affil in init_affil_list:
+            new_affil = ", ".join(affil.split(";, "))
+            new_affil = ", ".join(new_affil.split(";"))
+            correct_affil_list.append(new_affil)
+        return correct_affil_list
+
     pub_id_col, authors_col, affil_col, auth_affil_col = check_cols
-    corrected_addresses_data = []
-    corrected_corpus_df = corpus_df.copy()
-    for row_idx, row in corpus_df.iterrows():
-        pub_id = row[pub_id_col]
-        init_authors_str = row[authors_col]
-        init_affil_str = row[affil_col]
-        init_auth_affil_str = row[auth_affil_col]
+    std_sep, check_sep = "; ", ";"
+    auth_false_sep, auth_correct_sep = ";", ""
 
-        std_sep = "; "
+    corrected_addresses_data = []
+    correct_authors_col_list, correct_affil_col_list, correct_auth_affil_col_list = [], [], []
+    corpus_series_zip = zip(corpus_df[pub_id_col], corpus_df[authors_col],
+                            corpus_df[affil_col], corpus_df[auth_affil_col])
+    for pub_id, init_authors_str, init_affil_str, init_auth_affil_str in corpus_series_zip:
         authors_list = init_authors_str.split(std_sep)
-        affil_list = init_affil_str.split(std_sep)
-        auth_affil_list = init_auth_affil_str.split(std_sep)
-
-        check_sep = ";"
         check_auth_affil_list = init_auth_affil_str.split(check_sep)
 
-        authors_nb = len(authors_list)
-        auth_affil_nb = len(check_auth_affil_list)
-        if authors_nb!=auth_affil_nb:
+        if len(authors_list)!=len(check_auth_affil_list):
+            affil_list = init_affil_str.split(std_sep)
+            auth_affil_list = init_auth_affil_str.split(std_sep)
             authors_status, affil_status, auth_affil_status = 0, 0, 0
-            auth_false_sep, auth_correct_sep= ";", ""
             if any(auth_false_sep in s for s in authors_list):
                 correct_authors_list = [x.replace(auth_false_sep, auth_correct_sep) for x in authors_list]
                 new_auth_affil_list = [x.replace(auth_false_sep, auth_correct_sep) for x in auth_affil_list]
@@ -1047,22 +1074,14 @@ def _check_authors_with_affiliations(corpus_df, check_cols, verbose=False):
                 correct_authors_list = authors_list
                 new_auth_affil_list = auth_affil_list
 
-            if any(re.search(bp_rg.RE_AWA, s) for s in affil_list):
-                correct_affil_list = []
-                for affil in affil_list:
-                    new_affil = ", ".join(affil.split(";, "))
-                    new_affil = ", ".join(new_affil.split(";"))
-                    correct_affil_list.append(new_affil)
+            if any(bp_rg.RE_AWA.search(s) for s in affil_list):
+                correct_affil_list = _correct_affil_list(affil_list)
                 affil_status = 1
             else:
                 correct_affil_list = affil_list
 
-            if any(re.search(bp_rg.RE_AWA, s) for s in new_auth_affil_list):
-                correct_auth_affil_list = []
-                for auth_affil in new_auth_affil_list:
-                    new_auth_affil = ", ".join(auth_affil.split(";, "))
-                    new_auth_affil = ", ".join(new_auth_affil.split(";"))
-                    correct_auth_affil_list.append(new_auth_affil)
+            if any(bp_rg.RE_AWA.search(s) for s in new_auth_affil_list):
+                correct_auth_affil_list = _correct_affil_list(new_auth_affil_list)
                 auth_affil_status = 1
             else:
                 correct_auth_affil_list = new_auth_affil_list
@@ -1079,10 +1098,15 @@ def _check_authors_with_affiliations(corpus_df, check_cols, verbose=False):
             correct_affil_str = init_affil_str
             correct_auth_affil_str = init_auth_affil_str
 
-        # Updating corpus data
-        corrected_corpus_df.loc[row_idx, authors_col] = correct_authors_str
-        corrected_corpus_df.loc[row_idx, affil_col] = correct_affil_str
-        corrected_corpus_df.loc[row_idx, auth_affil_col] = correct_auth_affil_str
+        correct_authors_col_list.append(correct_authors_str)
+        correct_affil_col_list.append(correct_affil_str)
+        correct_auth_affil_col_list.append(correct_auth_affil_str)
+
+    # Updating corpus data with the corrected columns
+    corrected_corpus_df = corpus_df.copy()
+    corrected_corpus_df[authors_col] = correct_authors_col_list
+    corrected_corpus_df[affil_col] = correct_affil_col_list
+    corrected_corpus_df[auth_affil_col] = correct_auth_affil_col_list
 
     correction_cols = [pub_id_col, "Authors status", "Affiliations status", "Auth with affil status",
                        authors_col, "Corrected " + authors_col,
@@ -1151,15 +1175,15 @@ def _check_authors(corpus_df, check_cols, verbose=False):
     """
     pub_id_col, authors_col, fullname_col, affil_col, auth_affil_col = check_cols
     corrected_authors_data = []
-    new_corpus_df = corpus_df.copy()
-    for row_idx, row in corpus_df.iterrows():
-        pub_id = row[pub_id_col]
-
+    new_authors_col_list, new_affil_col_list, new_auth_affil_col_list = [], [], []
+    corpus_series_zip = zip(corpus_df[pub_id_col], corpus_df[authors_col], corpus_df[fullname_col],
+                            corpus_df[affil_col], corpus_df[auth_affil_col])
+    for pub_id, init_authors_str, init_fullnames_str, init_affil_str, init_auth_affil_str in corpus_series_zip:
         # Removing accentuated characters
-        authors_str = remove_special_symbol(row[authors_col])
-        fullnames_str = remove_special_symbol(row[fullname_col])
-        auth_affil_str = standardize_str(row[auth_affil_col])
-        aff_str = standardize_str(row[affil_col])
+        authors_str = remove_special_symbol(init_authors_str)
+        fullnames_str = remove_special_symbol(init_fullnames_str)
+        auth_affil_str = standardize_str(init_auth_affil_str)
+        aff_str = standardize_str(init_affil_str)
 
         # Building dict keyyed by author and valued by a tuple
         # composed of fullname and author-with-affiliations
@@ -1179,10 +1203,16 @@ def _check_authors(corpus_df, check_cols, verbose=False):
             new_authors_list.append(new_author)
             new_auth_affils_list.append(new_auth_affil)
 
-        # Updating the corpus data with the corrected lists
-        new_corpus_df.loc[row_idx, authors_col] = "; ".join(new_authors_list)
-        new_corpus_df.loc[row_idx, auth_affil_col] = "; ".join(new_auth_affils_list)
-        new_corpus_df.loc[row_idx, affil_col] = aff_str
+        new_authors_col_list.append("; ".join(new_authors_list))
+        new_auth_affil_col_list.append("; ".join(new_auth_affils_list))
+        new_affil_col_list.append(aff_str)
+
+    # Updating the corpus data with the corrected columns
+    new_corpus_df = corpus_df.copy()
+    new_corpus_df[authors_col] = new_authors_col_list
+    new_corpus_df[auth_affil_col] = new_auth_affil_col_list
+    new_corpus_df[affil_col] = new_affil_col_list
+
     correction_cols = [pub_id_col, authors_col, "Corrected " + authors_col]
     corrected_authors_df = pd.DataFrame(corrected_authors_data, columns=correction_cols)
     return new_corpus_df, corrected_authors_df
@@ -1254,7 +1284,7 @@ def _check_affiliation_column_scopus(df, scopus_aff_col):
                            f'has been droped from the list of affiliations. '
                            f'\nTherefore, attention should be given to the resulting list of affiliations '
                            f'for each of the authors of this publication.\n' )
-                print(warning)
+                get_progress_hook().event(warning)
         if  valid_affiliation_list:
             return '; '.join(valid_affiliation_list)
         else:
@@ -1338,7 +1368,8 @@ def read_database_scopus(rawdata_path, correct_data=False, scopus_ids=False):
 
 def biblio_parser_scopus(rawdata_path, inst_filter_list=None, country_affiliations_file_path=None,
                          inst_types_file_path=None, country_towns_file=None,
-                         country_towns_folder_path=None):
+                         country_towns_folder_path=None, report=None, progress_hook=None,
+                         profile=None):
     """Builds parsing data from the corpus rawdata.
 
     The list of the parsed items (keys of the returned dict which values are the dataframes \
@@ -1370,10 +1401,22 @@ def biblio_parser_scopus(rawdata_path, inst_filter_list=None, country_affiliatio
         country_towns_file (str): The name of the file of the data of towns per country, optional (default=None).
         country_towns_folder_path (path): The full path to the folder where the 'country_towns_file' file \
         is available, optional (default=None).
+        report (dict): The dict filled in place with the stages report recording the wall time, \
+        the CPU time, the peak-RSS increase and the rows numbers of each parsing stage \
+        through the `start_stage` and `end_stage` functions imported from `BiblioParsingInstrumentation` \
+        module (default: None for no stages report).
+        progress_hook (ProgressHook or str): The progress hook reporting the progress and the events \
+        of the parsing as got by the `get_progress_hook` function imported from `BiblioParsingProgress` \
+        module (default: None for the default progress hook).
+        profile (path or bool): The full path to the folder where the profile of each parsing stage \
+        is saved and its top hotspots are printed through the `start_stage` and `end_stage` \
+        functions imported from `BiblioParsingInstrumentation` module, as got by the `get_profile_path` \
+        function of the same module (default: None for the folder set by the environment variable \
+        given by the global 'PROFILE_ENV_VAR' if any).
     Returns:
         (tup): (The parsed data (dataframes) as values of a dict keyed by parsing items, \
         The parsing success rate data (dict), The data (dataframe) of the corrected author names, \
-        The data (dataframe) of the corrected addresses, The data (dataframe) of Scopus IDs of publications.
+        The data (dataframe) of the corrected addresses, The data (dataframe) of Scopus IDs of publications).
     """
     # Internal functions
     def _keeping_item_parsing_results(item, item_df):
@@ -1393,9 +1436,19 @@ def biblio_parser_scopus(rawdata_path, inst_filter_list=None, country_affiliatio
     path_scopus_cat_codes = Path(__file__).parent / Path(bp_gg.REP_UTILS) / Path(bp_sg.SCOPUS_CAT_CODES)
     path_scopus_journals_issn_cat = Path(__file__).parent / Path(bp_gg.REP_UTILS) / Path(bp_sg.SCOPUS_JOURNALS_ISSN_CAT)
 
+    # Initializing the stages report of the parsing
+    profile_path = get_profile_path(profile)
+    stages_report = (init_stages_report(f"{bp_sg.SCOPUS} parsing", profile_path, stages_report=report)
+                     if report is not None or profile_path else None)
+
+    # Setting the progress hook of the parsing
+    progress_hook = get_progress_hook(progress_hook)
+
     # Reading and checking the corpus file
+    stage = start_stage(stages_report, "reading")
     raw_data_return_tup = read_database_scopus(rawdata_path, correct_data=True, scopus_ids=True)
     corpus_df, corrected_authors_df, corrected_addresses_df, scopus_ids_df = raw_data_return_tup
+    end_stage(stage, rows_dict={'rawdata': len(corpus_df) if corpus_df is not None else 0})
 
     # Initializing the scopus_fails_dic dict for the parsing control
     scopus_fails_dic = {}
@@ -1409,67 +1462,85 @@ def biblio_parser_scopus(rawdata_path, inst_filter_list=None, country_affiliatio
         if len(corpus_df):
             # Building the dataframe of articles
             print(f"  - {articles_item} parsing...", end="\r")
+            stage = start_stage(stages_report, "parsing", [articles_item])
             articles_df = _build_articles_scopus(corpus_df, cols_tup)
             _keeping_item_parsing_results(articles_item, articles_df)
+            end_stage(stage, scopus_parsing_dict)
             print(f"  - {articles_item} parsed    ")
 
             # Building the dataframe of authors
             print(f"  - {authors_item} parsing...", end="\r")
+            stage = start_stage(stages_report, "parsing", [authors_item])
             authors_df = _build_authors_scopus(corpus_df, scopus_fails_dic, cols_tup)
             _keeping_item_parsing_results(authors_item, authors_df)
+            end_stage(stage, scopus_parsing_dict)
             print(f"  - {authors_item} parsed    ")
 
             # Building the dataframe of addresses, countries and institutions
             print(f"  - {addresses_item}, {countries_item} and {institutions_item} parsing...", end="\r")
-            addresses_tup = _build_addresses_countries_institutions_scopus(corpus_df, scopus_fails_dic, cols_tup)
+            stage = start_stage(stages_report, "parsing", [addresses_item, countries_item, institutions_item])
+            addresses_tup = _build_addresses_countries_institutions_scopus(corpus_df, scopus_fails_dic, cols_tup,
+                                                                           progress_hook=progress_hook)
             addresses_df, countries_df, institutions_df = addresses_tup
             _keeping_item_parsing_results(addresses_item, addresses_df)
             _keeping_item_parsing_results(countries_item, countries_df)
             _keeping_item_parsing_results(institutions_item, institutions_df)
+            end_stage(stage, scopus_parsing_dict)
             print(f"  - {addresses_item}, {countries_item} and {institutions_item} parsed    ")
 
             # Building the dataframe of authors and their institutions
             print(f"  - {auth_inst_item} parsing...")
+            stage = start_stage(stages_report, "parsing", [auth_inst_item])
             auth_inst_df = _build_authors_countries_institutions_scopus(corpus_df, scopus_fails_dic, cols_tup,
                                                                         inst_filter_list=inst_filter_list ,
                                                                         country_affiliations_file_path=country_affiliations_file_path,
                                                                         inst_types_file_path=inst_types_file_path,
                                                                         country_towns_file=country_towns_file,
-                                                                        country_towns_folder_path=country_towns_folder_path)
+                                                                        country_towns_folder_path=country_towns_folder_path,
+                                                                        progress_hook=progress_hook)
             _keeping_item_parsing_results(auth_inst_item, auth_inst_df)
+            end_stage(stage, scopus_parsing_dict)
             print(f"  - {auth_inst_item} parsed                     ")
 
             # Building the dataframes of keywords
             print(f"  - {authors_kw_item}, {index_kw_item} and {title_kw_item} parsing...", end="\r")
+            stage = start_stage(stages_report, "parsing", [authors_kw_item, index_kw_item, title_kw_item])
             keywords_tup = _build_keywords_scopus(corpus_df, scopus_fails_dic, cols_tup)
             AK_keywords_df, IK_keywords_df, TK_keywords_df = keywords_tup
             _keeping_item_parsing_results(authors_kw_item, AK_keywords_df)
             _keeping_item_parsing_results(index_kw_item, IK_keywords_df)
             _keeping_item_parsing_results(title_kw_item, TK_keywords_df)
+            end_stage(stage, scopus_parsing_dict)
             print(f"  - {authors_kw_item}, {index_kw_item} and {title_kw_item} parsed    ")
 
             # Building the dataframe of subjects
             print(f"  - {subjects_item} parsing...", end="\r")
+            stage = start_stage(stages_report, "parsing", [subjects_item])
             subjects_df = _build_subjects_scopus(corpus_df,
                                                  path_scopus_cat_codes,
                                                  path_scopus_journals_issn_cat,
                                                  scopus_fails_dic, cols_tup)
             _keeping_item_parsing_results(subjects_item, subjects_df)
+            end_stage(stage, scopus_parsing_dict)
             print(f"  - {subjects_item} parsed    ")
 
             # Building the dataframe of sub-subjects
             print(f"  - {sub_subjects_item} parsing...", end="\r")
+            stage = start_stage(stages_report, "parsing", [sub_subjects_item])
             sub_subjects_df = _build_sub_subjects_scopus(corpus_df,
                                                          path_scopus_cat_codes,
                                                          path_scopus_journals_issn_cat,
                                                          scopus_fails_dic, cols_tup)
             _keeping_item_parsing_results(sub_subjects_item, sub_subjects_df)
+            end_stage(stage, scopus_parsing_dict)
             print(f"  - {sub_subjects_item} parsed    ")
 
             # Building the dataframe of references
             print(f"  - {references_item} parsing...", end="\r")
+            stage = start_stage(stages_report, "parsing", [references_item])
             references_df = _build_references_scopus(corpus_df, cols_tup)
             _keeping_item_parsing_results(references_item, references_df)
+            end_stage(stage, scopus_parsing_dict)
             print(f"  - {references_item} parsed    ")
 
         else:
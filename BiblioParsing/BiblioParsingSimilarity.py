@@ -0,0 +1,226 @@
+"""The BiblioParsingSimilarity module defines the registry of the similarity scorers
+used to compare journal names and publication titles in the deduplication process.
+"""
+
+__all__ = ['SIMILARITY_SCORERS',
+           'calibrate_similarity_threshold',
+           'get_similarity_scorer',
+           'lcs_batch_ratio',
+           'lcs_ratio',
+           'register_similarity_scorer',
+           ]
+
+
+# Standard library imports
+from collections import namedtuple
+from difflib import SequenceMatcher
+
+# 3rd party imports
+import numpy as np
+
+# Local library imports
+import BiblioParsing.BiblioSpecificGlobals as bp_sg
+
+
+# Setting the named tuple of a similarity scorer
+similarity_scorer = namedtuple('similarity_scorer', ['name', 'ratio', 'batch_ratio', 'threshold'])
+
+# Minimum number of compared strings for using the vectorized computation
+_LCS_BATCH_MIN_SIZE = 8
+
+
+def _difflib_ratio(a, b):
+    """Computes the similarity ratio of two strings through `difflib.SequenceMatcher`.
+
+    Args:
+        a (str): The first string.
+        b (str): The second string.
+    Returns:
+        (float): The similarity ratio.
+    """
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _difflib_batch_ratio(a, b_list):
+    """Computes the similarity ratios of a string to a list of strings
+    through `difflib.SequenceMatcher`.
+
+    The ratios are the ones of `_difflib_ratio(a, b)` for exact backward compatibility.
+
+    Args:
+        a (str): The string to compare.
+        b_list (list): The strings (str) to which 'a' is compared.
+    Returns:
+        (numpy.ndarray): The similarity ratios.
+    """
+    return np.array([_difflib_ratio(a, b) for b in b_list], dtype=float)
+
+
+def _lcs_length(a, b):
+    """Computes the length of the longest common subsequence of two strings
+    through the bit-parallel algorithm of Hyyrö.
+
+    Args:
+        a (str): The first string.
+        b (str): The second string.
+    Returns:
+        (int): The length of the longest common subsequence.
+    """
+    if not a or not b:
+        return 0
+    chars_mask_dict = {}
+    for char_idx, char in enumerate(a):
+        chars_mask_dict[char] = chars_mask_dict.get(char, 0) | (1 << char_idx)
+    full_mask = (1 << len(a)) - 1
+    v_mask = full_mask
+    for char in b:
+        u_mask = v_mask & chars_mask_dict.get(char, 0)
+        v_mask = ((v_mask + u_mask) | (v_mask - u_mask)) & full_mask
+    return len(a) - bin(v_mask).count("1")
+
+
+def lcs_ratio(a, b):
+    """Computes the similarity ratio of two strings as twice the length of their
+    longest common subsequence divided by the sum of their lengths.
+
+    This ratio is the normalized indel similarity, that is the Levenshtein similarity
+    with a substitution cost of 2. It is greater or equal to the ratio
+    of `difflib.SequenceMatcher`.
+
+    Args:
+        a (str): The first string.
+        b (str): The second string.
+    Returns:
+        (float): The similarity ratio.
+    """
+    lengths_sum = len(a) + len(b)
+    if not lengths_sum:
+        return 1.0
+    return 2.0 * _lcs_length(a, b) / lengths_sum
+
+
+def lcs_batch_ratio(a, b_list):
+    """Computes the similarity ratios of the `lcs_ratio` function of a string
+    to a list of strings at once.
+
+    The bit-parallel algorithm of Hyyrö is vectorized over the compared strings
+    using NumPy arrays of 64-bit words for the bit vectors of 'a'.
+    Below a number of compared strings given by '_LCS_BATCH_MIN_SIZE',
+    the ratios are computed one by one.
+
+    Args:
+        a (str): The string to compare.
+        b_list (list): The strings (str) to which 'a' is compared.
+    Returns:
+        (numpy.ndarray): The similarity ratios.
+    """
+    b_nb = len(b_list)
+    if b_nb<_LCS_BATCH_MIN_SIZE or not a:
+        return np.array([lcs_ratio(a, b) for b in b_list], dtype=float)
+
+    # Setting the match masks of the characters of 'a' as arrays of 64-bit words
+    a_length = len(a)
+    words_nb = (a_length + 63) // 64
+    chars_code_dict = {char: code for code, char in enumerate(dict.fromkeys(a), start=1)}
+    chars_mask_array = np.zeros((len(chars_code_dict) + 1, words_nb), dtype=np.uint64)
+    for char_idx, char in enumerate(a):
+        chars_mask_array[chars_code_dict[char], char_idx // 64] |= np.uint64(1 << (char_idx % 64))
+    last_word_mask = np.uint64((1 << (a_length - 64 * (words_nb - 1))) - 1)
+
+    # Coding the compared strings, the code 0 being used for absent characters and padding
+    b_lengths_array = np.array([len(b) for b in b_list])
+    b_codes_array = np.zeros((b_nb, max(1, b_lengths_array.max())), dtype=np.int32)
+    for b_idx, b in enumerate(b_list):
+        b_codes_array[b_idx, :len(b)] = [chars_code_dict.get(char, 0) for char in b]
+
+    v_array = np.full((b_nb, words_nb), np.iinfo(np.uint64).max, dtype=np.uint64)
+    v_array[:, -1] &= last_word_mask
+    sum_array = np.empty_like(v_array)
+    for b_codes in b_codes_array.T:
+        u_array = v_array & chars_mask_array[b_codes]
+        # Multiword addition of v_array and u_array with carry propagation
+        carry = np.zeros(b_nb, dtype=np.uint64)
+        for word_idx in range(words_nb):
+            word_sum = v_array[:, word_idx] + u_array[:, word_idx]
+            first_carry = word_sum<v_array[:, word_idx]
+            word_sum_carry = word_sum + carry
+            carry = (first_carry | (word_sum_carry<word_sum)).astype(np.uint64)
+            sum_array[:, word_idx] = word_sum_carry
+        # u_array bits being a subset of v_array bits, v_array - u_array is v_array ^ u_array
+        v_array = sum_array | (v_array ^ u_array)
+        v_array[:, -1] &= last_word_mask
+
+    ones_nb_array = np.unpackbits(v_array.view(np.uint8), axis=1).sum(axis=1)
+    lcs_lengths_array = a_length - ones_nb_array
+    return 2.0 * lcs_lengths_array / (a_length + b_lengths_array)
+
+
+SIMILARITY_SCORERS = {}
+
+
+def register_similarity_scorer(name, ratio, batch_ratio=None, threshold=bp_sg.SIMILARITY_THRESHOLD):
+    """Registers a similarity scorer in the global 'SIMILARITY_SCORERS' of this module.
+
+    Args:
+        name (str): The name of the scorer.
+        ratio (function): The function computing the similarity ratio (float) of two strings.
+        batch_ratio (function): The function computing the similarity ratios (numpy.ndarray) \
+        of a string to a list of strings (default: None for using 'ratio' for each string).
+        threshold (int): The similarity threshold in percent of the scorer \
+        (default: global 'SIMILARITY_THRESHOLD').
+    Returns:
+        (namedtuple): The registered scorer.
+    """
+    if batch_ratio is None:
+        batch_ratio = lambda a, b_list: np.array([ratio(a, b) for b in b_list], dtype=float)
+    scorer = similarity_scorer(name, ratio, batch_ratio, threshold)
+    SIMILARITY_SCORERS[name] = scorer
+    return scorer
+
+
+def get_similarity_scorer(name):
+    """Gets a similarity scorer registered in the global 'SIMILARITY_SCORERS' of this module.
+
+    Args:
+        name (str): The name of the scorer.
+    Returns:
+        (namedtuple): The scorer with the fields 'name', 'ratio', 'batch_ratio' and 'threshold'.
+    """
+    if name not in SIMILARITY_SCORERS:
+        raise KeyError(f'Similarity scorer "{name}" not registered, '
+                       f'available scorers: {list(SIMILARITY_SCORERS.keys())}')
+    return SIMILARITY_SCORERS[name]
+
+
+def calibrate_similarity_threshold(scorer_name, pairs_list, reference_name='difflib',
+                                   thresholds_list=None):
+    """Calibrates the similarity threshold of a scorer so that its decisions best
+    match the ones of a reference scorer on a list of strings pairs.
+
+    A pair is considered similar by a scorer if its rounded ratio in percent
+    is greater than the threshold of the scorer.
+
+    Args:
+        scorer_name (str): The name of the scorer to calibrate.
+        pairs_list (list): The pairs (tup) of strings to compare.
+        reference_name (str): The name of the reference scorer (default: 'difflib').
+        thresholds_list (list): The tested thresholds (int) (default: None for 50 to 99).
+    Returns:
+        (tup): (The best threshold (int), The rate of same decisions (float)).
+    """
+    if thresholds_list is None:
+        thresholds_list = list(range(50, 100))
+    reference = get_similarity_scorer(reference_name)
+    scorer = get_similarity_scorer(scorer_name)
+    reference_decisions = np.array([round(reference.ratio(a, b) * 100)>reference.threshold
+                                    for a, b in pairs_list])
+    scores_array = np.array([round(scorer.ratio(a, b) * 100) for a, b in pairs_list])
+    agreements_list = [(np.mean((scores_array>threshold)==reference_decisions), threshold)
+                       for threshold in thresholds_list]
+    best_agreement, best_threshold = max(agreements_list, key=lambda x: (x[0], -x[1]))
+    return best_threshold, float(best_agreement)
+
+
+register_similarity_scorer('difflib', _difflib_ratio, batch_ratio=_difflib_batch_ratio)
+register_similarity_scorer('lcs', lcs_ratio, batch_ratio=lcs_batch_ratio,
+                           threshold=bp_sg.LCS_SIMILARITY_THRESHOLD)
@@ -4,16 +4,24 @@ __all__ = ['build_item_df_from_tup',
            'check_and_drop_columns',
            'check_and_get_rawdata_file_path',
            'clean_authors_countries_institutions',
+           'compact_item_df',
+           'compact_parsing_dict',
            'dict_print',
            'drop_rawdata',
+           'expand_item_df',
+           'normalize_countries',
            'normalize_country',
            'normalize_journal_names',
            'normalize_name',
            'rationalize_town_names',
            'remove_special_symbol',
+           'set_norm_name_cache_size',
            'set_rawdata_error',
+           'set_std_address_cache_size',
            'set_unknown_address',
            'standardize_address',
+           'standardize_address_variants',
+           'standardize_addresses',
            'standardize_str',
            'upgrade_col_names',
            ]
@@ -140,16 +148,16 @@ def clean_authors_countries_institutions(auth_addr_country_inst_df):
         for author_id, author_dg in pub_id_dg.groupby(author_col):
             new_author_dg = author_dg.copy()
             if len(author_dg)>1:
-                country_list = list(set(author_dg[country_col].to_list()))
+                country_list = sorted(set(author_dg[country_col].to_list()))
                 new_author_dg[country_col] = "; ".join(country_list)
 
                 address_list = author_dg[address_col].to_list()
                 new_author_dg[address_col] = "; ".join(address_list)
 
-                norm_aff_list = list(set(author_dg[norm_aff_col].to_list()) - {bp_sg.EMPTY})
+                norm_aff_list = sorted(set(author_dg[norm_aff_col].to_list()) - {bp_sg.EMPTY})
                 new_author_dg[norm_aff_col] = "; ".join(norm_aff_list)
 
-                raw_aff_list = list(set(author_dg[raw_aff_col].to_list()) - {bp_sg.EMPTY})
+                raw_aff_list = sorted(set(author_dg[raw_aff_col].to_list()) - {bp_sg.EMPTY})
                 new_author_dg[raw_aff_col] = "; ".join(raw_aff_list)
 
                 new_author_dg.drop_duplicates(subset=[pub_id_col, author_col], inplace=True)
@@ -235,56 +243,58 @@ def build_title_keywords(df):
     return (df, bag_of_words_occurrences)
 
 
+@functools.lru_cache(maxsize=2**14)
+def _normalize_unlisted_country(country):
+    """Normalizes the country name not listed in the global 'COUNTRIES_ALIAS' 
+    using substring rules.
+
+    Returns:
+        (str): The normalized country name or the global 'UNKNOWN_COUNTRY'.
+    """
+    if 'Netherlands' in country:
+        return 'Netherlands'
+    if "USA" in country:
+        return 'United States'
+    if ('china' in country) or ('China' in country):
+        return 'China'
+    return bp_sg.UNKNOWN_COUNTRY
+
+
 def normalize_country(country):
     """Normalizes the country name for coherence seeking between 
     wos and scopus corpuses.
+
+    The country name is first searched in the global 'COUNTRIES_ALIAS' 
+    of normalized names keyed by the countries and their aliases.
+    On a miss, the substring rules are applied and their results cached.
     """
-    country_clean = country
-    if country not in bp_gg.COUNTRIES:
-        if country in  bp_gg.ALIAS_UK:
-            country_clean = 'United Kingdom'
-        elif 'Netherlands' in country:
-            country_clean = 'Netherlands'
-        elif country in bp_gg.ALIAS_USA or "USA" in country:
-            country_clean = 'United States'
-        elif ('china' in country) or ('China' in country):
-            country_clean = 'China'
-        elif country=='Russia':
-            country_clean = 'Russian Federation'
-        elif country=='U Arab Emirates':
-            country_clean = 'United Arab Emirates'
-        elif country=='Vietnam':
-            country_clean = 'Viet Nam'
-        elif country=='Palestine':
-            country_clean = 'Palestinian Territory'
-        elif country in bp_gg.ALIAS_FR:
-            country_clean = 'France'
-        elif country in bp_gg.ALIAS_BLR:
-            country_clean = 'Belarus'
-        elif country in bp_gg.ALIAS_TUR:
-            country_clean = 'Turkey'
-        else:
-            country_clean = bp_sg.UNKNOWN_COUNTRY
+    country_clean = bp_gg.COUNTRIES_ALIAS.get(country)
+    if country_clean is None:
+        country_clean = _normalize_unlisted_country(country)
     return country_clean
 
 
-def normalize_name(text, drop_ponct=True, lastname_only=False, firstname_only=False):
-    """Normalizes the author name spelling according the three debatable rules:
-            - replacing none ascii letters by ascii ones,
-            - capitalizing first name,
-            - capitalizing surnames,
-            - removing comma and dot.
-       It uses the internal funtion `remove_special_symbol`of the same module.
-       ex: normalize_name(" GrÔŁ-biçà-vèLU D'aillön, E-kj. ")
-        >>> "Grol-Bica-Velu D'Aillon E-KJ".
+def normalize_countries(countries):
+    """Normalizes a series of country names using the `normalize_country` 
+    function of the same module.
+
+    Each distinct country name is normalized once and the normalized names 
+    are mapped back to the series.
 
     Args:
-        text (str): The name to normalize.
-    Returns
-        (str) : The normalized text.
-    Notes:
-        The globals 'DASHES_CHANGE', 'LANG_CHAR_CHANGE' and 'PONCT_CHANGE'
-        from `BiblioGeneralGlobals` module are used.
+        countries (pandas.Series): The country names to be normalized.
+    Returns:
+        (pandas.Series): The normalized country names with the index of 'countries'.
+    """
+    norm_countries_dict = {country: normalize_country(country)
+                           for country in pd.unique(countries)}
+    return countries.map(norm_countries_dict)
+
+
+def _normalize_name(text, drop_ponct, lastname_only, firstname_only):
+    """Normalizes the author name spelling as described in the `normalize_name` function.
+
+    The regular expressions used are precompiled in the `BiblioRegexpGlobals` module.
     """
     if "." not in text:
         text_split = text.split(" ")
@@ -300,49 +310,83 @@ def normalize_name(text, drop_ponct=True, lastname_only=False, firstname_only=Fa
     text = remove_special_symbol(text, only_ascii=True, strip=True)
 
     # capturing "cCc-cC-ccc-CCc"
-    re_minus = re.compile('(-[a-zA-Z]+)')       # Captures: "cCc-cC-ccc-CCc"
-    for text_minus_texts in re.findall(re_minus, text):
+    for text_minus_texts in bp_rg.RE_NAME_MINUS_START.findall(text):
         text = text.replace(text_minus_texts, '-' + text_minus_texts[1:].capitalize())
 
     # capturing "cCc'cC'ccc'cc'CCc"
-    re_apostrophe = re.compile("('[a-zA-Z]+)")
-    for text_minus_texts in re.findall(re_apostrophe, text):
+    for text_minus_texts in bp_rg.RE_NAME_APOSTROPHE_START.findall(text):
         text = text.replace(text_minus_texts, "'" + text_minus_texts[1:].capitalize())
 
     # capturing "cCc-"
-    re_minus = re.compile('([a-zA-Z]+-)')
-    for text_minus_texts in re.findall(re_minus, text):
+    for text_minus_texts in bp_rg.RE_NAME_MINUS_END.findall(text):
         text = text.replace(text_minus_texts, text_minus_texts[:-1].capitalize() + '-')
 
     # capturing "cCc'"
-    re_apostrophe = re.compile("([a-zA-Z]+')")
-    for text_minus_texts in re.findall(re_apostrophe, text):
+    for text_minus_texts in bp_rg.RE_NAME_APOSTROPHE_END.findall(text):
         text = text.replace(text_minus_texts, text_minus_texts[:-1].capitalize() + "'")
 
     # capturing "cCccC "
-    re_surname = re.compile("[a-zA-Z]+\s")
-    for text_minus_texts in re.findall(re_surname, text):
+    for text_minus_texts in bp_rg.RE_NAME_SURNAME.findall(text):
         text = text.replace(text_minus_texts, text_minus_texts.capitalize())
 
     if not lastname_only:
         # Capturing " cCc-cC" in the first name
-        re_minus_first_name = re.compile('\s[a-zA-Z]+-[a-zA-Z]+$')
-        for x in  re.findall(re_minus_first_name, text):
+        for x in bp_rg.RE_NAME_FIRST_MINUS.findall(text):
             text = text.replace(x, x.upper())
         if firstname_only:
             # Capturing "cCc-cC " or " cCccC." in the first name
-            re_minus_first_name = re.compile('[a-zA-Z]+-[a-zA-Z]+\.$|\s[a-zA-Z]+\.$')
-            for x in  re.findall(re_minus_first_name, text):
+            for x in bp_rg.RE_NAME_FIRST_DOTTED.findall(text):
                 text = text.replace(x, x.upper())
 
     # Capturing "Mc" in name
-    re_mac = re.compile('^Mc[a-zA-Z]')
-    for text_mac_texts in re.findall(re_mac, text):
+    for text_mac_texts in bp_rg.RE_NAME_MAC.findall(text):
         new_text_mac_texts = "Mc" + text_mac_texts[2:].capitalize()
         text = text.replace(text_mac_texts, new_text_mac_texts)
     return text
 
 
+_cached_normalize_name = functools.lru_cache(maxsize=bp_gg.NORM_NAME_CACHE_SIZE)(_normalize_name)
+
+
+def set_norm_name_cache_size(maxsize=bp_gg.NORM_NAME_CACHE_SIZE):
+    """Sets the size of the cache of the normalized author names 
+    used by the `normalize_name` function. 
+
+    The cache is emptied by the call.
+
+    Args:
+        maxsize (int): The maximum number of cached names, \
+        None for an unbounded cache and 0 to disable the cache \
+        (default: global 'NORM_NAME_CACHE_SIZE' \
+        from `BiblioGeneralGlobals` module).
+    """
+    global _cached_normalize_name
+    _cached_normalize_name = functools.lru_cache(maxsize=maxsize)(_normalize_name)
+
+
+def normalize_name(text, drop_ponct=True, lastname_only=False, firstname_only=False):
+    """Normalizes the author name spelling according the three debatable rules:
+            - replacing none ascii letters by ascii ones,
+            - capitalizing first name,
+            - capitalizing surnames,
+            - removing comma and dot.
+       It uses the internal funtion `remove_special_symbol`of the same module.
+       ex: normalize_name(" GrÔŁ-biçà-vèLU D'aillön, E-kj. ")
+        >>> "Grol-Bica-Velu D'Aillon E-KJ".
+       The normalized names are cached with the passed flags, the size of the cache 
+       being set through the `set_norm_name_cache_size` function.
+
+    Args:
+        text (str): The name to normalize.
+    Returns
+        (str) : The normalized text.
+    Notes:
+        The globals 'DASHES_CHANGE', 'LANG_CHAR_CHANGE' and 'PONCT_CHANGE'
+        from `BiblioGeneralGlobals` module are used.
+    """
+    return _cached_normalize_name(text, drop_ponct, lastname_only, firstname_only)
+
+
 def normalize_journal_names(database, corpus_df):
     """Adds the column `normalize_journal_names` to the corpus. 
 
@@ -571,6 +615,74 @@ def standardize_str(raw_str):
     return standard_str
 
 
+def _standardize_address_variants(raw_address):
+    """Standardizes the string 'raw_address' as described in the `standardize_address` 
+    function for both values of its 'add_unknown_country' argument in one pass.
+
+    Returns:
+        (tup): (The standardized address without unknown-country key (str), \
+        The standardized address with unknown-country key (str)).
+    """
+    # Removing particular characters
+    standard_address = standardize_str(raw_address)
+
+    # Uniformizing words
+    for word_to_substitute, re_pattern in bp_sg.DIC_WORD_RE_PATTERN.items():
+        standard_address = re_pattern.sub(word_to_substitute + ' ', standard_address)
+    standard_address = bp_rg.RE_SPACES.sub(' ', standard_address)
+    standard_address = bp_rg.RE_SPACE_COMMA.sub(',', standard_address)
+
+    # Uniformizing countries
+    country_pos = -1
+    first_raw_affiliations_list = standard_address.split(',')
+    # This split below is just for country finding even if affiliation may be separated by dashes
+    raw_affiliations_list = sum([x.split(' - ') for x in first_raw_affiliations_list], [])
+    country = normalize_country(raw_affiliations_list[country_pos].strip())
+    country_chunck = " " + country
+    if country==bp_sg.UNKNOWN_COUNTRY:
+        standard_address = ','.join(first_raw_affiliations_list)
+        return (standard_address, ','.join([standard_address, country_chunck]))
+    standard_address = ','.join(first_raw_affiliations_list[:-1] + [country_chunck])
+    return (standard_address, standard_address)
+
+
+_cached_standardize_address_variants = functools.lru_cache(maxsize=bp_gg.STD_ADDRESS_CACHE_SIZE)(
+    _standardize_address_variants)
+
+
+def set_std_address_cache_size(maxsize=bp_gg.STD_ADDRESS_CACHE_SIZE):
+    """Sets the size of the cache of the standardized addresses 
+    used by the `standardize_address` function. 
+
+    The cache is emptied by the call.
+
+    Args:
+        maxsize (int): The maximum number of cached addresses, \
+        None for an unbounded cache and 0 to disable the cache \
+        (default: global 'STD_ADDRESS_CACHE_SIZE' \
+        from `BiblioGeneralGlobals` module).
+    """
+    global _cached_standardize_address_variants
+    _cached_standardize_address_variants = functools.lru_cache(maxsize=maxsize)(
+        _standardize_address_variants)
+
+
+def standardize_address_variants(raw_address):
+    """Standardizes the string 'raw_address' as described in the `standardize_address` 
+    function without and with adding the unknown-country key.
+
+    The standardized addresses are cached, the size of the cache being set 
+    through the `set_std_address_cache_size` function.
+
+    Args:
+        raw_address (str): The full address to be standardized.
+    Returns:
+        (tup): (The standardized address without unknown-country key (str), \
+        The standardized address with unknown-country key (str)).
+    """
+    return _cached_standardize_address_variants(raw_address)
+
+
 def standardize_address(raw_address, add_unknown_country=True):
     """Standardizes the string 'raw_address' by replacing all aliases of a word, 
     such as 'University', 'Institute', 'Center' and' Department', by a standardized 
@@ -586,6 +698,8 @@ def standardize_address(raw_address, add_unknown_country=True):
             with possibly before one symbol among a to z and after up to 8 symbols from the list 
             '[aàäcdeéirstyz]' and possibly finishing with a dot. 
     Finally, the country is normalized through the `normalize_country` function of the same module.
+    The standardized addresses are cached through the `standardize_address_variants` 
+    function of the same module.
 
     Args:
         raw_address (str): The full address to be standardized.
@@ -594,30 +708,131 @@ def standardize_address(raw_address, add_unknown_country=True):
     Returns:
         (str): The full standardized address.
     """
-    # Removing particular characters
-    standard_address = standardize_str(raw_address)
+    return _cached_standardize_address_variants(raw_address)[bool(add_unknown_country)]
 
-    # Uniformizing words
-    for word_to_substitute, re_pattern in bp_sg.DIC_WORD_RE_PATTERN.items():
-        if word_to_substitute=='University':
-            re_pattern = re.compile(r'\b[a-z]?Univ[aàäcdeéirstyz]{0,8}\b\.?')
-        standard_address = re.sub(re_pattern, word_to_substitute + ' ', standard_address)
-    standard_address = re.sub(r'\s+', ' ', standard_address)
-    standard_address = re.sub(r'\s,', ',', standard_address)
 
-    # Uniformizing countries
-    country_pos = -1
-    first_raw_affiliations_list = standard_address.split(',')
-    # This split below is just for country finding even if affiliation may be separated by dashes
-    raw_affiliations_list = sum([x.split(' - ') for x in first_raw_affiliations_list], [])
-    country = normalize_country(raw_affiliations_list[country_pos].strip())
-    country_chunck = " " + country
-    if country==bp_sg.UNKNOWN_COUNTRY:
-        if add_unknown_country:
-            standard_address = ','.join(first_raw_affiliations_list + [country_chunck])
-        else:
-            standard_address = ','.join(first_raw_affiliations_list)
-    else:
-        standard_address = ','.join(first_raw_affiliations_list[:-1] + [country_chunck])
+def standardize_addresses(raw_addresses, add_unknown_country=True):
+    """Standardizes a series of addresses using the `standardize_address` function 
+    of the same module.
+
+    Each distinct address is standardized once and the standardized addresses 
+    are mapped back to the series.
+
+    Args:
+        raw_addresses (pandas.Series): The full addresses to be standardized.
+        add_unknown_country (bool): If False (default: True), unknown-country key is not added \
+        to the standardized addresses.
+    Returns:
+        (pandas.Series): The full standardized addresses with the index of 'raw_addresses'.
+    """
+    variant_idx = bool(add_unknown_country)
+    std_addresses_dict = {raw_address: _cached_standardize_address_variants(raw_address)[variant_idx]
+                          for raw_address in pd.unique(raw_addresses)}
+    return raw_addresses.map(std_addresses_dict)
+
+
+def _downcast_int_series(int_series, min_dtype):
+    """Casts an integer series to the smallest integer type from 'min_dtype' to int32 
+    holding its values.
+
+    Args:
+        int_series (pandas.Series): The integer values.
+        min_dtype (numpy.dtype): The smallest allowed integer type.
+    Returns:
+        (pandas.Series): The cast values or 'int_series' if no smaller type holds its values.
+    """
+    if not len(int_series):
+        return int_series.astype(min_dtype) if int_series.dtype.itemsize>np.dtype(min_dtype).itemsize else int_series
+    min_value, max_value = int_series.min(), int_series.max()
+    for dtype in [np.int16, np.int32]:
+        if np.dtype(dtype).itemsize<np.dtype(min_dtype).itemsize:
+            continue
+        if np.dtype(dtype).itemsize>=int_series.dtype.itemsize:
+            break
+        if np.iinfo(dtype).min<=min_value and max_value<=np.iinfo(dtype).max:
+            return int_series.astype(dtype)
+    return int_series
+
+
+def compact_item_df(item_df, category_ratio=bp_gg.COMPACT_CATEGORY_RATIO):
+    """Reduces the memory use of the data of a parsing item by casting 
+    its repetitive object columns to category and its integer columns to int32 or int16.
+
+    An object column is repetitive if its ratio of distinct values to rows number 
+    is at most 'category_ratio'; the 'UNKNOWN' and 'EMPTY' globals are added 
+    to the categories of the cast columns so that they remain valid values. 
+    The categories keep the order of the values used by `sort_values`. 
+    The publications-identifiers column is cast to int32 and the other integer 
+    columns, such as the authors or addresses indexes, to int16 when possible.
+
+    Args:
+        item_df (dataframe): The data of the parsing item.
+        category_ratio (float): The maximum ratio of distinct values to rows number \
+        (default: global 'COMPACT_CATEGORY_RATIO').
+    Returns:
+        (dataframe): The compacted data.
+    """
+    # Setting useful aliases
+    pub_id_alias = bp_sg.COL_NAMES['pub_id']
+    sentinels_list = [bp_sg.UNKNOWN, bp_sg.EMPTY]
+
+    compact_df = item_df.copy()
+    rows_nb = len(compact_df)
+    for col in compact_df.columns:
+        col_series = compact_df[col]
+        if pd.api.types.is_integer_dtype(col_series.dtype) and not isinstance(col_series.dtype, pd.SparseDtype):
+            min_dtype = np.int32 if col==pub_id_alias else np.int16
+            compact_df[col] = _downcast_int_series(col_series, min_dtype)
+        elif col_series.dtype==object and rows_nb:
+            if col_series.nunique()<=category_ratio * rows_nb:
+                col_categorical = pd.Categorical(col_series)
+                missing_sentinels_list = [x for x in sentinels_list if x not in col_categorical.categories]
+                compact_df[col] = col_categorical.add_categories(missing_sentinels_list)
+    return compact_df
+
+
+def expand_item_df(item_df):
+    """Casts back to object the category columns of the data of a parsing item 
+    compacted by the `compact_item_df` function of the same module 
+    so that any value can be set in these columns.
+
+    Args:
+        item_df (dataframe): The data of the parsing item.
+    Returns:
+        (dataframe): The data with object columns instead of category ones.
+    """
+    category_cols_list = [col for col in item_df.columns if isinstance(item_df[col].dtype, pd.CategoricalDtype)]
+    if not category_cols_list:
+        return item_df
+    return item_df.astype({col: object for col in category_cols_list})
+
 
-    return standard_address
+def compact_parsing_dict(parsing_dict, verbose=False):
+    """Compacts the data of each parsing item of a parsing dict using 
+    the `compact_item_df` function of the same module.
+
+    Args:
+        parsing_dict (dict): The data (dataframe) keyed by parsing item (str).
+        verbose (bool): True for printing the memory use of each item (default: False).
+    Returns:
+        (tup): (The compacted data (dataframe) keyed by parsing item (str), \
+        The memory use in MB before and after the compaction (tup) keyed by parsing item (str)).
+    """
+    compact_dict = {}
+    memory_dict = {}
+    for item, item_df in parsing_dict.items():
+        if not isinstance(item_df, pd.DataFrame):
+            compact_dict[item] = item_df
+            continue
+        compact_dict[item] = compact_item_df(item_df)
+        memory_dict[item] = (item_df.memory_usage(deep=True).sum() / 2**20,
+                             compact_dict[item].memory_usage(deep=True).sum() / 2**20)
+
+    if verbose:
+        print("  - Memory use of the parsing items before and after compaction:")
+        for item, (init_memory, compact_memory) in memory_dict.items():
+            print(f"      - {item}: {init_memory:.2f} MB -> {compact_memory:.2f} MB")
+        init_total = sum(x[0] for x in memory_dict.values())
+        compact_total = sum(x[1] for x in memory_dict.values())
+        print(f"      - Total: {init_total:.2f} MB -> {compact_total:.2f} MB")
+    return compact_dict, memory_dict
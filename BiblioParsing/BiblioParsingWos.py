@@ -23,6 +23,11 @@ from BiblioParsing.BiblioParsingInstitutions import build_norm_raw_affiliations_
 from BiblioParsing.BiblioParsingInstitutions import extend_author_institutions
 from BiblioParsing.BiblioParsingInstitutions import read_inst_types
 from BiblioParsing.BiblioParsingInstitutions import read_towns_per_country
+from BiblioParsing.BiblioParsingInstrumentation import end_stage
+from BiblioParsing.BiblioParsingInstrumentation import get_profile_path
+from BiblioParsing.BiblioParsingInstrumentation import init_stages_report
+from BiblioParsing.BiblioParsingInstrumentation import start_stage
+from BiblioParsing.BiblioParsingProgress import get_progress_hook
 from BiblioParsing.BiblioParsingUtils import build_item_df_from_tup
 from BiblioParsing.BiblioParsingUtils import build_pub_db_ids
 from BiblioParsing.BiblioParsingUtils import build_title_keywords
@@ -258,7 +263,7 @@ def _build_keywords_wos(corpus_df, fails_dic, cols_tup):
     return ak_keywords_df, ik_keywords_df, tk_keywords_df
 
 
-def _build_addresses_countries_institutions_wos(corpus_df, fails_dic, cols_tup):
+def _build_addresses_countries_institutions_wos(corpus_df, fails_dic, cols_tup, progress_hook=None):
     """Builds the data of addresses, countries and main affiliations 
     per publications of the corpus and updates the parsing success rate data.
 
@@ -303,6 +308,9 @@ def _build_addresses_countries_institutions_wos(corpus_df, fails_dic, cols_tup):
         fails_dic (dict): Parsing success rate data.
         cols_tup (tup): Columns information as built through \
         the `_set_wos_parsing_cols` internal function.
+        progress_hook (ProgressHook or str): The progress hook reporting the progress and the events \
+        as got by the `get_progress_hook` function imported from `BiblioParsingProgress` module \
+        (default: None for the default progress hook).
     Returns:
         (tup): (The built addresses data (dataframe), tha built countries data (dataframe), \
         The built main affiliations data (dataframe)).
@@ -374,7 +382,7 @@ def _build_addresses_countries_institutions_wos(corpus_df, fails_dic, cols_tup):
     if not(len(address_df)==len(country_df)==len(institution_df)):
         warning = (f'WARNING: Lengths of "address_df", "country_df" and "institution_df" dataframes are not equal'
                    f'in "_build_addresses_countries_institutions_wos" function of "BiblioParsingWos.py" module')
-        print(warning)
+        get_progress_hook(progress_hook).event(warning)
 
     return address_df, country_df, institution_df
 
@@ -383,7 +391,8 @@ def _build_authors_countries_institutions_wos(corpus_df, fails_dic, cols_tup, in
                                               country_affiliations_file_path=None,
                                               inst_types_file_path=None,
                                               country_towns_file=None,
-                                              country_towns_folder_path=None):
+                                              country_towns_folder_path=None,
+                                              progress_hook=None):
     """Parses the field of authors with affiliations of the corpus data to build the data of authors 
     with their addresses, country and normalized affiliations per publication of the corpus. 
 
@@ -444,6 +453,9 @@ def _build_authors_countries_institutions_wos(corpus_df, fails_dic, cols_tup, in
         country_towns_file (str): The name of the file of the data of towns per country, optional (default=None).
         country_towns_folder_path (path): The full path to the folder where the 'country_towns_file' file \
         is available, optional (default=None).
+        progress_hook (ProgressHook or str): The progress hook reporting the progress and the events \
+        as got by the `get_progress_hook` function imported from `BiblioParsingProgress` module \
+        (default: None for the default progress hook).
     Returns:
         (dataframe): The built data.
     Notes:
@@ -479,9 +491,10 @@ def _build_authors_countries_institutions_wos(corpus_df, fails_dic, cols_tup, in
     pub_nb = len(corpus_df[pub_id_col])
     pub_num = 0
     addr_country_inst_list = []
+    progress_hook = get_progress_hook(progress_hook).start("    Publications number", pub_nb)
     for pub_id, authors_str, affiliations_str in corpus_series_zip:
         pub_num += 1
-        print("    Publications number:", pub_num, f"/ {pub_nb}", end="\r")
+        progress_hook.update(pub_num)
         if '[' in affiliations_str:
             # Proceeding if the field author is present in affiliations.
 
@@ -523,6 +536,8 @@ def _build_authors_countries_institutions_wos(corpus_df, fails_dic, cols_tup, in
             # If the field author is not present in affiliations complete namedtuple with the global UNKNOWN
             addr_country_inst_list.append(addr_country_inst(pub_id, bp_sg.UNKNOWN, bp_sg.UNKNOWN,
                                                             bp_sg.UNKNOWN, bp_sg.UNKNOWN, bp_sg.UNKNOWN,))
+    progress_hook.close()
+
     # Building a clean addresses-country-inst dataframe and accordingly updating the parsing success rate dict
     addr_country_inst_df, fails_dic = build_item_df_from_tup(addr_country_inst_list, auth_inst_cols_list[:-1],
                                                              norm_institution_col, pub_id_col, fails_dic)
@@ -706,6 +721,41 @@ def _build_articles_wos(corpus_df, cols_tup):
     return articles_df
 
 
+def _parse_reference_wos(field):
+    """Parses a WoS cited reference in a single pass over the precompiled 
+    regular expressions of the reference items.
+
+    Each item is searched once through the `search` method of the compiled 
+    pattern which returns the first match as the `re.findall` function 
+    did previously.
+
+    Args:
+        field (str): The cited reference as given in the WoS rawdata.
+    Returns:
+        (tup): (author (str), year (str), journal (str), volume (str), page (str)) \
+        or None if the author or the journal of the reference is unknown.
+    """
+    journal = bp_rg.RE_REF_JOURNAL_WOS.search(field)
+    author = bp_rg.RE_REF_AUTHOR_WOS.search(field)
+    if journal is None or author is None:
+        return None
+    author = normalize_name(author.group()[:-1])
+    journal = journal.group().strip()
+    if author==bp_sg.UNKNOWN or journal==bp_sg.UNKNOWN:
+        return None
+
+    year = bp_rg.RE_REF_YEAR_WOS.search(field)
+    year = year.group()[1:-1] if year else 0
+
+    vol = bp_rg.RE_REF_VOL_WOS.search(field)
+    vol = vol.group()[3:] if vol else 0
+
+    page = bp_rg.RE_REF_PAGE_WOS.search(field)
+    page = page.group()[3:] if page else 0
+
+    return (author, year, journal, vol, page)
+
+
 def _build_references_wos(corpus_df, cols_tup):
     """Builds the data of cited references per publication of the corpus.
 
@@ -718,6 +768,10 @@ def _build_references_wos(corpus_df, cols_tup):
             0    Nishinaka H  2020   Energy Fuels              31    10933
             0    Bellouard Q  2018   Int. J. Hydrog. Energy    44    19193
 
+    Each distinct cited reference is parsed once using the `_parse_reference_wos` 
+    internal function, the parsing results being cached for the references 
+    cited by several publications.
+
     Args:
         corpus_df (dataframe): The selected rawdata of the corpus.
         cols_tup (tup): Columns information as built through \
@@ -731,53 +785,23 @@ def _build_references_wos(corpus_df, cols_tup):
     pub_id_col = cols_dic['pub_id_col']
     wos_ref_col = wos_cols_dic['wos_ref_col']
 
-    # Setting named tuple
-    article_ref = namedtuple('article_ref', ref_cols_list)
-
-    refs_list =[]
+    parsed_refs_dict = {}
+    pub_ids_list, refs_list = [], []
     for pub_id, row in zip(list(corpus_df[pub_id_col]),
                                 corpus_df[wos_ref_col]):
         if isinstance(row, str):
             # If the reference field is not empty and not an URL
             for field in row.split(";"):
-                year = re.findall(bp_rg.RE_REF_YEAR_WOS, field) 
-                if len(year):
-                    year = year[0][1:-1]
-                else:
-                    year = 0
-
-                vol = re.findall(bp_rg.RE_REF_VOL_WOS, field)
-                if len(vol):
-                    vol = vol[0][3:]
-                else:
-                    vol = 0
-
-                page = re.findall(bp_rg.RE_REF_PAGE_WOS, field)
-                if len(page):
-                    page = page[0][3:]
-                else:
-                    page = 0
-
-                journal = re.findall(bp_rg.RE_REF_JOURNAL_WOS, field)
-                if len(journal):
-                    journal = journal[0].strip()
-                else:
-                    journal = bp_sg.UNKNOWN
-
-                author = re.findall(bp_rg.RE_REF_AUTHOR_WOS, field)
-                if len(author):
-                    author = normalize_name(author[0][:-1])
-                else:
-                    author = bp_sg.UNKNOWN
-
-                if (author!=bp_sg.UNKNOWN) and (journal!=bp_sg.UNKNOWN):
-                    refs_list.append(article_ref(pub_id, author, year, journal, vol,page))
-
-                if (vol==0) & (page==0) & (author!=bp_sg.UNKNOWN):
-                    pass
-
-    references_df = pd.DataFrame.from_dict({label:[s[idx] for s in refs_list] 
-                                            for idx,label in enumerate(ref_cols_list)})
+                if field not in parsed_refs_dict:
+                    parsed_refs_dict[field] = _parse_reference_wos(field)
+                ref_tup = parsed_refs_dict[field]
+                if ref_tup is not None:
+                    pub_ids_list.append(pub_id)
+                    refs_list.append(ref_tup)
+
+    references_df = pd.DataFrame.from_dict({label:[s[idx] for s in refs_list]
+                                            for idx, label in enumerate(ref_cols_list[1:])})
+    references_df.insert(0, ref_cols_list[0], pub_ids_list)
     return references_df
 
 
@@ -855,7 +879,8 @@ def read_database_wos(rawdata_path, wos_ids=False):
 
 def biblio_parser_wos(rawdata_path, inst_filter_list=None, country_affiliations_file_path=None,
                       inst_types_file_path=None, country_towns_file=None,
-                      country_towns_folder_path=None):
+                      country_towns_folder_path=None, report=None, progress_hook=None,
+                      profile=None):
     """Builds parsing data from the corpus rawdata.
 
     The list of the parsed items (keys of the returned dict which values are the dataframes \
@@ -885,9 +910,21 @@ def biblio_parser_wos(rawdata_path, inst_filter_list=None, country_affiliations_
         country_towns_file (str): The name of the file of the data of towns per country, optional (default=None).
         country_towns_folder_path (path): The full path to the folder where the 'country_towns_file' file \
         is available, optional (default=None).
+        report (dict): The dict filled in place with the stages report recording the wall time, \
+        the CPU time, the peak-RSS increase and the rows numbers of each parsing stage \
+        through the `start_stage` and `end_stage` functions imported from `BiblioParsingInstrumentation` \
+        module (default: None for no stages report).
+        progress_hook (ProgressHook or str): The progress hook reporting the progress and the events \
+        of the parsing as got by the `get_progress_hook` function imported from `BiblioParsingProgress` \
+        module (default: None for the default progress hook).
+        profile (path or bool): The full path to the folder where the profile of each parsing stage \
+        is saved and its top hotspots are printed through the `start_stage` and `end_stage` \
+        functions imported from `BiblioParsingInstrumentation` module, as got by the `get_profile_path` \
+        function of the same module (default: None for the folder set by the environment variable \
+        given by the global 'PROFILE_ENV_VAR' if any).
     Returns:
         (tup): (The parsed data (dataframes) as values of a dict keyed by parsing items, \
-        The parsing success rate data (dict), The data (dataframe) of WoS IDs of publications.
+        The parsing success rate data (dict), The data (dataframe) of WoS IDs of publications).
     """
     # Internal functions
     def _keeping_item_parsing_results(item, item_df):
@@ -903,8 +940,18 @@ def biblio_parser_wos(rawdata_path, inst_filter_list=None, country_affiliations_
      auth_inst_item, authors_kw_item, index_kw_item, title_kw_item, subjects_item,
      sub_subjects_item, references_item) = items_list
 
+    # Initializing the stages report of the parsing
+    profile_path = get_profile_path(profile)
+    stages_report = (init_stages_report(f"{bp_sg.WOS} parsing", profile_path, stages_report=report)
+                     if report is not None or profile_path else None)
+
+    # Setting the progress hook of the parsing
+    progress_hook = get_progress_hook(progress_hook)
+
     # Reading and checking the raw corpus file
+    stage = start_stage(stages_report, "reading")
     corpus_df, wos_ids_df = read_database_wos(rawdata_path, wos_ids=True)
+    end_stage(stage, rows_dict={'rawdata': len(corpus_df) if corpus_df is not None else 0})
 
     # Initializing the fails_dic dict for the parsing control
     wos_fails_dic = {}
@@ -919,60 +966,78 @@ def biblio_parser_wos(rawdata_path, inst_filter_list=None, country_affiliations_
 
         # Building the dataframe of articles
         print(f"  - {articles_item} parsing...", end="\r")
+        stage = start_stage(stages_report, "parsing", [articles_item])
         articles_df = _build_articles_wos(corpus_df, cols_tup)
         _keeping_item_parsing_results(articles_item, articles_df)
+        end_stage(stage, wos_parsing_dict)
         print(f"  - {articles_item} parsed    ")
 
         # Building the dataframe of authors
         print(f"  - {authors_item} parsing...", end="\r")
+        stage = start_stage(stages_report, "parsing", [authors_item])
         authors_df = _build_authors_wos(corpus_df, wos_fails_dic, cols_tup)
         _keeping_item_parsing_results(authors_item, authors_df)
+        end_stage(stage, wos_parsing_dict)
         print(f"  - {authors_item} parsed    ")
 
         # Building the dataframe of addresses, countries and institutions
         print(f"  - {addresses_item}, {countries_item} and {institutions_item} parsing...", end="\r")
-        addresses_tup = _build_addresses_countries_institutions_wos(corpus_df, wos_fails_dic, cols_tup)
+        stage = start_stage(stages_report, "parsing", [addresses_item, countries_item, institutions_item])
+        addresses_tup = _build_addresses_countries_institutions_wos(corpus_df, wos_fails_dic, cols_tup,
+                                                                    progress_hook=progress_hook)
         addresses_df, countries_df, institutions_df = addresses_tup
         _keeping_item_parsing_results(addresses_item, addresses_df)
         _keeping_item_parsing_results(countries_item, countries_df)
         _keeping_item_parsing_results(institutions_item, institutions_df)
+        end_stage(stage, wos_parsing_dict)
         print(f"  - {addresses_item}, {countries_item} and {institutions_item} parsed    ")
 
         # Building the dataframe of authors and their institutions
         print(f"  - {auth_inst_item} parsing...")
+        stage = start_stage(stages_report, "parsing", [auth_inst_item])
         auth_inst_df = _build_authors_countries_institutions_wos(corpus_df, wos_fails_dic, cols_tup, 
                                                                  inst_filter_list = inst_filter_list ,
                                                                  country_affiliations_file_path = country_affiliations_file_path,
                                                                  inst_types_file_path = inst_types_file_path,
                                                                  country_towns_file = country_towns_file,
-                                                                 country_towns_folder_path = country_towns_folder_path)
+                                                                 country_towns_folder_path = country_towns_folder_path,
+                                                                 progress_hook = progress_hook)
         _keeping_item_parsing_results(auth_inst_item, auth_inst_df)
+        end_stage(stage, wos_parsing_dict)
         print(f"  - {auth_inst_item} parsed                     ")
 
         # Building the dataframes of keywords
         print(f"  - {authors_kw_item}, {index_kw_item} and {title_kw_item} parsing...", end="\r")
+        stage = start_stage(stages_report, "parsing", [authors_kw_item, index_kw_item, title_kw_item])
         AK_keywords_df, IK_keywords_df, TK_keywords_df = _build_keywords_wos(corpus_df, wos_fails_dic, cols_tup)
         _keeping_item_parsing_results(authors_kw_item, AK_keywords_df)
         _keeping_item_parsing_results(index_kw_item, IK_keywords_df)
         _keeping_item_parsing_results(title_kw_item, TK_keywords_df)
+        end_stage(stage, wos_parsing_dict)
         print(f"  - {authors_kw_item}, {index_kw_item} and {title_kw_item} parsed    ")
 
         # Building the dataframe of subjects
         print(f"  - {subjects_item} parsing...", end="\r")
+        stage = start_stage(stages_report, "parsing", [subjects_item])
         subjects_df = _build_subjects_wos(corpus_df, wos_fails_dic, cols_tup)
         _keeping_item_parsing_results(subjects_item, subjects_df)
+        end_stage(stage, wos_parsing_dict)
         print(f"  - {subjects_item} parsed    ")
 
         # Building the dataframe of sub-subjects
         print(f"  - {sub_subjects_item} parsing...", end="\r")
+        stage = start_stage(stages_report, "parsing", [sub_subjects_item])
         sub_subjects_df = _build_sub_subjects_wos(corpus_df, wos_fails_dic, cols_tup)
         _keeping_item_parsing_results(sub_subjects_item, sub_subjects_df)
+        end_stage(stage, wos_parsing_dict)
         print(f"  - {sub_subjects_item} parsed    ")
 
         # Building the dataframe of references
         print(f"  - {references_item} parsing...", end="\r")
+        stage = start_stage(stages_report, "parsing", [references_item])
         references_df = _build_references_wos(corpus_df, cols_tup)
         _keeping_item_parsing_results(references_item, references_df)
+        end_stage(stage, wos_parsing_dict)
         print(f"  - {references_item} parsed    ")
 
     return wos_parsing_dict, wos_fails_dic, wos_ids_df
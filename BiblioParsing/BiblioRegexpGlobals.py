@@ -9,6 +9,15 @@ __all__ = ['RE_ADDRESS',
            'RE_ADDS_JOURNAL',
            'RE_AUTHOR',
            'RE_DETECT_SCOPUS_NEW',
+           'RE_DOI_PREFIX',
+           'RE_NAME_APOSTROPHE_END',
+           'RE_NAME_APOSTROPHE_START',
+           'RE_NAME_FIRST_DOTTED',
+           'RE_NAME_FIRST_MINUS',
+           'RE_NAME_MAC',
+           'RE_NAME_MINUS_END',
+           'RE_NAME_MINUS_START',
+           'RE_NAME_SURNAME',
            'RE_NUM_CONF',
            'RE_REF_AUTHOR_SCOPUS',
            'RE_REF_AUTHOR_SCOPUS_NEW',
@@ -24,8 +33,11 @@ __all__ = ['RE_ADDRESS',
            'RE_REF_VOL_WOS',
            'RE_REF_YEAR_SCOPUS',
            'RE_REF_YEAR_WOS',
+           'RE_SPACE_COMMA',
+           'RE_SPACES',
            'RE_SUB',
            'RE_SUB_FIRST',
+           'RE_TOKEN',
            'RE_YEAR',
            'RE_YEAR_JOURNAL',
            'RE_ZIP_CODE',
@@ -49,10 +61,28 @@ RE_AUTHOR = re.compile('''(?<=\[)
                       [a-zA-Z,;\s\.\-']*
                       (?=\])''',re.X)                                            # Captures: "xxxx, xxx" or "xxxx xxx" in string between "[" and "]"
 
+RE_NAME_APOSTROPHE_END = re.compile("([a-zA-Z]+')")                               # Captures: "cCc'" in author name
+
+RE_NAME_APOSTROPHE_START = re.compile("('[a-zA-Z]+)")                             # Captures: "'cC" in author name
+
+RE_NAME_FIRST_DOTTED = re.compile(r'[a-zA-Z]+-[a-zA-Z]+\.$|\s[a-zA-Z]+\.$')         # Captures: "cCc-cC." or " cCccC." at the end of first name
+
+RE_NAME_FIRST_MINUS = re.compile(r'\s[a-zA-Z]+-[a-zA-Z]+$')                        # Captures: " cCc-cC" at the end of first name
+
+RE_NAME_MAC = re.compile('^Mc[a-zA-Z]')                                          # Captures: "Mcc" at the start of author name
+
+RE_NAME_MINUS_END = re.compile('([a-zA-Z]+-)')                                   # Captures: "cCc-" in author name
+
+RE_NAME_MINUS_START = re.compile('(-[a-zA-Z]+)')                                 # Captures: "-cCc" in author name
+
+RE_NAME_SURNAME = re.compile(r'[a-zA-Z]+\s')                                      # Captures: "cCccC " in author name
+
 RE_NUM_CONF = re.compile(r'\s\d+th\s|\s\d+nd\s')                                 # Captures: " d...dth " or " d...dnd " in string
 
 RE_DETECT_SCOPUS_NEW = re.compile("\(\d{4}\)(\s)?$")                             # find (dddd); at the end of a string
 
+RE_DOI_PREFIX = re.compile(r'^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)', re.I)        # Captures: "https://doi.org/" or "doi:" at the start of a DOI
+
 RE_REF_AUTHOR_SCOPUS = re.compile(r'^[^,0123456789:]*,'                          # Captures: "ccccc, ccccc,"
                                   '[^,0123456789:]*,')
 
@@ -86,11 +116,17 @@ RE_REF_YEAR_SCOPUS = re.compile(r'(?<=\()\d{4}(?=\))')
 
 RE_REF_YEAR_WOS = re.compile(r',\s\d{4},')                                       # Captures: ", dddd," in wos references
 
+RE_SPACE_COMMA = re.compile(r'\s,')                                               # Captures: " ," 
+
+RE_SPACES = re.compile(r'\s+')                                                   # Captures: one or more spaces
+
 RE_SUB = re.compile('''[a-z]?Univ[\.a-zé]{0,6}\s                                 # Captures alias of University surrounded by texts
                     |[a-z]?Univ[\.a-zé]{0,6}$''',re.X)
 
 RE_SUB_FIRST = re.compile('''[a-z]?Univ[,]\s ''',re.X)                           # Captures alias of University before a coma
 
+RE_TOKEN = re.compile(r'\w+')                                                     # Captures: alphanumeric tokens
+
 RE_YEAR = re.compile(r'\d{4}')                                                   # Captures "dddd" as the string giving the year
 
 RE_YEAR_JOURNAL = re.compile(r'\s\d{4}\s')                                       # Captures " dddd " as the year in journal name
@@ -1,7 +1,8 @@
 """The BiblioGlobals module defines global parameters used in other BiblioParsing modules.
 """
 
-__all__ = ['BASIC_KEEPING_WORDS',
+__all__ = ['ADDRESSES_CHUNK_SIZE',
+           'BASIC_KEEPING_WORDS',
            'BLACKLISTED_WORDS',
            'COL_NAMES',
            'COLUMN_LABEL_SCOPUS',
@@ -12,6 +13,7 @@ __all__ = ['BASIC_KEEPING_WORDS',
            'COUNTRY_AFFILIATIONS_FILE',
            'COUNTRY_TOWNS',
            'COUNTRY_TOWNS_FILE',
+           'DEDUP_INDEX_FILE',
            'DIC_DOCTYPE',
            'DIC_AMB_WORDS',
            'DIC_LOW_WORDS',
@@ -28,15 +30,22 @@ __all__ = ['BASIC_KEEPING_WORDS',
            'INST_TYPES_FILE',
            'INST_TYPES_USECOLS',
            'INSTITUTE_AFFILIATIONS_FILE',
+           'JACCARD_THRESHOLD',
            'KEEPING_WORDS',
            'KEEPING_PREFIX',
+           'LCS_SIMILARITY_THRESHOLD',
            'LENGTH_THRESHOLD',
            'MISSING_SPACE_ACRONYMS',
            'NLTK_VALID_TAG_LIST',
            'NORM_JOURNAL_COLUMN_LABEL',
            'NOUN_MINIMUM_OCCURRENCES',
            'PARSING_ITEMS_LIST',
+           'PARSING_MANIFEST_FILE',
            'PARTIAL',
+           'PROFILE_ENV_VAR',
+           'PROFILE_FILE_EXTENT',
+           'PROFILE_TOP_NB',
+           'PROGRESS_UPDATES_NB',
            'SCOPUS',
            'SCOPUS_CAT_CODES',
            'SCOPUS_JOURNALS_ISSN_CAT',
@@ -286,6 +295,8 @@ DIC_LOW_WORDS = {'proceedings of'        : '',
 # Thresholds
 LENGTH_THRESHOLD = 30
 SIMILARITY_THRESHOLD = 80
+JACCARD_THRESHOLD = 0.4
+LCS_SIMILARITY_THRESHOLD = 80 # calibrated against SIMILARITY_THRESHOLD through `calibrate_similarity_threshold`
 
 # General parsing globals
 NLTK_VALID_TAG_LIST = ['NN','NNS','VBG','JJ'] # you can find help on the nltk tags set
@@ -301,6 +312,14 @@ UNKNOWN = 'unknown'
 UNKNOWN_COUNTRY = 'Unknown'
 
 IDS_TO_DROP_FILE_BASE = "_IDs à supprimer.xlsx"
+DEDUP_INDEX_FILE = "dedup_index.json"
+PARSING_MANIFEST_FILE = "manifest.json"
+
+PROGRESS_UPDATES_NB = 100 # Maximum number of progress updates of a long processing step
+
+PROFILE_ENV_VAR = "BIBLIOPARSING_PROFILE" # Environment variable setting the folder of the stages profiles
+PROFILE_FILE_EXTENT = "prof"
+PROFILE_TOP_NB = 15 # Number of printed hotspots per profiled stage
 
 
 #######################################
@@ -362,6 +381,9 @@ INSTITUTE_AFFILIATIONS_FILE = "Institute_affiliations.xlsx"
 INST_TYPES_FILE    = "Institutions_types.xlsx"
 INST_TYPES_USECOLS = ['Level', 'Abbreviation']
 
+# Number of distinct addresses per task when resolving the affiliations of addresses in parallel
+ADDRESSES_CHUNK_SIZE = 32
+
 # Potentialy ambiguous words in institutions names
 DIC_AMB_WORDS = {' des ': ' ', # Conflict with DES institution
                  ' @ ': ' ', # Management conflict with '@' between texts
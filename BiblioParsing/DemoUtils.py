@@ -1,7 +1,9 @@
 '''
 '''
 __all__ = ['set_user_config',
+           'load_parsing_dict',
            'parse_to_dedup',
+           'read_parsing_dict',
            'save_db_ids_data',
            'save_fails_dict',
            'save_parsing_dict',
@@ -9,6 +11,10 @@ __all__ = ['set_user_config',
           ]
 
 
+# Standard library imports
+from collections.abc import Mapping
+
+
 def _get_demo_config():
     # Standard library imports
     import json
@@ -236,39 +242,381 @@ def parse_to_dedup(year, db_raw_dict,
     return parsing_dicts_dict, fails_dicts, ids_dfs_dict
 
 
-def save_parsing_dict(parsing_dict, parsing_path, 
-                      item_filename_dict, save_extent):
+def _set_columnar_df(item_df):
+    """Sets the data of a parsing item for saving in a columnar format.
+
+    The object columns mixing strings and other types, such as the authors 
+    indexes completed by the 'UNKNOWN' global, are converted to strings 
+    as they are when read back from .dat files.
+
+    Args:
+        item_df (dataframe): The data of the parsing item.
+    Returns:
+        (dataframe): The data with a default index and homogeneous columns types.
     """
+    # 3rd party imports
+    import pandas as pd
+
+    item_df = item_df.reset_index(drop=True)
+    for col in item_df.columns[item_df.dtypes==object]:
+        if pd.api.types.infer_dtype(item_df[col], skipna=True) not in ('string', 'empty'):
+            item_df[col] = item_df[col].where(item_df[col].isna(), item_df[col].astype(str))
+    return item_df
+
+
+def _check_columnar_support(save_extent):
+    """Checks that the pyarrow package required by the columnar formats is installed.
+
+    Args:
+        save_extent (str): The files format among "parquet" and "feather".
+    Raises:
+        ImportError: If the pyarrow package is not installed.
+    """
+    try:
+        # 3rd party imports
+        import pyarrow
+    except ImportError as error:
+        raise ImportError(f'The "{save_extent}" format requires the pyarrow package, '
+                          'install it through "pip install BiblioParsing[columnar]"') from error
+
+
+def _set_item_path(parsing_path, item_filename, save_extent):
+    """Sets the full path of the file of a parsing item.
+
+    Args:
+        parsing_path (path): The full path of the parsing results folder.
+        item_filename (str): The file name without extension.
+        save_extent (str): The files format among "xlsx", "dat", "parquet", "feather" \
+        and "csv" for any other value.
+    Returns:
+        (path): The full path of the file.
     """
     # Standard library imports
     from pathlib import Path
-    
+
+    extent = save_extent if save_extent in ["xlsx", "dat", "parquet", "feather"] else "csv"
+    return parsing_path / Path(item_filename + "." + extent)
+
+
+def _get_file_checksum(file_path):
+    """Computes the SHA-256 checksum of a file by blocks of 1 MB.
+
+    Args:
+        file_path (path): The full path of the file.
+    Returns:
+        (str): The hexadecimal checksum.
+    """
+    # Standard library imports
+    import hashlib
+
+    checksum = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(2**20), b''):
+            checksum.update(block)
+    return checksum.hexdigest()
+
+
+def _save_item_df(item_df, item_path, save_extent):
+    """Saves atomically the data of a parsing item by writing a temporary file 
+    in the same folder and then renaming it as 'item_path'.
+
+    The "parquet" format is written with dictionary encoding and zstd compression 
+    and the "feather" format (Arrow IPC) uncompressed so that it can be read 
+    through a memory map without copy; both formats require the pyarrow package 
+    installed through the "columnar" extra.
+
+    Args:
+        item_df (dataframe): The data of the parsing item.
+        item_path (path): The full path of the file set by the `_set_item_path` function.
+        save_extent (str): The files format among "xlsx", "dat", "parquet", "feather" \
+        and "csv" for any other value.
+    Returns:
+        (dict): The manifest entry of the file with the file name, the rows number, \
+        the file size in bytes and the SHA-256 checksum.
+    """
+    # Standard library imports
+    import os
+
+    tmp_path = item_path.with_name(item_path.stem + ".tmp" + item_path.suffix)
+    try:
+        if save_extent == "xlsx":
+            item_df.to_excel(tmp_path, index = False)
+        elif save_extent == "dat":
+            item_df.to_csv(tmp_path, index = False, sep = '\t')
+        elif save_extent == "parquet":
+            _check_columnar_support(save_extent)
+            _set_columnar_df(item_df).to_parquet(tmp_path, engine = 'pyarrow', index = False,
+                                                 compression = 'zstd', use_dictionary = True)
+        elif save_extent == "feather":
+            _check_columnar_support(save_extent)
+            _set_columnar_df(item_df).to_feather(tmp_path, compression = 'uncompressed')
+        else:
+            item_df.to_csv(tmp_path, index = False, sep = ',')
+        os.replace(tmp_path, item_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    manifest_entry = {'file'  : item_path.name,
+                      'rows'  : len(item_df),
+                      'size'  : item_path.stat().st_size,
+                      'sha256': _get_file_checksum(item_path),
+                     }
+    return manifest_entry
+
+
+def _save_manifest(parsing_path, save_extent, items_entries_dict, other_entries_dict=None):
+    """Saves atomically the manifest of a parsing results folder in a json file 
+    which name is given by the global 'PARSING_MANIFEST_FILE'.
+
+    Args:
+        parsing_path (path): The full path of the parsing results folder.
+        save_extent (str): The files format of the parsing items.
+        items_entries_dict (dict): The manifest entries (dict) keyed by parsing item (str).
+        other_entries_dict (dict): The manifest entries (dict) of other files \
+        keyed by file label (str) (default: None).
+    Returns:
+        (path): The full path of the manifest file.
+    """
+    # Standard library imports
+    import json
+    import os
+    from pathlib import Path
+
+    # Globals imports
+    from BiblioParsing.BiblioSpecificGlobals import ENCODING
+    from BiblioParsing.BiblioSpecificGlobals import PARSING_MANIFEST_FILE
+
+    manifest_dict = {'save_extent': save_extent,
+                     'items'      : items_entries_dict,
+                     'files'      : other_entries_dict if other_entries_dict else {},
+                    }
+    manifest_path = parsing_path / Path(PARSING_MANIFEST_FILE)
+    tmp_path = manifest_path.with_name(manifest_path.stem + ".tmp" + manifest_path.suffix)
+    with open(tmp_path, 'w', encoding = ENCODING) as file:
+        json.dump(manifest_dict, file, indent = 4)
+    os.replace(tmp_path, manifest_path)
+    return manifest_path
+
+
+def save_parsing_dict(parsing_dict, parsing_path, 
+                      item_filename_dict, save_extent):
+    """Saves the data of each parsing item of 'parsing_dict' in a file 
+    which name is given by 'item_filename_dict' and which format is set by 'save_extent'.
+
+    Each file is written atomically through the `_save_item_df` internal function 
+    and the manifest of the saved files is written at the end through 
+    the `_save_manifest` internal function.
+
+    Args:
+        parsing_dict (dict): The data (dataframe) keyed by parsing item (str).
+        parsing_path (path): The full path of the parsing results folder.
+        item_filename_dict (dict): The file name (str) without extension keyed by parsing item (str).
+        save_extent (str): The files format among "xlsx", "dat", "parquet", "feather" \
+        and "csv" for any other value.
+    Returns:
+        (str): End message recalling the files format.
+    """
     # Globals imports
     from BiblioParsing.BiblioSpecificGlobals import PARSING_ITEMS_LIST
     
     # Cycling on parsing items 
+    items_entries_dict = {}
     for item in PARSING_ITEMS_LIST:
         if item in parsing_dict.keys():
-            item_df = parsing_dict[item]
-            if save_extent == "xlsx":
-                item_xlsx_file = item_filename_dict[item] + ".xlsx"
-                item_xlsx_path = parsing_path / Path(item_xlsx_file)
-                item_df.to_excel(item_xlsx_path, index = False)
-            elif save_extent == "dat":
-                item_tsv_file = item_filename_dict[item] + ".dat"
-                item_tsv_path = parsing_path / Path(item_tsv_file)
-                item_df.to_csv(item_tsv_path, index = False, sep = '\t')
-            else:
-                item_tsv_file = item_filename_dict[item] + ".csv"
-                item_tsv_path = parsing_path / Path(item_tsv_file)
-                item_df.to_csv(item_tsv_path, index = False, sep = '\,')
+            item_path = _set_item_path(parsing_path, item_filename_dict[item], save_extent)
+            items_entries_dict[item] = _save_item_df(parsing_dict[item], item_path, save_extent)
         else:
             pass
+    _save_manifest(parsing_path, save_extent, items_entries_dict)
 
     message = f"All parsing results saved as {save_extent} files"
     return message  
 
 
+def _read_item_df(item_path, save_extent, columns=None):
+    """Reads the data of a parsing item saved by the `_save_item_df` function.
+
+    The "feather" files being uncompressed, they are read through a memory map 
+    so that the selected columns are not copied before their conversion to a dataframe.
+
+    Args:
+        item_path (path): The full path of the file.
+        save_extent (str): The files format among "xlsx", "dat", "parquet", "feather" \
+        and "csv" for any other value.
+        columns (list): The names (str) of the columns to read (default: None for all columns).
+    Returns:
+        (dataframe): The data of the parsing item.
+    """
+    # 3rd party imports
+    import pandas as pd
+
+    if save_extent == "xlsx":
+        item_df = pd.read_excel(item_path, usecols = columns)
+    elif save_extent == "dat":
+        item_df = pd.read_csv(item_path, sep = '\t', usecols = columns)
+    elif save_extent == "parquet":
+        _check_columnar_support(save_extent)
+        item_df = pd.read_parquet(item_path, engine = 'pyarrow', columns = columns)
+    elif save_extent == "feather":
+        _check_columnar_support(save_extent)
+
+        # 3rd party imports
+        from pyarrow import feather
+
+        item_df = feather.read_table(item_path, columns = columns, memory_map = True).to_pandas()
+    else:
+        item_df = pd.read_csv(item_path, usecols = columns)
+    return item_df
+
+
+def read_parsing_dict(parsing_path, item_filename_dict, save_extent):
+    """Reads the parsing results saved by the `save_parsing_dict` function.
+
+    The parsing items which file is not available in the 'parsing_path' folder are skipped.
+
+    Args:
+        parsing_path (path): The full path of the parsing results folder.
+        item_filename_dict (dict): The file name (str) without extension keyed by parsing item (str).
+        save_extent (str): The files format among "xlsx", "dat", "parquet", "feather" \
+        and "csv" for any other value.
+    Returns:
+        (dict): The data (dataframe) keyed by parsing item (str).
+    """
+    # Globals imports
+    from BiblioParsing.BiblioSpecificGlobals import PARSING_ITEMS_LIST
+
+    parsing_dict = {}
+    for item in PARSING_ITEMS_LIST:
+        if item in item_filename_dict.keys():
+            item_path = _set_item_path(parsing_path, item_filename_dict[item], save_extent)
+            if item_path.exists():
+                parsing_dict[item] = _read_item_df(item_path, save_extent)
+    return parsing_dict
+
+
+def _read_parsing_manifest(parsing_path):
+    """Reads the manifest of a parsing results folder saved by the `_save_manifest` function 
+    or, when not available, builds an equivalent manifest without rows numbers 
+    from the default file names of the parsing items found in the folder.
+
+    Args:
+        parsing_path (path): The full path of the parsing results folder.
+    Returns:
+        (dict): The manifest with the 'save_extent' and 'items' keys.
+    """
+    # Standard library imports
+    import json
+    from pathlib import Path
+
+    # Globals imports
+    from BiblioParsing.BiblioSpecificGlobals import ENCODING
+    from BiblioParsing.BiblioSpecificGlobals import PARSING_ITEMS_LIST
+    from BiblioParsing.BiblioSpecificGlobals import PARSING_MANIFEST_FILE
+
+    manifest_path = parsing_path / Path(PARSING_MANIFEST_FILE)
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding = ENCODING) as file:
+            manifest_dict = json.load(file)
+        return manifest_dict
+
+    item_filename_dict = _get_demo_config()['PARSING_FILE_NAMES']
+    for save_extent in ["parquet", "feather", "dat", "csv", "xlsx"]:
+        items_entries_dict = {}
+        for item in PARSING_ITEMS_LIST:
+            item_path = _set_item_path(parsing_path, item_filename_dict[item], save_extent)
+            if item_path.exists():
+                items_entries_dict[item] = {'file': item_path.name}
+        if items_entries_dict:
+            return {'save_extent': save_extent, 'items': items_entries_dict}
+    raise FileNotFoundError(f"No parsing results found in the folder: {parsing_path}")
+
+
+class LazyParsingDict(Mapping):
+    """Read-only mapping of the parsing items saved in a parsing results folder 
+    which data are read on first access and then kept.
+
+    It is built by the `load_parsing_dict` function.
+    """
+
+    def __init__(self, parsing_path, items=None, lazy=True):
+        # Standard library imports
+        from pathlib import Path
+
+        self.parsing_path = Path(parsing_path)
+        manifest_dict = _read_parsing_manifest(self.parsing_path)
+        self.save_extent = manifest_dict['save_extent']
+        self._entries_dict = {item: entry for item, entry in manifest_dict['items'].items()
+                              if items is None or item in items}
+        self._items_dict = {}
+        if not lazy:
+            for item in self._entries_dict.keys():
+                _ = self[item]
+
+    def __getitem__(self, item):
+        if item not in self._items_dict:
+            self._items_dict[item] = self.read(item)
+        return self._items_dict[item]
+
+    def __iter__(self):
+        return iter(self._entries_dict)
+
+    def __len__(self):
+        return len(self._entries_dict)
+
+    def __repr__(self):
+        return (f"LazyParsingDict('{self.parsing_path}', save_extent='{self.save_extent}', "
+                f"items={list(self._entries_dict)}, loaded={list(self._items_dict)})")
+
+    def read(self, item, columns=None):
+        """Reads the data of a parsing item without keeping it, 
+        or gets it if already loaded.
+
+        Args:
+            item (str): The parsing item.
+            columns (list): The names (str) of the columns to read (default: None for all columns).
+        Returns:
+            (dataframe): The data of the parsing item.
+        """
+        if item not in self._entries_dict:
+            raise KeyError(item)
+        if item in self._items_dict:
+            item_df = self._items_dict[item]
+            return item_df if columns is None else item_df[columns]
+        item_path = self.parsing_path / self._entries_dict[item]['file']
+        return _read_item_df(item_path, self.save_extent, columns = columns)
+
+    def row_counts(self):
+        """Gets the rows number of each parsing item from the manifest, 
+        the data being read only for the items missing in the manifest.
+
+        Returns:
+            (dict): The rows number (int) keyed by parsing item (str).
+        """
+        return {item: entry['rows'] if 'rows' in entry else len(self[item])
+                for item, entry in self._entries_dict.items()}
+
+
+def load_parsing_dict(parsing_path, items=None, lazy=True):
+    """Loads the parsing results saved in a parsing results folder 
+    by the `save_parsing_dict` or `save_parsing_dicts` functions.
+
+    The files are found through the manifest of the folder or, for folders saved 
+    without manifest, through the default file names of the parsing items.
+
+    Args:
+        parsing_path (path): The full path of the parsing results folder.
+        items (list): The parsing items (str) to load (default: None for all saved items).
+        lazy (bool): False for reading all the items at once (default: True for reading \
+        each item on first access).
+    Returns:
+        (LazyParsingDict): The mapping of the data (dataframe) keyed by parsing item (str); \
+        its `read` method allows reading a selection of columns and its `row_counts` method \
+        gets the rows numbers from the manifest.
+    """
+    return LazyParsingDict(parsing_path, items = items, lazy = lazy)
+
+
 def save_fails_dict(fails_dict, parsing_path):
     '''The function `save_fails_dict` saves parsing fails in a json file
     named "failed.json".
@@ -293,49 +641,101 @@ def save_fails_dict(fails_dict, parsing_path):
     return message 
 
 
+def _set_db_ids_path(parsing_path, database):
+    """Sets the full path of the xlsx file of the database-IDs data.
+
+    Args:
+        parsing_path (path): The full path of the parsing results folder.
+        database (str): The database name.
+    Returns:
+        (path): The full path of the file.
+    """
+    # Standard library imports
+    from pathlib import Path
+
+    file_name = database.capitalize() + "_IDs.xlsx"
+    return parsing_path / Path(file_name)
+
+
 def save_db_ids_data(db_ids_df, parsing_path, database):
-    """The function `save_db_ids_data` saves database-IDs data in an xlsx file.
+    """The function `save_db_ids_data` saves atomically database-IDs data in an xlsx file.
     
     Args:
         db_ids_df (dataframe): The database IDs data.
         parsing_path (path): The full path of the parsing results folder \
         for saving the xlsx file.
     """
-    # Standard library imports
-    from pathlib import Path
-    
-    file_name = database.capitalize() + "_IDs.xlsx"
-    file_path = parsing_path / Path(file_name)
-    
-    db_ids_df.to_excel(file_path, index=False)
+    file_path = _set_db_ids_path(parsing_path, database)
+    _ = _save_item_df(db_ids_df, file_path, "xlsx")
         
     message = f"Database-IDs data saved as xlsx file"
     return message
 
 
-def save_parsing_dicts(parsing_dicts_dict, parsing_path_dict, item_filename_dict,
-                       save_extent, fails_dicts, ids_dfs_dict): 
-    """
-    
-    Note:
-        Uses `save_parsing_dict` function.
+def _save_parsing_dicts(parsing_dicts_dict, parsing_path_dict, item_filename_dict,
+                        save_extent, fails_dicts, ids_dfs_dict, workers=None, processes=False):
+    """Saves the parsing results of `save_parsing_dicts` function of the same module 
+    by dispatching the writing of the files to a pool of workers.
+
+    The number of pending writings is bounded to twice the number of workers 
+    so that the data waiting to be written in the pool queue is limited.
+
+    Args:
+        See `save_parsing_dicts` function.
+    Returns:
+        (str): End message recalling the files format.
     """
-    fails_save_status = False
-    db_ids_save_status = False
+    # Standard library imports
+    import os
+    import threading
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures import ThreadPoolExecutor
 
-    for parsing_name, parsing_dict in parsing_dicts_dict.items():
-        parsing_path = parsing_path_dict[parsing_name]
-        _ = save_parsing_dict(parsing_dict, parsing_path, item_filename_dict, save_extent)
-        
-        if parsing_name in fails_dicts.keys():
-            parsing_fails_dict = fails_dicts[parsing_name]
-            _ = save_fails_dict(parsing_fails_dict, parsing_path)
-            fails_save_status = True   
+    # Globals imports
+    from BiblioParsing.BiblioSpecificGlobals import PARSING_ITEMS_LIST
 
-        if parsing_name in ids_dfs_dict.keys():
-            db_ids_df = ids_dfs_dict[parsing_name]
-            _ = save_db_ids_data(db_ids_df, parsing_path, parsing_name)
-            db_ids_save_status = True
+    if workers is None:
+        workers = min(8, os.cpu_count() or 1)
+    pool_executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    pending_semaphore = threading.BoundedSemaphore(2 * workers)
+
+    fails_save_status = False
+    db_ids_save_status = False
+    futures_dict = {}
+    with pool_executor(max_workers = workers) as executor:
+
+        def _submit(key, item_df, item_path, extent):
+            pending_semaphore.acquire()
+            future = executor.submit(_save_item_df, item_df, item_path, extent)
+            future.add_done_callback(lambda _: pending_semaphore.release())
+            futures_dict[key] = future
+
+        for parsing_name, parsing_dict in parsing_dicts_dict.items():
+            parsing_path = parsing_path_dict[parsing_name]
+            for item in PARSING_ITEMS_LIST:
+                if item in parsing_dict.keys():
+                    item_path = _set_item_path(parsing_path, item_filename_dict[item], save_extent)
+                    _submit((parsing_name, 'items', item), parsing_dict[item], item_path, save_extent)
+
+            if parsing_name in ids_dfs_dict.keys():
+                db_ids_path = _set_db_ids_path(parsing_path, parsing_name)
+                _submit((parsing_name, 'files', db_ids_path.name), ids_dfs_dict[parsing_name],
+                        db_ids_path, "xlsx")
+                db_ids_save_status = True
+
+            if parsing_name in fails_dicts.keys():
+                parsing_fails_dict = fails_dicts[parsing_name]
+                _ = save_fails_dict(parsing_fails_dict, parsing_path)
+                fails_save_status = True
+
+    # Writing the manifests once all the writings are completed
+    for parsing_name in parsing_dicts_dict.keys():
+        entries_dict = {'items': {}, 'files': {}}
+        for (name, entry_type, label), future in futures_dict.items():
+            if name == parsing_name:
+                entries_dict[entry_type][label] = future.result()
+        _save_manifest(parsing_path_dict[parsing_name], save_extent,
+                       entries_dict['items'], entries_dict['files'])
 
     message = f"All parsing-to-deduplication results saved as files with .{save_extent} extension."
     if fails_save_status:
@@ -344,3 +744,46 @@ def save_parsing_dicts(parsing_dicts_dict, parsing_path_dict, item_filename_dict
         message += f"\n All database-IDs data saved as xlsx files."
     
     return message
+
+
+def save_parsing_dicts(parsing_dicts_dict, parsing_path_dict, item_filename_dict,
+                       save_extent, fails_dicts, ids_dfs_dict,
+                       workers=None, processes=False, wait=True): 
+    """Saves the parsing results of each parsing dict of 'parsing_dicts_dict' 
+    together with the parsing fails and the database-IDs data.
+
+    The files are written atomically in parallel by a pool of threads, or of processes 
+    when 'processes' is True, and a manifest of the saved files is written 
+    in each parsing results folder once all the writings are completed.
+
+    Args:
+        parsing_dicts_dict (dict): The parsing dicts (dict) keyed by parsing name (str).
+        parsing_path_dict (dict): The full paths (path) of the parsing results folders \
+        keyed by parsing name (str).
+        item_filename_dict (dict): The file name (str) without extension keyed by parsing item (str).
+        save_extent (str): The files format among "xlsx", "dat", "parquet", "feather" \
+        and "csv" for any other value.
+        fails_dicts (dict): The parsing fails (dict) keyed by parsing name (str).
+        ids_dfs_dict (dict): The database-IDs data (dataframe) keyed by parsing name (str).
+        workers (int): The number of workers (default: None for the number of CPUs up to 8).
+        processes (bool): True for using processes instead of threads (default: False).
+        wait (bool): False for returning immediately a future of the end message \
+        while the files are being written (default: True).
+    Returns:
+        (str or concurrent.futures.Future): End message recalling the files format \
+        or its future if 'wait' is False.
+    Note:
+        Uses `_save_item_df` and `_save_manifest` internal functions.
+    """
+    # Standard library imports
+    from concurrent.futures import ThreadPoolExecutor
+
+    save_args = (parsing_dicts_dict, parsing_path_dict, item_filename_dict,
+                 save_extent, fails_dicts, ids_dfs_dict, workers, processes)
+    if wait:
+        return _save_parsing_dicts(*save_args)
+
+    background_executor = ThreadPoolExecutor(max_workers = 1)
+    message_future = background_executor.submit(_save_parsing_dicts, *save_args)
+    background_executor.shutdown(wait = False)
+    return message_future
@@ -6,9 +6,12 @@ from BiblioParsing.BiblioGeneralGlobals import *
 from BiblioParsing.BiblioRegexpGlobals import *
 from BiblioParsing.BiblioSpecificGlobals import *
 from BiblioParsing.BiblioParsingUtils import *
+from BiblioParsing.BiblioParsingProgress import *
 from BiblioParsing.BiblioParsingWos import *
 from BiblioParsing.BiblioParsingScopus import *
 from BiblioParsing.BiblioParsingInstitutions import *
+from BiblioParsing.BiblioParsingInstrumentation import *
+from BiblioParsing.BiblioParsingSimilarity import *
 from BiblioParsing.BiblioParsingConcat import *
 from BiblioParsing.BiblioParsingMain import *
 from BiblioParsing.DemoUtils import *
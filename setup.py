@@ -30,6 +30,7 @@ setup(name='BiblioParsing',
         ],
       keywords = 'Bibliography, Corpus parsing, WOS, SCOPUS',
       install_requires = install_requires,
+      extras_require = {'columnar': ['pyarrow']},
       author= 'BiblioAnalysis team',
       author_email= 'francois.bertin7@wanadoo.fr, amal.chabli@orange.fr',
       url= 'https://github.com/TickyWill/BiblioParsing',
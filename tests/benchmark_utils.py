@@ -0,0 +1,1026 @@
+"""Helpers of the benchmarks timing the costly steps of the parsing process
+on synthetic rawdata, kept out of the installed package and run from this folder:
+
+    cd tests
+    python -c "from benchmark_utils import bench_parsing_stages; bench_parsing_stages((1000,))"
+"""
+
+__all__ = ['bench_articles_merging',
+           'bench_exact_linking',
+           'bench_journal_names',
+           'bench_normalize_name',
+           'bench_parsing_dict_formats',
+           'bench_parsing_stages',
+           'bench_references',
+           'bench_scopus_correction',
+           'bench_same_titles',
+           'bench_standardize_address',
+           ]
+
+
+# Standard library imports
+import random
+import tempfile
+import time
+from pathlib import Path
+
+# 3rd party imports
+import numpy as np
+import pandas as pd
+
+# Local library imports
+import BiblioParsing.BiblioSpecificGlobals as bp_sg
+from BiblioParsing.BiblioParsingSimilarity import get_similarity_scorer
+
+
+# Vocabulary used to build the synthetic rawdata
+_LASTNAMES = ["Dupont", "Martin", "Bernard", "Petit", "Durand", "Leroy", "Moreau", "Simon",
+              "Laurent", "Lefebvre", "Michel", "Garcia", "D'Errico", "Mc Donald", "Muller",
+              "Schmidt", "Rossi", "Tanaka", "Wang", "Kowalski", "Jung", "Matos", "Koutsos"]
+_FIRSTNAMES = ["Jean-Pierre", "Alice", "Marc", "Sophie", "Houssame", "Sylvain", "Bo Kum",
+               "Varvara V.", "Thomas", "Sergio", "Orestis", "Antonio", "Raffaele", "Li", "Anna"]
+_AFFILIATIONS = ["CEA, LITEN, Grenoble, F-38000, France",
+                 "Univ Grenoble Alpes, Grenoble, France",
+                 "CNRS, PROMES, 7 Rue Four Solaire, Font Romeu, F-66120, France",
+                 "Lund University, Department of Physical Geography, Lund, Sweden",
+                 "Tech Univ Carolo Wilhelmina Braunschweig, Inst Nachrichtentechn, Braunschweig, Germany",
+                 "Univ Inst Lisbon, Inst Telecomunicac, Lisbon, Portugal",
+                 "Hitachi Cambridge Laboratory, Cambridge, United Kingdom",
+                 "MIT, Dept Phys, Cambridge, MA 02139, USA"]
+_JOURNALS = ["Int. J. Hydrog. Energy", "Energy Fuels", "Sol. Energy", "Appl. Energy",
+             "Renew. Sust. Energ. Rev.", "Chem. Eng. J.", "Phys. Rev. B", "Nature"]
+_JOURNAL_WORDS = ["journal", "of", "applied", "physics", "energy", "solar", "materials", "chemistry",
+                  "international", "review", "letters", "advanced", "renewable", "sustainable",
+                  "science", "engineering", "reports", "hydrogen", "thermal", "conversion",
+                  "optics", "photonics", "electronic", "devices", "nuclear", "fusion", "plasma",
+                  "catalysis", "chemical", "process", "environmental", "technology", "management",
+                  "transactions", "computational", "mechanics", "fluid", "heat", "transfer",
+                  "biomass", "bioenergy", "storage", "batteries", "power", "sources", "systems",
+                  "membrane", "polymer", "crystal", "growth", "surface", "interfaces", "nano",
+                  "quantum", "magnetic", "semiconductors", "photovoltaics", "progress", "research"]
+_TITLE_WORDS = ["high", "temperature", "solar", "reactor", "hydrogen", "production", "thermochemical",
+                "cycle", "modelling", "experimental", "study", "analysis", "performance", "efficient",
+                "gasification", "biomass", "catalyst", "oxide", "perovskite", "cells", "stability",
+                "degradation", "novel", "approach", "design", "optimization", "heat", "storage",
+                "photovoltaic", "module", "silicon", "thin", "film", "deposition", "characterization",
+                "electrochemical", "battery", "lithium", "ion", "electrode", "membrane", "fuel",
+                "kinetics", "mechanism", "numerical", "simulation", "flow", "particle", "concentrated",
+                "receiver", "material", "properties", "synthesis", "nanostructured", "review"]
+_PROCEEDINGS = ["Proceedings of the IEEE Photovoltaic Specialists Conference",
+                "Proceedings of SPIE"]
+
+
+def _time_function(funct, *args, repeat=1, **kwargs):
+    """Times the call of a function with the passed arguments.
+
+    Args:
+        funct (function): The function to time.
+        repeat (int): The number of calls (default: 1).
+    Returns:
+        (tup): (The best wall time in seconds (float), The result of the last call).
+    """
+    times_list = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        result = funct(*args, **kwargs)
+        times_list.append(time.perf_counter() - start_time)
+    return min(times_list), result
+
+
+def _build_scopus_authors_rawdata(rows_nb, seed=0, irregular_rate=0.1):
+    """Builds synthetic Scopus rawdata restricted to the authors and affiliations columns.
+
+    A fraction of the rows, given by 'irregular_rate', is built with irregular separators
+    in the affiliations so that the correction process is fully exercised.
+
+    Args:
+        rows_nb (int): The number of publications.
+        seed (int): The seed of the random generator (default: 0).
+        irregular_rate (float): The rate of rows with irregular separators (default: 0.1).
+    Returns:
+        (dataframe): The built rawdata.
+    """
+    rng = random.Random(seed)
+    authors_col = bp_sg.COLUMN_LABEL_SCOPUS['authors']
+    fullnames_col = bp_sg.COLUMN_LABEL_SCOPUS_PLUS['auth_fullnames']
+    affil_col = bp_sg.COLUMN_LABEL_SCOPUS['affiliations']
+    auth_affil_col = bp_sg.COLUMN_LABEL_SCOPUS['authors_with_affiliations']
+
+    rows_list = []
+    for _ in range(rows_nb):
+        authors_nb = rng.randint(1, 6)
+        authors_list, fullnames_list, auth_affil_list, affil_set = [], [], [], []
+        for auth_idx in range(authors_nb):
+            lastname, firstname = rng.choice(_LASTNAMES), rng.choice(_FIRSTNAMES)
+            initials = "".join(x[0] + "." for x in firstname.replace("-", " ").split(" ") if x)
+            if rng.random()<irregular_rate:
+                # Keeping only the first initial to be corrected using the full name
+                initials = initials[0:2]
+            author = f"{lastname} {initials}"
+            affiliation = rng.choice(_AFFILIATIONS)
+            if rng.random()<irregular_rate:
+                affiliation = affiliation.replace(", ", ";", 1)
+            authors_list.append(author)
+            fullnames_list.append(f"{lastname}, {firstname} ({57200000000 + auth_idx})")
+            auth_affil_list.append(f"{author}, {affiliation}")
+            if affiliation not in affil_set:
+                affil_set.append(affiliation)
+        rows_list.append(["; ".join(authors_list), "; ".join(fullnames_list),
+                          "; ".join(affil_set), "; ".join(auth_affil_list)])
+    rawdata_df = pd.DataFrame(rows_list, columns=[authors_col, fullnames_col,
+                                                  affil_col, auth_affil_col])
+    return rawdata_df
+
+
+def _build_wos_authors_rawdata(rows_nb, seed=0):
+    """Builds synthetic WoS rawdata restricted to the authors column.
+
+    Args:
+        rows_nb (int): The number of publications.
+        seed (int): The seed of the random generator (default: 0).
+    Returns:
+        (dataframe): The built rawdata.
+    """
+    rng = random.Random(seed)
+    authors_col = bp_sg.COLUMN_LABEL_WOS['authors']
+    rows_list = []
+    for _ in range(rows_nb):
+        authors_list = []
+        for _ in range(rng.randint(1, 6)):
+            firstname = rng.choice(_FIRSTNAMES)
+            initials = "".join(x[0] for x in firstname.replace("-", " ").split(" ") if x)
+            authors_list.append(f"{rng.choice(_LASTNAMES)}, {initials}")
+        rows_list.append("; ".join(authors_list))
+    rawdata_df = pd.DataFrame({authors_col: rows_list})
+    return rawdata_df
+
+
+def bench_normalize_name(rows_nb=50000, repeat=1, seed=0):
+    """Times the normalization of the author names of the WoS and Scopus 
+    authors columns with and without the cache of the `normalize_name` function.
+
+    The cache size is reset to its default value at the end of the benchmark.
+
+    Args:
+        rows_nb (int): The number of synthetic publications (default: 50000).
+        repeat (int): The number of timed calls per case (default: 1).
+        seed (int): The seed of the random generator (default: 0).
+    Returns:
+        (dict): The best wall times in seconds keyed by case.
+    """
+    # Local library imports
+    import BiblioParsing.BiblioGeneralGlobals as bp_gg
+    from BiblioParsing.BiblioParsingUtils import normalize_name
+    from BiblioParsing.BiblioParsingUtils import set_norm_name_cache_size
+
+    wos_auth_col = bp_sg.COLUMN_LABEL_WOS['authors']
+    wos_names_list = [name for row in _build_wos_authors_rawdata(rows_nb, seed=seed)[wos_auth_col]
+                      for name in row.split(';')]
+    scopus_rawdata_df = _build_scopus_authors_rawdata(rows_nb, seed=seed)
+    scopus_auth_col = bp_sg.COLUMN_LABEL_SCOPUS['authors']
+    scopus_fullnames_col = bp_sg.COLUMN_LABEL_SCOPUS_PLUS['auth_fullnames']
+    scopus_names_list = [name for row in scopus_rawdata_df[scopus_auth_col]
+                         for name in row.split('; ')]
+    scopus_fullnames_list = [name.split(' (')[0].split(', ') for row in scopus_rawdata_df[scopus_fullnames_col]
+                             for name in row.split('; ')]
+
+    def _normalize_wos_names():
+        return [normalize_name(name, drop_ponct=True) for name in wos_names_list]
+
+    def _normalize_scopus_names():
+        names_list = [normalize_name(name, drop_ponct=True) for name in scopus_names_list]
+        for lastname, firstname in scopus_fullnames_list:
+            names_list.append(normalize_name(lastname, drop_ponct=True, lastname_only=True))
+            names_list.append(normalize_name(firstname, drop_ponct=False, firstname_only=True))
+        return names_list
+
+    bench_dict = {'wos names number': len(wos_names_list),
+                  'scopus names number': len(scopus_names_list) + 2 * len(scopus_fullnames_list)}
+    for cache_status, cache_size in [('uncached', 0), ('cached', bp_gg.NORM_NAME_CACHE_SIZE)]:
+        for database, normalize_names in [('wos', _normalize_wos_names), ('scopus', _normalize_scopus_names)]:
+            set_norm_name_cache_size(cache_size)
+            bench_dict[f'{database} names {cache_status} (s)'], _ = _time_function(normalize_names,
+                                                                                  repeat=repeat)
+    set_norm_name_cache_size()
+    return bench_dict
+
+
+def _build_wos_reference(rng):
+    """Builds a synthetic WoS cited reference.
+
+    Args:
+        rng (random.Random): The random generator.
+    Returns:
+        (str): The built reference.
+    """
+    author = f"{rng.choice(_LASTNAMES)} {rng.choice(_FIRSTNAMES)[0]}"
+    journal = rng.choice(_JOURNALS).upper().replace(".", "")
+    ref_items_list = [author, str(rng.randint(1950, 2024)), journal]
+    if rng.random()<0.9:
+        ref_items_list.append(f"V{rng.randint(1, 500)}")
+    if rng.random()<0.9:
+        ref_items_list.append(f"P{rng.randint(1, 20000)}")
+    if rng.random()<0.7:
+        ref_items_list.append(f"DOI 10.{rng.randint(1000, 9999)}/j.{rng.randint(1, 99999)}")
+    return ", ".join(ref_items_list)
+
+
+def _build_scopus_reference(rng):
+    """Builds a synthetic Scopus cited reference using randomly the old 
+    or the new (since 07-2023) Scopus coding.
+
+    Args:
+        rng (random.Random): The random generator.
+    Returns:
+        (str): The built reference.
+    """
+    authors_list = [(rng.choice(_LASTNAMES), rng.choice(_FIRSTNAMES)[0])
+                    for _ in range(rng.randint(1, 4))]
+    title = "Synthetic title " + str(rng.randint(1, 100000))
+    year = rng.randint(1950, 2024)
+    journal = rng.choice(_JOURNALS) if rng.random()<0.9 else rng.choice(_PROCEEDINGS)
+    first_page = rng.randint(1, 20000)
+    pages = f"pp. {first_page}-{first_page + rng.randint(1, 20)}"
+    if rng.random()<0.5:
+        # Old coding
+        authors = ", ".join(f"{last}, {first}." for last, first in authors_list)
+        return f"{authors}, {title}, ({year}) {journal}, {rng.randint(1, 500)}, {pages}"
+    # New coding
+    authors = ", ".join(f"{last} {first}." for last, first in authors_list)
+    return f"{authors}, {title}, {journal}, {rng.randint(1, 500)}, {pages}, ({year})"
+
+
+def _build_references_rawdata(pubs_nb, refs_per_pub=40, database="wos", seed=0,
+                              distinct_refs_rate=0.5):
+    """Builds synthetic rawdata restricted to the references column.
+
+    The references are drawn from a pool of distinct references which size is 
+    set by 'distinct_refs_rate' so that references are cited by several publications.
+
+    Args:
+        pubs_nb (int): The number of publications.
+        refs_per_pub (int): The mean number of references per publication (default: 40).
+        database (str): The database of the references coding, 'wos' or 'scopus' (default: 'wos').
+        seed (int): The seed of the random generator (default: 0).
+        distinct_refs_rate (float): The rate of distinct references (default: 0.5).
+    Returns:
+        (dataframe): The built rawdata.
+    """
+    rng = random.Random(seed)
+    if database=="wos":
+        build_reference = _build_wos_reference
+        ref_col = bp_sg.COLUMN_LABEL_WOS['references']
+    else:
+        build_reference = _build_scopus_reference
+        ref_col = bp_sg.COLUMN_LABEL_SCOPUS['references']
+    pool_size = max(1, int(pubs_nb * refs_per_pub * distinct_refs_rate))
+    refs_pool_list = [build_reference(rng) for _ in range(pool_size)]
+
+    rows_list = []
+    for _ in range(pubs_nb):
+        refs_nb = rng.randint(refs_per_pub // 2, refs_per_pub * 3 // 2)
+        rows_list.append("; ".join(rng.choice(refs_pool_list) for _ in range(refs_nb)))
+    rawdata_df = pd.DataFrame({ref_col: rows_list})
+    return rawdata_df
+
+
+def bench_references(refs_nb=1000000, refs_per_pub=40, repeat=1, seed=0):
+    """Times the parsing of the WoS and Scopus cited references.
+
+    Args:
+        refs_nb (int): The approximate number of synthetic references (default: 1000000).
+        refs_per_pub (int): The mean number of references per publication (default: 40).
+        repeat (int): The number of timed calls per database (default: 1).
+        seed (int): The seed of the random generator (default: 0).
+    Returns:
+        (dict): The best wall times in seconds keyed by database.
+    """
+    # Local library imports
+    from BiblioParsing.BiblioParsingScopus import _build_references_scopus
+    from BiblioParsing.BiblioParsingScopus import _set_scopus_parsing_cols
+    from BiblioParsing.BiblioParsingWos import _build_references_wos
+    from BiblioParsing.BiblioParsingWos import _set_wos_parsing_cols
+
+    pubs_nb = max(1, refs_nb // refs_per_pub)
+    bench_dict = {'references number': refs_nb}
+    for database, build_refs, set_cols in [("wos", _build_references_wos, _set_wos_parsing_cols),
+                                           ("scopus", _build_references_scopus, _set_scopus_parsing_cols)]:
+        cols_tup = set_cols()
+        pub_id_col = cols_tup[1]['pub_id_col']
+        rawdata_df = _build_references_rawdata(pubs_nb, refs_per_pub=refs_per_pub,
+                                               database=database, seed=seed)
+        corpus_df = rawdata_df.rename_axis(pub_id_col).reset_index()
+        bench_dict[f'{database} references parsing (s)'], _ = _time_function(build_refs, corpus_df,
+                                                                             cols_tup, repeat=repeat)
+    return bench_dict
+
+
+def bench_scopus_correction(rows_nb=50000, repeat=1, seed=0):
+    """Times the correction of the Scopus full rawdata performed when reading
+    the rawdata with the `read_database_scopus` function.
+
+    Args:
+        rows_nb (int): The number of synthetic publications (default: 50000).
+        repeat (int): The number of timed calls per step (default: 1).
+        seed (int): The seed of the random generator (default: 0).
+    Returns:
+        (dict): The best wall times in seconds keyed by correction step.
+    """
+    # Local library imports
+    from BiblioParsing.BiblioParsingScopus import _check_authors
+    from BiblioParsing.BiblioParsingScopus import _check_authors_with_affiliations
+    from BiblioParsing.BiblioParsingScopus import _correct_scopus_full_rawdata
+    from BiblioParsing.BiblioParsingScopus import _set_scopus_parsing_cols
+
+    cols_tup = _set_scopus_parsing_cols()
+    _, cols_dic, scopus_cols_dic = cols_tup
+    pub_id_col = cols_dic['pub_id_col']
+    scopus_cols_keys = ['scopus_auth_col', 'scopus_aff_col', 'scopus_auth_with_aff_col',
+                        'scopus_fullnames_col']
+    (scopus_auth_col, scopus_aff_col, scopus_auth_with_aff_col,
+     scopus_fullnames_col) = [scopus_cols_dic[key] for key in scopus_cols_keys]
+
+    rawdata_df = _build_scopus_authors_rawdata(rows_nb, seed=seed)
+    corpus_df = rawdata_df.rename_axis(pub_id_col).reset_index()
+
+    affil_check_cols = [pub_id_col, scopus_auth_col, scopus_aff_col, scopus_auth_with_aff_col]
+    auth_check_cols = [pub_id_col, scopus_auth_col, scopus_fullnames_col,
+                       scopus_aff_col, scopus_auth_with_aff_col]
+
+    bench_dict = {'rows number': rows_nb}
+    bench_dict['authors with affiliations check (s)'], _ = _time_function(_check_authors_with_affiliations,
+                                                                          corpus_df, affil_check_cols,
+                                                                          repeat=repeat)
+    bench_dict['authors check (s)'], _ = _time_function(_check_authors, corpus_df, auth_check_cols,
+                                                        repeat=repeat)
+    bench_dict['full correction (s)'], _ = _time_function(_correct_scopus_full_rawdata,
+                                                          rawdata_df.copy(), cols_tup, repeat=repeat)
+    return bench_dict
+
+
+def bench_standardize_address(rows_nb=50000, repeat=1, seed=0):
+    """Times the standardization of the addresses of the Scopus affiliations 
+    column with and without the cache of the `standardize_address` function 
+    and through the `standardize_addresses` batch function.
+
+    The cache size is reset to its default value at the end of the benchmark.
+
+    Args:
+        rows_nb (int): The number of synthetic publications (default: 50000).
+        repeat (int): The number of timed calls per case (default: 1).
+        seed (int): The seed of the random generator (default: 0).
+    Returns:
+        (dict): The best wall times in seconds keyed by case.
+    """
+    # Local library imports
+    from BiblioParsing.BiblioParsingUtils import set_std_address_cache_size
+    from BiblioParsing.BiblioParsingUtils import standardize_address
+    from BiblioParsing.BiblioParsingUtils import standardize_addresses
+
+    affil_col = bp_sg.COLUMN_LABEL_SCOPUS['affiliations']
+    rawdata_df = _build_scopus_authors_rawdata(rows_nb, seed=seed)
+    addresses_list = [address for row in rawdata_df[affil_col] for address in row.split('; ')]
+    addresses_series = pd.Series(addresses_list)
+
+    def _standardize_both_variants():
+        return [(standardize_address(address, add_unknown_country=False),
+                 standardize_address(address, add_unknown_country=True))
+                for address in addresses_list]
+
+    bench_dict = {'addresses number': len(addresses_list)}
+    set_std_address_cache_size(0)
+    bench_dict['both variants uncached (s)'], _ = _time_function(_standardize_both_variants,
+                                                                 repeat=repeat)
+    set_std_address_cache_size()
+    bench_dict['both variants cached (s)'], _ = _time_function(_standardize_both_variants,
+                                                               repeat=repeat)
+    set_std_address_cache_size()
+    bench_dict['batch (s)'], _ = _time_function(standardize_addresses, addresses_series,
+                                                repeat=repeat)
+    set_std_address_cache_size()
+    return bench_dict
+
+
+def _build_journal_names(rows_nb, journals_nb=2000, seed=0, variant_rate=0.3):
+    """Builds a list of synthetic normalized journal names with near-duplicate variants.
+
+    The variants are built from the base journal names by a character substitution, 
+    a word removal or a word addition.
+
+    Args:
+        rows_nb (int): The number of journal names.
+        journals_nb (int): The number of base journal names (default: 2000).
+        seed (int): The seed of the random generator (default: 0).
+        variant_rate (float): The rate of journal-name variants (default: 0.3).
+    Returns:
+        (list): The built journal names (str).
+    """
+    rng = random.Random(seed)
+    base_names_list = [" ".join(rng.choice(_JOURNAL_WORDS) for _ in range(rng.randint(2, 8)))
+                       for _ in range(journals_nb)]
+    names_list = []
+    for _ in range(rows_nb):
+        name = rng.choice(base_names_list)
+        if rng.random()<variant_rate:
+            variant_type = rng.randint(0, 2)
+            if variant_type==0:
+                char_idx = rng.randrange(len(name))
+                name = name[:char_idx] + rng.choice("aeiou") + name[char_idx + 1:]
+            elif variant_type==1 and " " in name:
+                words_list = name.split()
+                words_list.pop(rng.randrange(len(words_list)))
+                name = " ".join(words_list)
+            else:
+                name = name + " " + rng.choice(_JOURNAL_WORDS)
+        names_list.append(name)
+    return names_list
+
+
+def bench_journal_names(rows_nb=60000, journals_nb=2000, repeat=1, seed=0, similarity_scorer='difflib'):
+    """Times the setting of same journal names for similar journal names 
+    performed by the deduplication of the concatenated parsing data.
+
+    Args:
+        rows_nb (int): The number of synthetic publications (default: 60000).
+        journals_nb (int): The number of base journal names (default: 2000).
+        repeat (int): The number of timed calls (default: 1).
+        seed (int): The seed of the random generator (default: 0).
+        similarity_scorer (str): The name of the registered similarity scorer (default: 'difflib').
+    Returns:
+        (dict): The wall time in seconds and the numbers of distinct journal names.
+    """
+    # Local library imports
+    from BiblioParsing.BiblioParsingConcat import _set_dedup_cols
+    from BiblioParsing.BiblioParsingConcat import _setting_same_journal_name
+
+    cols_dic = _set_dedup_cols()
+    norm_journal_col, same_journal_col = cols_dic['norm_journal_col'], cols_dic['same_journal_col']
+    scorer = get_similarity_scorer(similarity_scorer)
+    journals_df = pd.DataFrame({norm_journal_col: _build_journal_names(rows_nb, journals_nb=journals_nb,
+                                                                       seed=seed)})
+
+    bench_dict = {'rows number': rows_nb,
+                  'initial distinct journals number': journals_df[norm_journal_col].nunique()}
+    bench_dict['same journal names setting (s)'], same_journal_df = _time_function(
+        _setting_same_journal_name, journals_df, norm_journal_col, same_journal_col,
+        scorer, repeat=repeat)
+    bench_dict['final distinct journals number'] = same_journal_df[same_journal_col].nunique()
+    return bench_dict
+
+
+def _build_title_vocabulary(words_nb, rng):
+    """Builds a vocabulary of synthetic words made of syllables with weights 
+    following a Zipf law as for natural language.
+
+    The words of the global '_TITLE_WORDS' are the most frequent ones.
+
+    Args:
+        words_nb (int): The number of synthetic words.
+        rng (random.Random): The random generator.
+    Returns:
+        (tup): (The words (list), The weights of the words (list)).
+    """
+    syllables_list = ["ab", "ac", "al", "an", "ar", "bo", "ca", "ce", "chi", "co", "da", "de", "di",
+                      "el", "en", "er", "fi", "ga", "ge", "hy", "id", "in", "is", "ka", "la", "le",
+                      "lo", "ma", "me", "mi", "mo", "na", "ne", "no", "ox", "pa", "pe", "po", "ra",
+                      "re", "ri", "ro", "sa", "se", "si", "ta", "te", "ti", "to", "tra", "un", "va",
+                      "ve", "vi", "xy", "ze"]
+    words_set = set(_TITLE_WORDS)
+    words_list = list(_TITLE_WORDS)
+    while len(words_list)<words_nb:
+        word = "".join(rng.choice(syllables_list) for _ in range(rng.randint(2, 5)))
+        if word not in words_set:
+            words_set.add(word)
+            words_list.append(word)
+    weights_list = [1 / (rank + 1) for rank in range(len(words_list))]
+    return words_list, weights_list
+
+
+def _build_titles(rows_nb, titles_nb=None, seed=0, variant_rate=0.2, words_nb=20000):
+    """Builds a list of synthetic publication titles with near-duplicate variants.
+
+    The variants are built from the base titles by a character substitution, 
+    a word case change, a word removal or a punctuation change. 
+    Some base titles are parts of a series of publications.
+
+    Args:
+        rows_nb (int): The number of titles.
+        titles_nb (int): The number of base titles (default: None for 'rows_nb' times 0.8).
+        seed (int): The seed of the random generator (default: 0).
+        variant_rate (float): The rate of title variants (default: 0.2).
+        words_nb (int): The number of words of the titles vocabulary (default: 20000).
+    Returns:
+        (list): The built titles (str).
+    """
+    rng = random.Random(seed)
+    if titles_nb is None:
+        titles_nb = max(1, int(rows_nb * 0.8))
+    vocabulary_list, weights_list = _build_title_vocabulary(words_nb, rng)
+    base_titles_list = []
+    for _ in range(titles_nb):
+        title = " ".join(rng.choices(vocabulary_list, weights=weights_list,
+                                     k=rng.randint(4, 14))).capitalize()
+        if rng.random()<0.02:
+            title = title + f": part {rng.randint(1, 3)}"
+        base_titles_list.append(title)
+    titles_list = []
+    for _ in range(rows_nb):
+        title = rng.choice(base_titles_list)
+        if rng.random()<variant_rate:
+            variant_type = rng.randint(0, 3)
+            words_list = title.split()
+            word_idx = rng.randrange(len(words_list))
+            if variant_type==0:
+                char_idx = rng.randrange(len(title))
+                title = title[:char_idx] + rng.choice("aeiou") + title[char_idx + 1:]
+            elif variant_type==1:
+                words_list[word_idx] = words_list[word_idx].upper()
+                title = " ".join(words_list)
+            elif variant_type==2 and len(words_list)>1:
+                words_list.pop(word_idx)
+                title = " ".join(words_list)
+            else:
+                title = title.replace(" ", ", ", 1) + "."
+        titles_list.append(title)
+    return titles_list
+
+
+def bench_same_titles(rows_nb=100000, repeat=1, seed=0, similarity_scorer='difflib', jaccard_threshold=None):
+    """Times the setting of same titles for similar publication titles 
+    performed by the deduplication of the concatenated parsing data.
+
+    Args:
+        rows_nb (int): The number of synthetic publications (default: 100000).
+        repeat (int): The number of timed calls (default: 1).
+        seed (int): The seed of the random generator (default: 0).
+        similarity_scorer (str): The name of the registered similarity scorer (default: 'difflib').
+        jaccard_threshold (float): The minimum Jaccard similarity of the tokens of the compared titles \
+        (default: None for the exact comparison).
+    Returns:
+        (dict): The wall time in seconds and the numbers of distinct titles.
+    """
+    # Local library imports
+    from BiblioParsing.BiblioParsingConcat import _set_dedup_cols
+    from BiblioParsing.BiblioParsingConcat import _setting_same_article_title
+
+    cols_dic = _set_dedup_cols()
+    title_col, lc_title_col = cols_dic['title_col'], cols_dic['lc_title_col']
+    scorer = get_similarity_scorer(similarity_scorer)
+    norm_title = lambda x: x.strip()
+    titles_df = pd.DataFrame({title_col: _build_titles(rows_nb, seed=seed)})
+
+    bench_dict = {'rows number': rows_nb,
+                  'initial distinct titles number': titles_df[title_col].nunique()}
+    bench_dict['same titles setting (s)'], same_title_df = _time_function(
+        _setting_same_article_title, titles_df, title_col, lc_title_col,
+        scorer, norm_title, jaccard_threshold=jaccard_threshold, repeat=repeat)
+    bench_dict['final distinct titles number'] = same_title_df[lc_title_col].nunique()
+    return bench_dict
+
+
+def build_articles_rawdata(articles_nb, seed=0, duplicate_rate=0.3, max_copies=2, unknown_rate=0.2,
+                           variant_rate=0.0, words_nb=None):
+    """Builds synthetic concatenated publications data as got after the setting 
+    of same journal names and same titles by the deduplication process.
+
+    The duplicates are copies of publications where the DOI, the ISSN, 
+    the document type or the first author may be set to 'UNKNOWN' 
+    or changed to a variant and where the title and the journal name 
+    may be changed to a variant as between databases.
+
+    Args:
+        articles_nb (int): The number of publications.
+        seed (int): The seed of the random generator (default: 0).
+        duplicate_rate (float): The rate of duplicated publications (default: 0.3).
+        max_copies (int): The maximum number of copies of a duplicated publication (default: 2).
+        unknown_rate (float): The rate of unknown values in the copies (default: 0.2).
+        variant_rate (float): The rate of title and journal-name variants in the copies (default: 0.0).
+        words_nb (int): The number of words of the titles vocabulary built through \
+        the `_build_title_vocabulary` internal function (default: None for the global '_TITLE_WORDS').
+    Returns:
+        (dataframe): The publications data with the columns used by the deduplication.
+    """
+    # Local library imports
+    from BiblioParsing.BiblioParsingConcat import _set_dedup_cols
+
+    cols_dic = _set_dedup_cols()
+    rng = random.Random(seed)
+    doctypes_list = ["Article", "Review", "Proceedings Paper", "Conference Paper", "Article; Early Access"]
+    journals_list = [" ".join(rng.choice(_JOURNAL_WORDS) for _ in range(rng.randint(2, 6)))
+                     for _ in range(max(10, articles_nb // 50))]
+    issns_dict = {journal: f"{rng.randint(1000, 9999)}-{rng.randint(100, 999)}X" for journal in journals_list}
+    if words_nb:
+        words_list, weights_list = _build_title_vocabulary(words_nb, rng)
+    else:
+        words_list, weights_list = _TITLE_WORDS, None
+
+    def _maybe_unknown(value):
+        return bp_sg.UNKNOWN if rng.random()<unknown_rate else value
+
+    rows_list = []
+    while len(rows_list)<articles_nb:
+        base_idx = len(rows_list)
+        journal = rng.choice(journals_list)
+        lastname, firstname = rng.choice(_LASTNAMES), rng.choice(_FIRSTNAMES)
+        base_row = [f"{lastname} {firstname[0]}",
+                    str(rng.randint(2015, 2024)),
+                    str(rng.randint(1, 2000)),
+                    _maybe_unknown(f"10.{rng.randint(1000, 9999)}/j.pub.{base_idx}"),
+                    rng.choice(doctypes_list),
+                    " ".join(rng.choices(words_list, weights=weights_list, k=rng.randint(5, 12))),
+                    _maybe_unknown(issns_dict[journal]),
+                    journal]
+        rows_list.append(base_row)
+        if rng.random()<duplicate_rate:
+            for _ in range(rng.randint(1, max_copies)):
+                authors, year, page, doi, doctype, title, issn, journal = base_row
+                if rng.random()<0.5:
+                    authors = f"{lastname} {firstname[:2]}"
+                doi = _maybe_unknown(doi.upper() if rng.random()<0.3 else doi)
+                doctype = _maybe_unknown(doctype)
+                if rng.random()<variant_rate:
+                    title = title.replace(" ", ", ", 1) + "."
+                if rng.random()<variant_rate and " " in journal:
+                    journal = journal.rsplit(" ", 1)[0]
+                rows_list.append([authors, year, page, doi, doctype, title, _maybe_unknown(issn), journal])
+    rows_list = rows_list[:articles_nb]
+    rng.shuffle(rows_list)
+
+    cols_list = [cols_dic[key] for key in ['authors_col', 'year_col', 'page_col', 'doi_col', 'doc_type_col',
+                                           'title_col', 'issn_col', 'same_journal_col']]
+    articles_df = pd.DataFrame(rows_list, columns=cols_list)
+    articles_df.insert(0, cols_dic['pub_id_col'], np.arange(articles_nb))
+    articles_df[cols_dic['lc_title_col']] = articles_df[cols_dic['title_col']]
+    return articles_df
+
+
+def _merge_articles(articles_df, cols_dic):
+    """Chains the merging and dropping steps of the deduplication of the publications 
+    as performed by the `_deduplicate_articles` function imported from the 
+    `BiblioParsingConcat` module after the setting of same journal names and titles.
+    """
+    # Local library imports
+    import BiblioParsing.BiblioParsingConcat as bp_concat
+
+    (pub_id_col, authors_col, page_col, doi_col, doc_type_col, title_col, issn_col,
+     lc_title_col, lc_doc_type_col, lc_doi_col, same_journal_col) = [cols_dic[key] for key in
+        ['pub_id_col', 'authors_col', 'page_col', 'doi_col', 'doc_type_col', 'title_col', 'issn_col',
+         'lc_title_col', 'lc_doc_type_col', 'lc_doi_col', 'same_journal_col']]
+    df = bp_concat._setting_issn(articles_df, same_journal_col, issn_col)
+    df[lc_title_col] = df[lc_title_col].str.lower()
+    df[lc_doc_type_col] = df[doc_type_col].str.lower()
+    df = bp_concat._setting_doi(df, lc_title_col, doi_col)
+    df = bp_concat._setting_doc_type(df, doi_col, doc_type_col)
+    df = bp_concat._setting_same_doi(df, [authors_col, lc_doc_type_col, issn_col, page_col,
+                                          doi_col, lc_title_col, lc_doi_col])
+    df = bp_concat._setting_same_first_author_name(df, [lc_doc_type_col, issn_col, lc_title_col, page_col,
+                                                        pub_id_col, authors_col, lc_doi_col])
+    df = bp_concat._dropping_duplicate_article1(df, [lc_doi_col, title_col, doc_type_col,
+                                                     lc_title_col, lc_doc_type_col])
+    df = bp_concat._dropping_duplicate_article2(df, [lc_title_col, lc_doc_type_col, same_journal_col,
+                                                     lc_doi_col, pub_id_col])
+    return df
+
+
+def bench_articles_merging(articles_nbs_list=(20000, 100000, 500000), repeat=1, seed=0):
+    """Times the merging of the available ISSN, DOI, document type and first author values 
+    and the dropping of the duplicated publications performed by the deduplication 
+    of the concatenated parsing data.
+
+    Args:
+        articles_nbs_list (list): The numbers (int) of synthetic publications \
+        (default: (20000, 100000, 500000)).
+        repeat (int): The number of timed calls (default: 1).
+        seed (int): The seed of the random generator (default: 0).
+    Returns:
+        (list): The dicts of the wall time in seconds and of the numbers of publications \
+        for each number of synthetic publications.
+    """
+    # Local library imports
+    from BiblioParsing.BiblioParsingConcat import _set_dedup_cols
+
+    cols_dic = _set_dedup_cols()
+    bench_dicts_list = []
+    for articles_nb in articles_nbs_list:
+        articles_df = build_articles_rawdata(articles_nb, seed=seed)
+        bench_dict = {'initial publications number': articles_nb}
+        bench_dict['articles merging (s)'], dedup_df = _time_function(_merge_articles, articles_df,
+                                                                      cols_dic, repeat=repeat)
+        bench_dict['final publications number'] = len(dedup_df)
+        bench_dicts_list.append(bench_dict)
+    return bench_dicts_list
+
+
+def bench_exact_linking(articles_nb=20000, repeat=1, seed=0):
+    """Times the deduplication of synthetic publications with and without 
+    the exact linking by DOI and by first author, year, page and ISSN 
+    before the similarity stages.
+
+    Args:
+        articles_nb (int): The number of synthetic publications (default: 20000).
+        repeat (int): The number of timed calls (default: 1).
+        seed (int): The seed of the random generator (default: 0).
+    Returns:
+        (dict): The wall times in seconds and the numbers of kept publications.
+    """
+    # Local library imports
+    from BiblioParsing.BiblioParsingConcat import _deduplicate_articles
+    from BiblioParsing.BiblioParsingConcat import _set_dedup_cols
+
+    cols_dic = _set_dedup_cols()
+    articles_df = build_articles_rawdata(articles_nb, seed=seed, duplicate_rate=0.5,
+                                          variant_rate=0.5, words_nb=20000)
+    articles_df = articles_df.rename(columns={cols_dic['same_journal_col']: cols_dic['norm_journal_col']})
+    articles_df = articles_df.drop(columns=[cols_dic['lc_title_col']])
+
+    bench_dict = {'initial publications number': articles_nb}
+    for exact_linking in [False, True]:
+        label = 'with exact linking' if exact_linking else 'without exact linking'
+        bench_dict[f'deduplication {label} (s)'], (dedup_df, _) = _time_function(
+            _deduplicate_articles, articles_df, cols_dic, exact_linking=exact_linking, repeat=repeat)
+        bench_dict[f'final publications number {label}'] = len(dedup_df)
+    return bench_dict
+
+
+def _build_parsing_dict(pubs_nb, seed=0):
+    """Builds synthetic parsing data restricted to the articles, authors, addresses, 
+    countries, authors keywords and references items.
+
+    Args:
+        pubs_nb (int): The number of publications.
+        seed (int): The seed of the random generator (default: 0).
+    Returns:
+        (dict): The data (dataframe) keyed by parsing item (str).
+    """
+    rng = random.Random(seed)
+    items_list = [bp_sg.PARSING_ITEMS_LIST[x] for x in [0, 1, 2, 3, 6, 11]]
+    articles_item, authors_item, addresses_item, countries_item, keywords_item, references_item = items_list
+
+    articles_list, authors_list, addresses_list, countries_list = [], [], [], []
+    keywords_list, references_list = [], []
+    for pub_id in range(pubs_nb):
+        lastname, firstname = rng.choice(_LASTNAMES), rng.choice(_FIRSTNAMES)
+        journal = rng.choice(_JOURNALS)
+        articles_list.append([pub_id, f"{lastname} {firstname[0]}", str(rng.randint(2015, 2024)),
+                              journal, str(rng.randint(1, 50)), str(rng.randint(1, 2000)),
+                              f"10.{rng.randint(1000, 9999)}/j.pub.{pub_id}", "Article", "English",
+                              " ".join(rng.choices(_TITLE_WORDS, k=rng.randint(5, 12))),
+                              f"{rng.randint(1000, 9999)}-{rng.randint(100, 999)}X"])
+        for auth_idx in range(rng.randint(1, 6)):
+            authors_list.append([pub_id, auth_idx, f"{rng.choice(_LASTNAMES)} {rng.choice(_FIRSTNAMES)[0]}"])
+        for addr_idx, address in enumerate(rng.sample(_AFFILIATIONS, rng.randint(1, 3))):
+            addresses_list.append([pub_id, addr_idx, address])
+            countries_list.append([pub_id, addr_idx, address.split(", ")[-1]])
+        if rng.random()<0.1:
+            # Unknown author index as set by the WoS parsing
+            authors_list.append([pub_id, bp_sg.UNKNOWN, bp_sg.UNKNOWN])
+        for keyword in rng.sample(_TITLE_WORDS, rng.randint(2, 6)):
+            keywords_list.append([pub_id, keyword])
+        for _ in range(rng.randint(20, 60)):
+            references_list.append([pub_id, f"{rng.choice(_LASTNAMES)} {rng.choice(_FIRSTNAMES)[0]}",
+                                    rng.randint(1950, 2024), rng.choice(_JOURNALS),
+                                    str(rng.randint(1, 500)), str(rng.randint(1, 9000))])
+
+    parsing_dict = {articles_item  : pd.DataFrame(articles_list, columns=bp_sg.COL_NAMES['articles']),
+                    authors_item   : pd.DataFrame(authors_list, columns=bp_sg.COL_NAMES['authors']),
+                    addresses_item : pd.DataFrame(addresses_list, columns=bp_sg.COL_NAMES['address']),
+                    countries_item : pd.DataFrame(countries_list, columns=bp_sg.COL_NAMES['country']),
+                    keywords_item  : pd.DataFrame(keywords_list, columns=bp_sg.COL_NAMES['keywords']),
+                    references_item: pd.DataFrame(references_list, columns=bp_sg.COL_NAMES['references']),
+                   }
+    return parsing_dict
+
+
+def bench_parsing_dict_formats(pubs_nb=20000, save_extents=("dat", "parquet", "feather"), repeat=1, seed=0):
+    """Times the saving and the reading of synthetic parsing data through 
+    the `save_parsing_dict` and `read_parsing_dict` functions and gets the files size 
+    for each of the files formats.
+
+    Args:
+        pubs_nb (int): The number of synthetic publications (default: 20000).
+        save_extents (tup): The compared files formats (str) \
+        (default: ("dat", "parquet", "feather")).
+        repeat (int): The number of timed calls (default: 1).
+        seed (int): The seed of the random generator (default: 0).
+    Returns:
+        (dict): The dicts of the writing and reading wall times in seconds \
+        and of the files size in MB keyed by files format.
+    """
+    # Local library imports
+    from BiblioParsing.DemoUtils import read_parsing_dict
+    from BiblioParsing.DemoUtils import save_parsing_dict
+
+    parsing_dict = _build_parsing_dict(pubs_nb, seed=seed)
+    item_filename_dict = {item: item for item in parsing_dict.keys()}
+    bench_dict = {'publications number': pubs_nb,
+                  'rows number': sum(len(item_df) for item_df in parsing_dict.values())}
+    for save_extent in save_extents:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            parsing_path = Path(tmp_dir)
+            write_time, _ = _time_function(save_parsing_dict, parsing_dict, parsing_path,
+                                           item_filename_dict, save_extent, repeat=repeat)
+            read_time, read_dict = _time_function(read_parsing_dict, parsing_path,
+                                                  item_filename_dict, save_extent, repeat=repeat)
+            files_size = sum(file.stat().st_size for file in parsing_path.iterdir())
+        bench_dict[save_extent] = {'write (s)': write_time,
+                                   'read (s)' : read_time,
+                                   'size (MB)': files_size / 2**20,
+                                   'read rows number': sum(len(item_df) for item_df in read_dict.values())}
+    return bench_dict
+
+
+def _get_rows_nb(result):
+    """Gets the rows number of the data returned by a timed stage.
+
+    Args:
+        result: The result of the stage as a dataframe, a dict of dataframes \
+        or a tuple starting with one of them.
+    Returns:
+        (int): The rows number or None if not available.
+    """
+    if isinstance(result, tuple) and result:
+        result = result[0]
+    if isinstance(result, pd.DataFrame):
+        return len(result)
+    if isinstance(result, dict):
+        return sum(len(item_df) for item_df in result.values() if isinstance(item_df, pd.DataFrame))
+    return None
+
+
+def _time_stage(stages_report, stage, funct, *args, repeat=1, **kwargs):
+    """Times the call of a function as a stage of a stages report through the `start_stage` 
+    and `end_stage` functions imported from `BiblioParsingInstrumentation` module.
+
+    Only the stage record of the best wall time among the 'repeat' calls is kept.
+    When the function raises an exception, such as for missing nltk data or missing 
+    reference files, the error is recorded instead of the rows number.
+
+    Args:
+        stages_report (dict): The stages report built by the `init_stages_report` function.
+        stage (str): The label of the stage.
+        funct (function): The function to time.
+        repeat (int): The number of timed calls (default: 1).
+    Returns:
+        (tup): (The result of the last call or None if failed, The kept stage record (dict)).
+    """
+    # Local library imports
+    from BiblioParsing.BiblioParsingInstrumentation import end_stage
+    from BiblioParsing.BiblioParsingInstrumentation import start_stage
+
+    stage_records_list = []
+    result = None
+    for _ in range(repeat):
+        started_stage = start_stage(stages_report, stage)
+        try:
+            result = funct(*args, **kwargs)
+        except Exception as error:
+            stage_record = end_stage(started_stage)
+            stage_record['error'] = f"{type(error).__name__}: {' '.join(str(error).split())}"
+            print(f"      - {stage} failed with {stage_record['error'][:100]}")
+            return None, stage_record
+        stage_records_list.append(end_stage(started_stage, rows_dict={'result': _get_rows_nb(result)}))
+        stages_report['stages'].pop()
+    stage_record = min(stage_records_list, key=lambda record: record['wall time (s)'])
+    stages_report['stages'].append(stage_record)
+    return result, stage_record
+
+
+def bench_parsing_stages(pubs_nbs_list=(1000, 10000, 100000), duplicate_rate=0.3, repeat=1, seed=0,
+                         bench_file_path=None):
+    """Times each stage of the parsing process on synthetic WoS and Scopus corpuses 
+    built by the `save_synthetic_corpuses` function imported from `synthetic_utils` 
+    module for each of the passed numbers of publications.
+
+    The timed stages are the reading of the rawdata files, each `_build_*` function 
+    of the WoS and Scopus parsing, the `build_title_keywords` and 
+    `clean_authors_countries_institutions` functions, the concatenation of the parsing data 
+    through the `concatenate_parsing` function and the deduplication steps through 
+    the `_deduplicate_articles` and `build_norm_raw_institutions` functions.
+    The timings are recorded for each number of publications as a stages report 
+    of the `BiblioParsingInstrumentation` module with the wall time, the CPU time, 
+    the peak-RSS increase and the rows number of each stage. 
+    The input of the `clean_authors_countries_institutions` function is rebuilt 
+    from the WoS authors-with-institutions data with one row per author address.
+
+    Args:
+        pubs_nbs_list (list): The numbers (int) of synthetic publications per database \
+        (default: (1000, 10000, 100000)).
+        duplicate_rate (float): The rate of Scopus publications common to the WoS corpus (default: 0.3).
+        repeat (int): The number of timed calls per stage (default: 1).
+        seed (int): The seed of the random generator (default: 0).
+        bench_file_path (path): The full path of the json file where the stages reports are added \
+        through the `save_stages_report` function imported from `BiblioParsingInstrumentation` \
+        module so that the timings can be compared between commits (default: None).
+    Returns:
+        (list): The stages reports (dict) for each number of synthetic publications.
+    """
+    # Local library imports
+    import BiblioParsing.BiblioGeneralGlobals as bp_gg
+    import BiblioParsing.BiblioParsingScopus as bp_scopus
+    import BiblioParsing.BiblioParsingWos as bp_wos
+    from BiblioParsing.BiblioParsingConcat import _deduplicate_articles
+    from BiblioParsing.BiblioParsingConcat import _set_dedup_cols
+    from BiblioParsing.BiblioParsingConcat import concatenate_parsing
+    from BiblioParsing.BiblioParsingInstitutions import build_norm_raw_institutions
+    from BiblioParsing.BiblioParsingInstrumentation import init_stages_report
+    from BiblioParsing.BiblioParsingInstrumentation import save_stages_report
+    from synthetic_utils import save_synthetic_corpuses
+    from BiblioParsing.BiblioParsingUtils import build_title_keywords
+    from BiblioParsing.BiblioParsingUtils import clean_authors_countries_institutions
+
+    items_list = [bp_sg.PARSING_ITEMS_LIST[x] for x in range(12)]
+    (articles_item, authors_item, addresses_item, countries_item, institutions_item,
+     auth_inst_item, authors_kw_item, index_kw_item, title_kw_item, subjects_item,
+     sub_subjects_item, references_item) = items_list
+    ref_files_path = Path(bp_scopus.__file__).parent / Path(bp_gg.REP_UTILS)
+    scopus_cat_codes_path = ref_files_path / Path(bp_sg.SCOPUS_CAT_CODES)
+    scopus_journals_issn_cat_path = ref_files_path / Path(bp_sg.SCOPUS_JOURNALS_ISSN_CAT)
+    title_alias = bp_sg.COL_NAMES['temp_col'][2]
+    address_alias = bp_sg.COL_NAMES['auth_inst'][2]
+
+    stages_reports_list = []
+    for pubs_nb in pubs_nbs_list:
+        print(f"  - Benchmark of the parsing stages for {pubs_nb} publications per database")
+        stages_report = init_stages_report(f"parsing stages benchmark - {pubs_nb} publications per database")
+        stages_report['publications number'] = pubs_nb
+        stages_report['duplicate rate'] = duplicate_rate
+        stages_report['seed'] = seed
+        parsing_dicts_list = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            wos_rawdata_path, scopus_rawdata_path = Path(tmp_dir) / "wos", Path(tmp_dir) / "scopus"
+            save_synthetic_corpuses(wos_rawdata_path, scopus_rawdata_path, pubs_nb,
+                                    duplicate_rate=duplicate_rate, seed=seed)
+
+            for database, db_module, rawdata_path in [(bp_sg.WOS, bp_wos, wos_rawdata_path),
+                                                      (bp_sg.SCOPUS, bp_scopus, scopus_rawdata_path)]:
+                db_suffix = database.lower()
+                cols_tup = getattr(db_module, f"_set_{db_suffix}_parsing_cols")()
+                if database==bp_sg.WOS:
+                    read_tup, _ = _time_stage(stages_report, "read_database_wos", bp_wos.read_database_wos,
+                                              rawdata_path, wos_ids=True, repeat=repeat)
+                else:
+                    read_tup, _ = _time_stage(stages_report, "read_database_scopus",
+                                              bp_scopus.read_database_scopus, rawdata_path,
+                                              correct_data=True, scopus_ids=True, repeat=repeat)
+                corpus_df = read_tup[0]
+
+                def _time_build(funct_name, *args, **kwargs):
+                    result, _ = _time_stage(stages_report, funct_name, getattr(db_module, funct_name),
+                                            corpus_df, *args, repeat=repeat, **kwargs)
+                    return result
+
+                parsing_dict = {}
+                parsing_dict[articles_item] = _time_build(f"_build_articles_{db_suffix}", cols_tup)
+                parsing_dict[authors_item] = _time_build(f"_build_authors_{db_suffix}", {}, cols_tup)
+                addresses_tup = _time_build(f"_build_addresses_countries_institutions_{db_suffix}", {},
+                                            cols_tup, progress_hook='silent')
+                if addresses_tup is not None:
+                    (parsing_dict[addresses_item], parsing_dict[countries_item],
+                     parsing_dict[institutions_item]) = addresses_tup
+                parsing_dict[auth_inst_item] = _time_build(f"_build_authors_countries_institutions_{db_suffix}",
+                                                           {}, cols_tup, progress_hook='silent')
+                keywords_tup = _time_build(f"_build_keywords_{db_suffix}", {}, cols_tup)
+                if keywords_tup is not None:
+                    (parsing_dict[authors_kw_item], parsing_dict[index_kw_item],
+                     parsing_dict[title_kw_item]) = keywords_tup
+                if database==bp_sg.WOS:
+                    parsing_dict[subjects_item] = _time_build("_build_subjects_wos", {}, cols_tup)
+                    parsing_dict[sub_subjects_item] = _time_build("_build_sub_subjects_wos", {}, cols_tup)
+                else:
+                    parsing_dict[subjects_item] = _time_build("_build_subjects_scopus", scopus_cat_codes_path,
+                                                              scopus_journals_issn_cat_path, {}, cols_tup)
+                    parsing_dict[sub_subjects_item] = _time_build("_build_sub_subjects_scopus",
+                                                                  scopus_cat_codes_path,
+                                                                  scopus_journals_issn_cat_path, {}, cols_tup)
+                parsing_dict[references_item] = _time_build(f"_build_references_{db_suffix}", cols_tup)
+                parsing_dicts_list.append({item: item_df for item, item_df in parsing_dict.items()
+                                           if item_df is not None})
+
+                if database==bp_sg.WOS:
+                    title_col = bp_sg.COLUMN_LABEL_WOS['title']
+                    title_df = pd.DataFrame({title_alias: corpus_df[title_col].fillna('')})
+                    _time_stage(stages_report, "build_title_keywords", build_title_keywords, title_df,
+                                repeat=repeat)
+                    wos_auth_inst_df = parsing_dict[auth_inst_item]
+                    if wos_auth_inst_df is not None:
+                        auth_addr_df = wos_auth_inst_df.copy()
+                        auth_addr_df[address_alias] = auth_addr_df[address_alias].str.split("; ")
+                        auth_addr_df = auth_addr_df.explode(address_alias, ignore_index=True)
+                        _time_stage(stages_report, "clean_authors_countries_institutions",
+                                    clean_authors_countries_institutions, auth_addr_df, repeat=repeat)
+
+        concat_parsing_dict, _ = _time_stage(stages_report, "concatenate_parsing", concatenate_parsing,
+                                             *parsing_dicts_list, repeat=repeat)
+        if concat_parsing_dict is not None:
+            if articles_item in concat_parsing_dict:
+                _time_stage(stages_report, "_deduplicate_articles", _deduplicate_articles,
+                            concat_parsing_dict[articles_item], _set_dedup_cols(),
+                            progress_hook='silent', repeat=repeat)
+            if addresses_item in concat_parsing_dict:
+                _time_stage(stages_report, "build_norm_raw_institutions", build_norm_raw_institutions,
+                            concat_parsing_dict[addresses_item], progress_hook='silent', repeat=repeat)
+
+        if bench_file_path:
+            save_stages_report(stages_report, bench_file_path)
+        stages_reports_list.append(stages_report)
+    return stages_reports_list
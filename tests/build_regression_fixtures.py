@@ -0,0 +1,124 @@
+"""Builds the fixtures of the regression tests that compare the outputs of rewritten
+internal functions with the outputs of these functions before their rewriting.
+
+The inputs are built through the synthetic rawdata helpers of the `benchmark_utils`
+module:
+
+    python tests/build_regression_fixtures.py inputs
+
+The expected outputs are then built from these inputs by the functions of a tree checked out
+at the commit preceding the rewriting, this tree being set first in the python path:
+
+    PYTHONPATH=<baseline tree> python tests/build_regression_fixtures.py expected
+"""
+
+# Standard library imports
+import itertools
+import sys
+
+# 3rd party imports
+import pandas as pd
+
+# Local imports
+from regression_utils import REGRESSION_FIXTURES_PATH
+from regression_utils import read_fixture_df
+from regression_utils import save_fixture_df
+
+
+SCOPUS_CORRECTION_ROWS_NB = 500
+SCOPUS_CORRECTION_IRREGULAR_RATE = 0.2
+SCOPUS_CORRECTION_EXPECTED_FILES = ["corpus", "corrected_authors", "corrected_addresses"]
+REFERENCES_PUBS_NB = {"wos": 150, "scopus": 1000}
+REFERENCES_PER_PUB = {"wos": 30, "scopus": 5}
+DEDUPLICATION_FIXTURES_DICT = {"default": dict(articles_nb=400, seed=0),
+                               "variants": dict(articles_nb=400, seed=1, duplicate_rate=0.5,
+                                                variant_rate=0.5, words_nb=20000),
+                               "unknowns": dict(articles_nb=500, seed=2, duplicate_rate=0.5,
+                                                max_copies=3, unknown_rate=0.4, variant_rate=0.3)}
+SIMILARITY_CALIBRATION_NAMES_NB = 600
+SIMILARITY_CALIBRATION_BASE_NAMES_NB = 150
+SIMILARITY_CALIBRATION_MIN_RATIO = 0.5
+
+
+def build_inputs():
+    """Builds the input fixtures."""
+    # Local library imports
+    from BiblioParsing.BiblioParsingConcat import _set_dedup_cols
+    from BiblioParsing.BiblioParsingSimilarity import get_similarity_scorer
+    from benchmark_utils import build_articles_rawdata
+    from benchmark_utils import _build_journal_names
+    from benchmark_utils import _build_references_rawdata
+    from benchmark_utils import _build_scopus_authors_rawdata
+    from benchmark_utils import _build_titles
+
+    rawdata_df = _build_scopus_authors_rawdata(SCOPUS_CORRECTION_ROWS_NB, seed=0,
+                                               irregular_rate=SCOPUS_CORRECTION_IRREGULAR_RATE)
+    save_fixture_df(rawdata_df, REGRESSION_FIXTURES_PATH / "scopus_correction_input.dat")
+
+    for database in ["wos", "scopus"]:
+        rawdata_df = _build_references_rawdata(REFERENCES_PUBS_NB[database],
+                                               refs_per_pub=REFERENCES_PER_PUB[database],
+                                               database=database, seed=0)
+        save_fixture_df(rawdata_df, REGRESSION_FIXTURES_PATH / f"{database}_references_input.dat")
+
+    cols_dic = _set_dedup_cols()
+    for fixture, kwargs in DEDUPLICATION_FIXTURES_DICT.items():
+        articles_df = build_articles_rawdata(**kwargs)
+        articles_df = articles_df.rename(columns={cols_dic['same_journal_col']: cols_dic['norm_journal_col']})
+        articles_df = articles_df.drop(columns=[cols_dic['lc_title_col']])
+        save_fixture_df(articles_df, REGRESSION_FIXTURES_PATH / f"deduplication_{fixture}_input.dat")
+
+    # Keeping the pairs of journal names and of titles close enough for the scorers decisions to matter
+    journal_names_list = _build_journal_names(SIMILARITY_CALIBRATION_NAMES_NB,
+                                              journals_nb=SIMILARITY_CALIBRATION_BASE_NAMES_NB,
+                                              seed=0, variant_rate=0.5)
+    titles_list = [title.lower() for title in _build_titles(SIMILARITY_CALIBRATION_NAMES_NB,
+                                                            titles_nb=SIMILARITY_CALIBRATION_BASE_NAMES_NB,
+                                                            seed=0, variant_rate=0.5, words_nb=2000)]
+    scorers_list = [get_similarity_scorer(name) for name in ['difflib', 'lcs']]
+    pairs_list = []
+    for names_list in [journal_names_list, titles_list]:
+        for a, b in itertools.combinations(sorted(set(names_list)), 2):
+            if max(scorer.ratio(a, b) for scorer in scorers_list)>SIMILARITY_CALIBRATION_MIN_RATIO:
+                pairs_list.append((a, b))
+    save_fixture_df(pd.DataFrame(pairs_list, columns=["a", "b"]),
+                    REGRESSION_FIXTURES_PATH / "similarity_calibration_pairs.dat")
+
+
+def build_expected():
+    """Builds the expected-output fixtures from the input fixtures."""
+    # Local library imports
+    from BiblioParsing.BiblioParsingConcat import _deduplicate_articles
+    from BiblioParsing.BiblioParsingConcat import _set_dedup_cols
+    from BiblioParsing.BiblioParsingScopus import _build_references_scopus
+    from BiblioParsing.BiblioParsingScopus import _correct_scopus_full_rawdata
+    from BiblioParsing.BiblioParsingScopus import _set_scopus_parsing_cols
+    from BiblioParsing.BiblioParsingWos import _build_references_wos
+    from BiblioParsing.BiblioParsingWos import _set_wos_parsing_cols
+
+    rawdata_df = read_fixture_df(REGRESSION_FIXTURES_PATH / "scopus_correction_input.dat")
+    outputs_tup = _correct_scopus_full_rawdata(rawdata_df, _set_scopus_parsing_cols())
+    for file, df in zip(SCOPUS_CORRECTION_EXPECTED_FILES, outputs_tup):
+        save_fixture_df(df, REGRESSION_FIXTURES_PATH / f"scopus_correction_expected_{file}.dat")
+
+    for database, build_refs, set_cols in [("wos", _build_references_wos, _set_wos_parsing_cols),
+                                           ("scopus", _build_references_scopus, _set_scopus_parsing_cols)]:
+        cols_tup = set_cols()
+        rawdata_df = read_fixture_df(REGRESSION_FIXTURES_PATH / f"{database}_references_input.dat")
+        corpus_df = rawdata_df.rename_axis(cols_tup[1]['pub_id_col']).reset_index()
+        references_df = build_refs(corpus_df, cols_tup)
+        save_fixture_df(references_df, REGRESSION_FIXTURES_PATH / f"{database}_references_expected.dat")
+
+    cols_dic = _set_dedup_cols()
+    pub_id_col = cols_dic['pub_id_col']
+    for fixture in DEDUPLICATION_FIXTURES_DICT:
+        articles_df = read_fixture_df(REGRESSION_FIXTURES_PATH / f"deduplication_{fixture}_input.dat",
+                                      int_cols=[pub_id_col])
+        dedup_df, pub_ids_to_drop = _deduplicate_articles(articles_df, cols_dic)
+        save_fixture_df(dedup_df, REGRESSION_FIXTURES_PATH / f"deduplication_{fixture}_expected.dat")
+        save_fixture_df(pd.DataFrame({pub_id_col: sorted(pub_ids_to_drop)}),
+                        REGRESSION_FIXTURES_PATH / f"deduplication_{fixture}_expected_dropped.dat")
+
+
+if __name__ == "__main__":
+    {"inputs": build_inputs, "expected": build_expected}[sys.argv[1]]()
@@ -0,0 +1,387 @@
+"""Helpers of the golden-output checks for pinning the outputs
+of the parsing, the concatenation and the deduplication of fixture corpuses
+as golden files and for checking row by row the outputs of any engine
+or backend options against these golden files.
+"""
+
+__all__ = ['GOLDEN_OFFLINE_ITEMS_DICT',
+           'GOLDEN_STAGES',
+           'build_golden_outputs',
+           'canonicalize_item_df',
+           'check_golden_outputs',
+           'compare_parsing_dicts',
+           'read_golden_outputs',
+           'save_golden_outputs',
+           ]
+
+
+# Standard library imports
+import json
+from contextlib import ExitStack
+from pathlib import Path
+from unittest import mock
+
+# 3rd party imports
+import pandas as pd
+
+# Local library imports
+import BiblioParsing.BiblioSpecificGlobals as bp_sg
+
+
+# Stages of which the outputs are pinned as golden files
+GOLDEN_STAGES = [bp_sg.WOS, bp_sg.SCOPUS, "concatenation", "deduplication"]
+
+# Parsing items built without the nltk data and the Scopus journals categories file
+GOLDEN_OFFLINE_ITEMS_DICT = {bp_sg.WOS   : [bp_sg.PARSING_ITEMS_LIST[x] for x in [0, 1, 2, 3, 4, 5, 9, 10, 11]],
+                             bp_sg.SCOPUS: [bp_sg.PARSING_ITEMS_LIST[x] for x in [0, 1, 2, 3, 4, 5, 11]],
+                             }
+
+# Internal functions of the parsers keyed by database with the parsing items they build
+_GOLDEN_STAGES_FUNCTIONS_DICT = {
+    bp_sg.WOS   : {'_build_keywords_wos'    : bp_sg.PARSING_ITEMS_LIST[6:9],
+                   '_build_subjects_wos'    : bp_sg.PARSING_ITEMS_LIST[9:10],
+                   '_build_sub_subjects_wos': bp_sg.PARSING_ITEMS_LIST[10:11],
+                  },
+    bp_sg.SCOPUS: {'_build_keywords_scopus'    : bp_sg.PARSING_ITEMS_LIST[6:9],
+                   '_build_subjects_scopus'    : bp_sg.PARSING_ITEMS_LIST[9:10],
+                   '_build_sub_subjects_scopus': bp_sg.PARSING_ITEMS_LIST[10:11],
+                  },
+    }
+
+# Canonical value of the missing values of the golden files
+_GOLDEN_NA = "<NA>"
+
+# Name of the file of the golden files description
+_GOLDEN_DESCRIPTION_FILE = "golden.json"
+
+
+def canonicalize_item_df(item_df):
+    """Sets the canonical form of the data of a parsing item so that
+    the data built through different engines or backends can be compared.
+
+    The values are converted to strings, the missing values being set
+    to the '_GOLDEN_NA' global, so that the categorical and downcasted
+    data of the compact mode compare equal to the default data.
+    The columns order is kept and the rows are sorted on all the columns.
+
+    Args:
+        item_df (dataframe): The data of a parsing item.
+    Returns:
+        (dataframe): The canonicalized data with a default index.
+    """
+    canonical_df = item_df.astype(object)
+    canonical_df = canonical_df.where(canonical_df.notna(), _GOLDEN_NA).astype(str)
+    canonical_df.columns = [str(col) for col in canonical_df.columns]
+    if len(canonical_df.columns):
+        canonical_df = canonical_df.sort_values(by=list(canonical_df.columns), kind='stable')
+    return canonical_df.reset_index(drop=True)
+
+
+def _set_fixtures(fixtures_path, pubs_nb=100, seed=0):
+    """Builds the fixture corpuses through the `save_synthetic_corpuses` function
+    imported from `synthetic_utils` module if not already available.
+
+    Args:
+        fixtures_path (path): The full path to the folder of the fixture corpuses \
+        with a sub-folder per database.
+        pubs_nb (int): The number of publications per database (default: 100).
+        seed (int): The seed of the random generator (default: 0).
+    Returns:
+        (dict): The full paths (path) to the rawdata folders keyed by database.
+    """
+    # Local library imports
+    from synthetic_utils import save_synthetic_corpuses
+
+    rawdata_paths_dict = {database: Path(fixtures_path) / Path(database)
+                          for database in [bp_sg.WOS, bp_sg.SCOPUS]}
+    if not all(rawdata_path.exists() for rawdata_path in rawdata_paths_dict.values()):
+        save_synthetic_corpuses(rawdata_paths_dict[bp_sg.WOS], rawdata_paths_dict[bp_sg.SCOPUS],
+                                pubs_nb, seed=seed)
+    return rawdata_paths_dict
+
+
+def _skip_parsing_stages(database, items_list):
+    """Sets the patches of the internal functions of the parser of a database
+    which items are all out of the parsed items, these functions being replaced
+    by stubs returning empty data so that their data files are not required.
+
+    Args:
+        database (str): The database among the global 'GOLDEN_STAGES' parsing ones.
+        items_list (list): The parsing items to build.
+    Returns:
+        (list): The patches (mock._patch) to start.
+    """
+    # Local library imports
+    import BiblioParsing.BiblioParsingScopus as bp_scopus
+    import BiblioParsing.BiblioParsingWos as bp_wos
+
+    def _stub(items_nb):
+        def _build_empty_items(*args, **kwargs):
+            empty_dfs_tup = tuple(pd.DataFrame() for _ in range(items_nb))
+            return empty_dfs_tup if items_nb>1 else empty_dfs_tup[0]
+        return _build_empty_items
+
+    parser_module = {bp_sg.WOS: bp_wos, bp_sg.SCOPUS: bp_scopus}[database]
+    patches_list = []
+    for function_name, function_items_list in _GOLDEN_STAGES_FUNCTIONS_DICT[database].items():
+        if not set(function_items_list) & set(items_list):
+            patches_list.append(mock.patch.object(parser_module, function_name,
+                                                  _stub(len(function_items_list))))
+    return patches_list
+
+
+def build_golden_outputs(fixtures_path, items_dict=None, parser_kwargs=None, concat_kwargs=None,
+                         dedup_kwargs=None):
+    """Builds the outputs of the parsing of each fixture corpus through the `biblio_parser`
+    function, of their concatenation through the `concatenate_parsing` function
+    and of the deduplication through the `deduplicate_parsing` function.
+
+    The engines and backends to check are set through the keyword arguments
+    passed to these functions, the progress being silent by default.
+    The parsed items may be restricted per database, for example to the ones given
+    by the global 'GOLDEN_OFFLINE_ITEMS_DICT' when the nltk data are not available.
+    The parsing stages of the other items are then skipped through the patches
+    set by the `_skip_parsing_stages` internal function and these items are dropped
+    from the outputs, the concatenation and the deduplication being limited to the kept items.
+
+    Args:
+        fixtures_path (path): The full path to the folder of the fixture corpuses \
+        with a sub-folder per database.
+        items_dict (dict): The parsing items (list) to build keyed by database \
+        (default: None for all the items).
+        parser_kwargs (dict): The keyword arguments passed to the `biblio_parser` function \
+        (default: None).
+        concat_kwargs (dict): The keyword arguments passed to the `concatenate_parsing` function \
+        (default: None).
+        dedup_kwargs (dict): The keyword arguments passed to the `deduplicate_parsing` function \
+        (default: None).
+    Returns:
+        (dict): The parsing dicts keyed by stage among the global 'GOLDEN_STAGES'.
+    """
+    # Local library imports
+    from BiblioParsing.BiblioParsingConcat import concatenate_parsing
+    from BiblioParsing.BiblioParsingConcat import deduplicate_parsing
+    from BiblioParsing.BiblioParsingMain import biblio_parser
+
+    items_dict = items_dict or {}
+    parser_kwargs = {'progress_hook': 'silent', **(parser_kwargs or {})}
+    concat_kwargs = dict(concat_kwargs or {})
+    dedup_kwargs = {'progress_hook': 'silent', **(dedup_kwargs or {})}
+
+    outputs_dict = {}
+    for database in [bp_sg.WOS, bp_sg.SCOPUS]:
+        items_list = items_dict.get(database) or bp_sg.PARSING_ITEMS_LIST
+        with ExitStack() as patches_stack:
+            for patch in _skip_parsing_stages(database, items_list):
+                patches_stack.enter_context(patch)
+            parsing_tup = biblio_parser(Path(fixtures_path) / Path(database), database, **parser_kwargs)
+        outputs_dict[database] = {item: item_df for item, item_df in parsing_tup[0].items()
+                                  if item in items_list}
+    concat_return = concatenate_parsing(outputs_dict[bp_sg.WOS], outputs_dict[bp_sg.SCOPUS], **concat_kwargs)
+    outputs_dict["concatenation"] = concat_return[0] if isinstance(concat_return, tuple) else concat_return
+    dedup_return = deduplicate_parsing(outputs_dict["concatenation"], **dedup_kwargs)
+    outputs_dict["deduplication"] = dedup_return[0] if isinstance(dedup_return, tuple) else dedup_return
+    return outputs_dict
+
+
+def save_golden_outputs(golden_path, fixtures_path=None, pubs_nb=100, seed=0, items_dict=None,
+                        parser_kwargs=None, concat_kwargs=None, dedup_kwargs=None):
+    """Saves the canonicalized outputs of the reference engines as golden files.
+
+    The outputs are built by the `build_golden_outputs` function and canonicalized
+    by the `canonicalize_item_df` function. They are saved as tab-separated files
+    in a sub-folder per stage of the golden folder, together with a description
+    file of the fixture corpuses, of the parsed items and of the rows numbers.
+    When 'fixtures_path' is None, the fixture corpuses are built once in the "fixtures"
+    sub-folder of the golden folder so that they are fixed for the next checks.
+
+    Args:
+        golden_path (path): The full path to the golden folder.
+        fixtures_path (path): The full path to the folder of the fixture corpuses \
+        with a sub-folder per database (default: None).
+        pubs_nb (int): The number of publications per database of the built fixture corpuses \
+        (default: 100).
+        seed (int): The seed of the random generator of the built fixture corpuses (default: 0).
+        items_dict (dict): The parsing items (list) to build keyed by database \
+        (default: None for all the items).
+        parser_kwargs (dict): The keyword arguments passed to the `biblio_parser` function \
+        (default: None).
+        concat_kwargs (dict): The keyword arguments passed to the `concatenate_parsing` function \
+        (default: None).
+        dedup_kwargs (dict): The keyword arguments passed to the `deduplicate_parsing` function \
+        (default: None).
+    Returns:
+        (dict): The canonicalized parsing dicts keyed by stage.
+    """
+    golden_path = Path(golden_path)
+    if fixtures_path is None:
+        fixtures_path = golden_path / Path("fixtures")
+        _set_fixtures(fixtures_path, pubs_nb=pubs_nb, seed=seed)
+
+    outputs_dict = build_golden_outputs(fixtures_path, items_dict=items_dict, parser_kwargs=parser_kwargs,
+                                        concat_kwargs=concat_kwargs, dedup_kwargs=dedup_kwargs)
+    golden_dict = {}
+    # Keeping the fixtures path relative to the golden folder when inside it
+    fixtures_path = Path(fixtures_path)
+    if fixtures_path.is_relative_to(golden_path):
+        fixtures_path = fixtures_path.relative_to(golden_path)
+    description_dict = {'fixtures path': fixtures_path.as_posix(),
+                        'parsed items' : items_dict,
+                        'stages'       : {}}
+    for stage, parsing_dict in outputs_dict.items():
+        stage_path = golden_path / Path(stage)
+        stage_path.mkdir(parents=True, exist_ok=True)
+        golden_dict[stage] = {}
+        description_dict['stages'][stage] = {}
+        for item, item_df in parsing_dict.items():
+            canonical_df = canonicalize_item_df(item_df)
+            canonical_df.to_csv(stage_path / Path(f"{item}.dat"), index=False, sep='\t',
+                                encoding=bp_sg.ENCODING)
+            golden_dict[stage][item] = canonical_df
+            description_dict['stages'][stage][item] = len(canonical_df)
+    with open(golden_path / Path(_GOLDEN_DESCRIPTION_FILE), 'w', encoding=bp_sg.ENCODING) as file:
+        json.dump(description_dict, file, indent=4)
+    print(f"  - Golden files of {len(golden_dict)} stages saved in {golden_path}")
+    return golden_dict
+
+
+def read_golden_outputs(golden_path):
+    """Reads the golden files saved by the `save_golden_outputs` function.
+
+    Args:
+        golden_path (path): The full path to the golden folder.
+    Returns:
+        (tup): (The canonicalized parsing dicts keyed by stage (dict), \
+        The full path to the folder of the fixture corpuses (path), \
+        The parsed items (list) keyed by database or None for all the items (dict)).
+    """
+    golden_path = Path(golden_path)
+    with open(golden_path / Path(_GOLDEN_DESCRIPTION_FILE), 'r', encoding=bp_sg.ENCODING) as file:
+        description_dict = json.load(file)
+
+    golden_dict = {}
+    for stage, items_dict in description_dict['stages'].items():
+        golden_dict[stage] = {}
+        for item in items_dict:
+            item_path = golden_path / Path(stage) / Path(f"{item}.dat")
+            try:
+                item_df = pd.read_csv(item_path, sep='\t', dtype=str, keep_default_na=False,
+                                      encoding=bp_sg.ENCODING)
+            except pd.errors.EmptyDataError:
+                item_df = pd.DataFrame()
+            golden_dict[stage][item] = item_df
+    fixtures_path = golden_path / Path(description_dict['fixtures path'])
+    return golden_dict, fixtures_path, description_dict.get('parsed items')
+
+
+def _compare_item_dfs(golden_df, new_df, max_rows=5):
+    """Compares row by row the canonicalized data of a parsing item.
+
+    The rows are compared as multisets, the duplicated rows being distinguished
+    by their occurrence rank.
+
+    Args:
+        golden_df (dataframe): The golden canonicalized data.
+        new_df (dataframe): The new canonicalized data.
+        max_rows (int): The maximum number of reported rows per mismatch kind (default: 5).
+    Returns:
+        (list): The mismatches as tuples (kind (str), detail (str)).
+    """
+    mismatches_list = []
+    if list(golden_df.columns)!=list(new_df.columns):
+        mismatches_list.append(("columns", f"golden {list(golden_df.columns)} / new {list(new_df.columns)}"))
+        return mismatches_list
+    if len(golden_df)!=len(new_df):
+        mismatches_list.append(("rows number", f"golden {len(golden_df)} / new {len(new_df)}"))
+
+    cols_list = list(golden_df.columns)
+    if not cols_list:
+        return mismatches_list
+    rank_col = "__golden_rank__"
+    golden_ranked_df = golden_df.assign(**{rank_col: golden_df.groupby(cols_list).cumcount()})
+    new_ranked_df = new_df.assign(**{rank_col: new_df.groupby(cols_list).cumcount()})
+    merged_df = golden_ranked_df.merge(new_ranked_df, how='outer', on=cols_list + [rank_col], indicator=True)
+    for side, kind in [('left_only', "missing row"), ('right_only', "unexpected row")]:
+        side_df = merged_df[merged_df['_merge']==side][cols_list]
+        for row in side_df.head(max_rows).itertuples(index=False):
+            mismatches_list.append((kind, " | ".join(row)))
+        if len(side_df)>max_rows:
+            mismatches_list.append((kind, f"... and {len(side_df) - max_rows} more"))
+    return mismatches_list
+
+
+def compare_parsing_dicts(golden_dict, new_dict, max_rows=5):
+    """Compares row by row new parsing dicts to golden ones, both keyed by stage.
+
+    The new data are canonicalized by the `canonicalize_item_df` function
+    before the comparison of each item through the `_compare_item_dfs` internal function.
+
+    Args:
+        golden_dict (dict): The golden canonicalized parsing dicts keyed by stage.
+        new_dict (dict): The new parsing dicts keyed by stage.
+        max_rows (int): The maximum number of reported rows per item and mismatch kind (default: 5).
+    Returns:
+        (tup): (True if no mismatch (bool), The mismatches report (str), \
+        The data (dataframe) of the mismatches with "Stage", "Item", "Mismatch" and "Detail" columns).
+    """
+    mismatches_list = []
+    for stage, golden_parsing_dict in golden_dict.items():
+        new_parsing_dict = new_dict.get(stage)
+        if new_parsing_dict is None:
+            mismatches_list.append((stage, "", "missing stage", ""))
+            continue
+        for item in sorted(set(golden_parsing_dict) | set(new_parsing_dict)):
+            if item not in new_parsing_dict:
+                mismatches_list.append((stage, item, "missing item", ""))
+            elif item not in golden_parsing_dict:
+                mismatches_list.append((stage, item, "unexpected item", ""))
+            else:
+                new_df = canonicalize_item_df(new_parsing_dict[item])
+                for kind, detail in _compare_item_dfs(golden_parsing_dict[item], new_df, max_rows=max_rows):
+                    mismatches_list.append((stage, item, kind, detail))
+    mismatches_df = pd.DataFrame(mismatches_list, columns=["Stage", "Item", "Mismatch", "Detail"])
+
+    if mismatches_df.empty:
+        report = "Outputs identical to the golden files"
+    else:
+        report_lines = [f"{len(mismatches_df)} mismatches with the golden files"]
+        for (stage, item), item_df in mismatches_df.groupby(["Stage", "Item"], sort=False):
+            report_lines.append(f"  - {stage} / {item}" if item else f"  - {stage}")
+            for kind, detail in zip(item_df["Mismatch"], item_df["Detail"]):
+                report_lines.append(f"      - {kind}: {detail}" if detail else f"      - {kind}")
+        report = "\n".join(report_lines)
+    return mismatches_df.empty, report, mismatches_df
+
+
+def check_golden_outputs(golden_path, parser_kwargs=None, concat_kwargs=None, dedup_kwargs=None,
+                         max_rows=5, report_path=None):
+    """Checks the outputs of the engines and backends set by the keyword arguments
+    against the golden files saved by the `save_golden_outputs` function.
+
+    The outputs are built on the fixture corpuses and for the parsed items of the golden files
+    by the `build_golden_outputs` function and compared through
+    the `compare_parsing_dicts` function. The mismatches report is printed.
+
+    Args:
+        golden_path (path): The full path to the golden folder.
+        parser_kwargs (dict): The keyword arguments passed to the `biblio_parser` function \
+        (default: None).
+        concat_kwargs (dict): The keyword arguments passed to the `concatenate_parsing` function \
+        (default: None).
+        dedup_kwargs (dict): The keyword arguments passed to the `deduplicate_parsing` function \
+        (default: None).
+        max_rows (int): The maximum number of reported rows per item and mismatch kind (default: 5).
+        report_path (path): The full path of the text file where the mismatches report is saved \
+        (default: None).
+    Returns:
+        (tup): (True if no mismatch (bool), The data (dataframe) of the mismatches).
+    """
+    golden_dict, fixtures_path, items_dict = read_golden_outputs(golden_path)
+    new_dict = build_golden_outputs(fixtures_path, items_dict=items_dict, parser_kwargs=parser_kwargs,
+                                    concat_kwargs=concat_kwargs, dedup_kwargs=dedup_kwargs)
+    identical, report, mismatches_df = compare_parsing_dicts(golden_dict, new_dict, max_rows=max_rows)
+    print(report)
+    if report_path:
+        with open(report_path, 'w', encoding=bp_sg.ENCODING) as file:
+            file.write(report + "\n")
+    return identical, mismatches_df
@@ -0,0 +1,37 @@
+"""Helpers of the regression tests for saving, reading and comparing
+the data of the fixtures as tab-separated files of strings.
+"""
+
+# Standard library imports
+import io
+from pathlib import Path
+
+# 3rd party imports
+import pandas as pd
+
+
+REGRESSION_FIXTURES_PATH = Path(__file__).parent / Path("fixtures") / Path("regression")
+
+
+def save_fixture_df(df, file_path):
+    """Saves data as a tab-separated file without index."""
+    Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(file_path, sep='\t', index=False, encoding='utf-8')
+
+
+def read_fixture_df(file_path, int_cols=None):
+    """Reads data saved by `save_fixture_df` as strings, the columns of 'int_cols' being cast to int."""
+    df = pd.read_csv(file_path, sep='\t', dtype=str, keep_default_na=False, encoding='utf-8')
+    for col in int_cols or []:
+        df[col] = df[col].astype(int)
+    return df
+
+
+def assert_same_as_fixture(df, file_path):
+    """Checks that data are identical, row by row and in the same order,
+    to the data of a fixture file once written as done by `save_fixture_df`.
+    """
+    written_df = pd.read_csv(io.StringIO(df.to_csv(sep='\t', index=False)), sep='\t',
+                             dtype=str, keep_default_na=False)
+    expected_df = read_fixture_df(file_path)
+    pd.testing.assert_frame_equal(written_df, expected_df)
@@ -0,0 +1,548 @@
+"""Helpers of the benchmarks and of the golden-output checks for building synthetic
+WoS and Scopus corpuses of any size with a controlled rate of publications
+common to both databases, the vocabulary of the addresses being drawn
+from the reference files of the package.
+"""
+
+__all__ = ['build_synthetic_corpuses',
+           'save_synthetic_corpuses',
+           ]
+
+
+# Standard library imports
+import csv
+import random
+from collections import namedtuple
+from pathlib import Path
+
+# 3rd party imports
+import pandas as pd
+
+# Local library imports
+import BiblioParsing as bp
+import BiblioParsing.BiblioGeneralGlobals as bp_gg
+import BiblioParsing.BiblioSpecificGlobals as bp_sg
+
+# Local imports
+from benchmark_utils import _FIRSTNAMES
+from benchmark_utils import _JOURNAL_WORDS
+from benchmark_utils import _LASTNAMES
+from benchmark_utils import _PROCEEDINGS
+from benchmark_utils import _build_title_vocabulary
+
+
+# Setting the named tuples of the synthetic data
+synthetic_vocabulary = namedtuple('synthetic_vocabulary', ['affiliations_dict', 'towns_dict',
+                                                           'countries_list', 'countries_weights_list',
+                                                           'other_countries_list'])
+synthetic_journal = namedtuple('synthetic_journal', ['name', 'abbreviation', 'issn', 'doi_prefix',
+                                                     'subjects_list'])
+synthetic_reference = namedtuple('synthetic_reference', ['lastname', 'initial', 'title', 'year',
+                                                         'journal', 'volume', 'page'])
+
+# WoS subject categories and their research areas
+_WOS_SUBJECTS_DICT = {"Energy & Fuels"                        : "Energy & Fuels",
+                      "Chemistry, Physical"                   : "Chemistry",
+                      "Engineering, Chemical"                 : "Engineering",
+                      "Materials Science, Multidisciplinary"  : "Materials Science",
+                      "Physics, Applied"                      : "Physics",
+                      "Thermodynamics"                        : "Thermodynamics",
+                      "Electrochemistry"                      : "Electrochemistry",
+                      "Nanoscience & Nanotechnology"          : "Science & Technology - Other Topics",
+                     }
+
+# Document types of the publications as (WoS document type, Scopus document type, weight)
+_DOC_TYPES = [("Article", "Article", 0.8),
+              ("Review", "Review", 0.1),
+              ("Proceedings Paper", "Conference Paper", 0.1),
+             ]
+
+# Characters excluding a raw affiliation from the vocabulary
+# as they are separators of the authors with affiliations fields
+_AFFILIATION_EXCLUDED_CHARS = ";[]\"\n"
+
+
+def _read_synthetic_vocabulary(country_affiliations_file_path=None, country_towns_file=None,
+                               country_towns_folder_path=None):
+    """Reads the vocabulary of the synthetic addresses in the reference files of the package.
+
+    The raw affiliations and the towns are read per country in the files given by
+    the 'COUNTRY_AFFILIATIONS_FILE' and 'COUNTRY_TOWNS_FILE' globals.
+    The countries of the addresses are weighted by their number of raw affiliations.
+    The countries of the 'COUNTRIES' global without raw affiliations are kept
+    for building addresses with affiliations that are not normalized.
+
+    Args:
+        country_affiliations_file_path (path): The full path to the data per country of raw affiliations \
+        per normalized one, optional (default=None).
+        country_towns_file (str): The name of the file of the data of towns per country, optional (default=None).
+        country_towns_folder_path (path): The full path to the folder where the 'country_towns_file' file \
+        is available, optional (default=None).
+    Returns:
+        (namedtuple): The vocabulary with the fields 'affiliations_dict', 'towns_dict', \
+        'countries_list', 'countries_weights_list' and 'other_countries_list'.
+    """
+    ref_files_path = Path(bp.__file__).parent / Path(bp_gg.REP_UTILS)
+    if not country_affiliations_file_path:
+        country_affiliations_file_path = ref_files_path / Path(bp_sg.COUNTRY_AFFILIATIONS_FILE)
+    if not country_towns_folder_path:
+        country_towns_folder_path = ref_files_path
+    if not country_towns_file:
+        country_towns_file = bp_sg.COUNTRY_TOWNS_FILE
+
+    affiliations_dict = {}
+    country_aff_dict = pd.read_excel(country_affiliations_file_path, sheet_name=None)
+    for country, country_aff_df in country_aff_dict.items():
+        raw_cols_list = [col for col in country_aff_df.columns if col.startswith("Raw affiliations")]
+        affiliations_set = set()
+        for col in raw_cols_list:
+            for affiliation in country_aff_df[col].dropna().astype(str):
+                affiliation = affiliation.strip()
+                if affiliation and not any(char in affiliation for char in _AFFILIATION_EXCLUDED_CHARS):
+                    affiliations_set.add(affiliation)
+        if affiliations_set and country in bp_gg.COUNTRIES:
+            affiliations_dict[country] = sorted(affiliations_set)
+
+    towns_dict = {}
+    country_towns_dict = pd.read_excel(Path(country_towns_folder_path) / Path(country_towns_file),
+                                       sheet_name=None)
+    for country, country_towns_df in country_towns_dict.items():
+        towns_list = [town.strip() for town in country_towns_df['Town name'].dropna().astype(str)
+                      if town.strip()]
+        if towns_list:
+            towns_dict[country] = towns_list
+
+    countries_list = sorted(affiliations_dict.keys())
+    countries_weights_list = [len(affiliations_dict[country]) for country in countries_list]
+    other_countries_list = [country for country in bp_gg.COUNTRIES if country not in affiliations_dict]
+    vocabulary = synthetic_vocabulary(affiliations_dict, towns_dict, countries_list,
+                                      countries_weights_list, other_countries_list)
+    return vocabulary
+
+
+def _build_person_names(names_nb, rng):
+    """Builds a pool of distinct authors names.
+
+    The last names are the ones of the global '_LASTNAMES' of the `benchmark_utils`
+    module completed by synthetic names made of syllables.
+
+    Args:
+        names_nb (int): The number of authors names.
+        rng (random.Random): The random generator.
+    Returns:
+        (list): The authors names as tuples (last name (str), first name (str)).
+    """
+    syllables_list = ["ba", "be", "bo", "da", "de", "di", "fa", "fe", "ga", "go", "ka", "ki", "la",
+                      "le", "li", "lo", "ma", "me", "mi", "mo", "na", "ne", "no", "ra", "re", "ri",
+                      "ro", "sa", "se", "si", "ta", "te", "to", "va", "ve", "vi", "za", "zo"]
+    lastnames_list = list(_LASTNAMES)
+    lastnames_set = set(lastnames_list)
+    lastnames_nb = max(len(lastnames_list), names_nb // 2)
+    while len(lastnames_list)<lastnames_nb:
+        lastname = "".join(rng.choice(syllables_list) for _ in range(rng.randint(2, 4))).capitalize()
+        if lastname not in lastnames_set:
+            lastnames_set.add(lastname)
+            lastnames_list.append(lastname)
+    names_list = list(dict.fromkeys((rng.choice(lastnames_list), rng.choice(_FIRSTNAMES))
+                                    for _ in range(names_nb)))
+    return names_list
+
+
+def _build_journals(journals_nb, rng):
+    """Builds a list of synthetic journals.
+
+    Args:
+        journals_nb (int): The number of journals.
+        rng (random.Random): The random generator.
+    Returns:
+        (list): The journals (namedtuple) with the fields 'name', 'abbreviation', 'issn', \
+        'doi_prefix' and 'subjects_list'.
+    """
+    subjects_list = list(_WOS_SUBJECTS_DICT.keys())
+    journals_list = []
+    names_set = set()
+    while len(journals_list)<journals_nb:
+        words_list = rng.sample(_JOURNAL_WORDS, rng.randint(2, 4))
+        name = " ".join(word.capitalize() if word!="of" else word for word in words_list)
+        if rng.random()<0.5:
+            name = "Journal of " + name
+        if name in names_set:
+            continue
+        names_set.add(name)
+        abbreviation = "".join(word[0] for word in name.split() if word!="of").upper()
+        issn = f"{rng.randint(0, 9999):04d}-{rng.randint(0, 999):03d}{rng.choice('0123456789X')}"
+        journal_subjects_list = rng.sample(subjects_list, rng.randint(1, 2))
+        journals_list.append(synthetic_journal(name, abbreviation, issn, f"10.{1000 + len(journals_list)}",
+                                               journal_subjects_list))
+    return journals_list
+
+
+def _build_address(vocabulary, rng, other_country_rate=0.1):
+    """Builds a synthetic address as a list of affiliations, a town and a country.
+
+    Args:
+        vocabulary (namedtuple): The vocabulary built by the `_read_synthetic_vocabulary` \
+        internal function.
+        rng (random.Random): The random generator.
+        other_country_rate (float): The rate of addresses in countries without \
+        raw affiliations in the reference files (default: 0.1).
+    Returns:
+        (tup): (The affiliations (list), The town (str), The zip code (str), The country (str)).
+    """
+    if rng.random()<other_country_rate and vocabulary.other_countries_list:
+        country = rng.choice(vocabulary.other_countries_list)
+        affiliations_list = [f"Univ {rng.choice(_LASTNAMES)}"]
+    else:
+        country = rng.choices(vocabulary.countries_list, weights=vocabulary.countries_weights_list)[0]
+        country_affiliations_list = vocabulary.affiliations_dict[country]
+        affiliations_list = rng.sample(country_affiliations_list,
+                                       min(len(country_affiliations_list), rng.randint(1, 2)))
+    towns_list = vocabulary.towns_dict.get(country)
+    town = rng.choice(towns_list) if towns_list else ""
+    zip_code = str(rng.randint(10000, 99999)) if town and rng.random()<0.7 else ""
+    return affiliations_list, town, zip_code, country
+
+
+def _build_reference(journals_list, title_words_list, title_weights_list, rng):
+    """Builds a synthetic cited reference.
+
+    Args:
+        journals_list (list): The journals (namedtuple) built by the `_build_journals` internal function.
+        title_words_list (list): The words (str) of the titles.
+        title_weights_list (list): The weights (float) of the words of the titles.
+        rng (random.Random): The random generator.
+    Returns:
+        (namedtuple): The reference with the fields 'lastname', 'initial', 'title', 'year', \
+        'journal', 'volume' and 'page'.
+    """
+    title = " ".join(rng.choices(title_words_list, weights=title_weights_list, k=rng.randint(3, 8)))
+    journal = rng.choice(journals_list).name if rng.random()<0.95 else rng.choice(_PROCEEDINGS)
+    reference = synthetic_reference(rng.choice(_LASTNAMES), rng.choice(_FIRSTNAMES)[0],
+                                    title.capitalize(), rng.randint(1970, 2024), journal,
+                                    rng.randint(1, 500), rng.randint(1, 20000))
+    return reference
+
+
+def _format_wos_reference(reference):
+    """Formats a synthetic cited reference with the WoS coding.
+
+    Args:
+        reference (namedtuple): The reference built by the `_build_reference` internal function.
+    Returns:
+        (str): The formatted reference.
+    """
+    journal = reference.journal.upper().replace(".", "")
+    return (f"{reference.lastname} {reference.initial}, {reference.year}, {journal}, "
+            f"V{reference.volume}, P{reference.page}")
+
+
+def _format_scopus_reference(reference, new_coding=False):
+    """Formats a synthetic cited reference with the old or the new (since 07-2023) Scopus coding.
+
+    Args:
+        reference (namedtuple): The reference built by the `_build_reference` internal function.
+        new_coding (bool): True for the new Scopus coding (default: False).
+    Returns:
+        (str): The formatted reference.
+    """
+    pages = f"pp. {reference.page}-{reference.page + 9}"
+    if new_coding:
+        return (f"{reference.lastname} {reference.initial}., {reference.title}, {reference.journal}, "
+                f"{reference.volume}, {pages}, ({reference.year})")
+    return (f"{reference.lastname}, {reference.initial}., {reference.title}, "
+            f"({reference.year}) {reference.journal}, {reference.volume}, {pages}")
+
+
+def _build_publications(pubs_nb, vocabulary, rng, refs_per_pub=30):
+    """Builds the database-independent data of synthetic publications.
+
+    Args:
+        pubs_nb (int): The number of publications.
+        vocabulary (namedtuple): The vocabulary built by the `_read_synthetic_vocabulary` \
+        internal function.
+        rng (random.Random): The random generator.
+        refs_per_pub (int): The mean number of cited references per publication (default: 30).
+    Returns:
+        (list): The publications (dict).
+    """
+    title_words_list, title_weights_list = _build_title_vocabulary(max(2000, pubs_nb // 5), rng)
+    names_list = _build_person_names(max(100, pubs_nb), rng)
+    journals_list = _build_journals(max(10, pubs_nb // 100), rng)
+    refs_pool_list = [_build_reference(journals_list, title_words_list, title_weights_list, rng)
+                      for _ in range(max(100, pubs_nb * refs_per_pub // 2))]
+    doc_types_weights_list = [doc_type[2] for doc_type in _DOC_TYPES]
+
+    pubs_list = []
+    for pub_idx in range(pubs_nb):
+        journal = rng.choice(journals_list)
+        year = rng.randint(2000, 2024)
+        title_words = rng.choices(title_words_list, weights=title_weights_list, k=rng.randint(5, 14))
+        keywords_list = list(dict.fromkeys(" ".join(rng.choices(title_words_list, weights=title_weights_list,
+                                                                k=rng.randint(1, 2)))
+                                           for _ in range(rng.randint(0, 6))))
+        addresses_list = [_build_address(vocabulary, rng) for _ in range(rng.randint(1, 3))]
+        authors_list = list(dict.fromkeys(rng.choice(names_list) for _ in range(rng.randint(1, 8))))
+        authors_addresses_list = [sorted(rng.sample(range(len(addresses_list)),
+                                                    rng.randint(1, min(2, len(addresses_list)))))
+                                  for _ in authors_list]
+        refs_nb = rng.randint(0, 2 * refs_per_pub)
+        pub = {'authors'          : authors_list,
+               'authors_addresses': authors_addresses_list,
+               'addresses'        : addresses_list,
+               'title'            : " ".join(title_words).capitalize(),
+               'journal'          : journal,
+               'year'             : year,
+               'volume'           : str(rng.randint(1, 300)),
+               'page'             : str(rng.randint(1, 20000)),
+               'doi'              : f"{journal.doi_prefix}/j.{journal.abbreviation.lower()}.{year}.{pub_idx:07d}",
+               'doc_type'         : rng.choices(_DOC_TYPES, weights=doc_types_weights_list)[0],
+               'author_keywords'  : keywords_list,
+               'index_keywords'   : rng.sample(keywords_list, len(keywords_list) // 2),
+               'references'       : [rng.choice(refs_pool_list) for _ in range(refs_nb)],
+              }
+        pubs_list.append(pub)
+    return pubs_list
+
+
+def _set_pub_variant(pub, rng):
+    """Builds a variant of a publication as found for a same publication in another database
+    with the DOI unknown and a slightly modified title.
+
+    Args:
+        pub (dict): The publication built by the `_build_publications` internal function.
+        rng (random.Random): The random generator.
+    Returns:
+        (dict): The publication variant.
+    """
+    variant_pub = dict(pub)
+    variant_pub['doi'] = ""
+    title_words_list = pub['title'].split()
+    if len(title_words_list)>5 and rng.random()<0.5:
+        title_words_list.pop(rng.randrange(1, len(title_words_list)))
+    variant_pub['title'] = " ".join(title_words_list).title()
+    return variant_pub
+
+
+def _format_initials(firstname, dotted=True):
+    """Formats the initials of a first name.
+
+    Args:
+        firstname (str): The first name.
+        dotted (bool): True for a dot after each initial (default: True).
+    Returns:
+        (str): The initials.
+    """
+    parts_list = [part for part in firstname.replace("-", " ").replace(".", "").split(" ") if part]
+    return "".join(part[0] + ("." if dotted else "") for part in parts_list)
+
+
+def _format_wos_address(address):
+    affiliations_list, town, zip_code, country = address
+    town_item = " ".join(item for item in (zip_code, town) if item)
+    return ", ".join(affiliations_list + [item for item in (town_item, country) if item])
+
+
+def _format_scopus_address(address):
+    affiliations_list, town, zip_code, country = address
+    return ", ".join(affiliations_list + [item for item in (town, zip_code, country) if item])
+
+
+def _format_wos_row(pub, pub_idx):
+    """Formats a synthetic publication as a row of WoS rawdata.
+
+    Args:
+        pub (dict): The publication built by the `_build_publications` internal function.
+        pub_idx (int): The index of the publication used for its WoS identifier.
+    Returns:
+        (dict): The rawdata of the publication keyed by WoS column label.
+    """
+    labels_dict = bp_sg.COLUMN_LABEL_WOS
+    plus_labels_dict = bp_sg.COLUMN_LABEL_WOS_PLUS
+    fullnames_list = [f"{lastname}, {firstname}" for lastname, firstname in pub['authors']]
+    c1_list = []
+    for address_idx, address in enumerate(pub['addresses']):
+        address_authors_list = [fullname for fullname, author_addresses_list
+                                in zip(fullnames_list, pub['authors_addresses'])
+                                if address_idx in author_addresses_list]
+        if address_authors_list:
+            c1_list.append(f"[{'; '.join(address_authors_list)}] {_format_wos_address(address)}")
+    subjects_list = pub['journal'].subjects_list
+
+    row_dict = {'PT'                                   : "J",
+                labels_dict['authors']                 : "; ".join(f"{lastname}, {_format_initials(firstname, dotted=False)}"
+                                                                   for lastname, firstname in pub['authors']),
+                labels_dict['authors_fullnames']       : "; ".join(fullnames_list),
+                labels_dict['title']                   : pub['title'],
+                labels_dict['journal']                 : pub['journal'].name.upper(),
+                labels_dict['language']                : "English",
+                labels_dict['document_type']           : pub['doc_type'][0],
+                labels_dict['author_keywords']         : "; ".join(pub['author_keywords']),
+                labels_dict['index_keywords']          : "; ".join(keyword.upper() for keyword in pub['index_keywords']),
+                labels_dict['authors_with_affiliations']: "; ".join(c1_list),
+                labels_dict['references']              : "; ".join(_format_wos_reference(ref) for ref in pub['references']),
+                labels_dict['year']                    : str(pub['year']),
+                labels_dict['volume']                  : pub['volume'],
+                labels_dict['page_start']              : pub['page'],
+                labels_dict['doi']                     : pub['doi'],
+                labels_dict['issn']                    : pub['journal'].issn,
+                plus_labels_dict['e_issn']             : "",
+                labels_dict['subjects']                : "; ".join(subjects_list),
+                labels_dict['sub_subjects']            : "; ".join(dict.fromkeys(_WOS_SUBJECTS_DICT[subject]
+                                                                                 for subject in subjects_list)),
+                plus_labels_dict['wos_id']             : f"WOS:{pub_idx:015d}",
+               }
+    return row_dict
+
+
+def _format_scopus_row(pub, pub_idx, new_coding=False):
+    """Formats a synthetic publication as a row of Scopus rawdata.
+
+    Args:
+        pub (dict): The publication built by the `_build_publications` internal function.
+        pub_idx (int): The index of the publication used for its Scopus identifier.
+        new_coding (bool): True for the new (since 07-2023) Scopus coding \
+        of the cited references (default: False).
+    Returns:
+        (dict): The rawdata of the publication keyed by Scopus column label.
+    """
+    labels_dict = bp_sg.COLUMN_LABEL_SCOPUS
+    plus_labels_dict = bp_sg.COLUMN_LABEL_SCOPUS_PLUS
+    authors_list = [f"{lastname} {_format_initials(firstname)}" for lastname, firstname in pub['authors']]
+    addresses_list = [_format_scopus_address(address) for address in pub['addresses']]
+    used_addresses_idx_list = sorted(set(sum(pub['authors_addresses'], [])))
+    auth_affil_list = [", ".join([author] + [addresses_list[address_idx] for address_idx in author_addresses_list])
+                       for author, author_addresses_list in zip(authors_list, pub['authors_addresses'])]
+    # Setting a stable author identifier from the author name
+    fullnames_list = [f"{lastname}, {firstname} ({57000000000 + sum(map(ord, lastname + firstname)) * 1009})"
+                      for lastname, firstname in pub['authors']]
+
+    row_dict = {labels_dict['authors']                  : "; ".join(authors_list),
+                plus_labels_dict['auth_fullnames']      : "; ".join(fullnames_list),
+                labels_dict['title']                    : pub['title'],
+                labels_dict['year']                     : pub['year'],
+                labels_dict['journal']                  : pub['journal'].name,
+                labels_dict['volume']                   : pub['volume'],
+                labels_dict['page_start']               : pub['page'],
+                labels_dict['doi']                      : pub['doi'],
+                labels_dict['affiliations']             : "; ".join(addresses_list[address_idx]
+                                                                    for address_idx in used_addresses_idx_list),
+                labels_dict['authors_with_affiliations']: "; ".join(auth_affil_list),
+                labels_dict['author_keywords']          : "; ".join(pub['author_keywords']),
+                labels_dict['index_keywords']           : "; ".join(pub['index_keywords']),
+                labels_dict['references']               : "; ".join(_format_scopus_reference(ref, new_coding)
+                                                                    for ref in pub['references']),
+                labels_dict['language']                 : "English",
+                labels_dict['document_type']            : pub['doc_type'][1],
+                labels_dict['issn']                     : pub['journal'].issn.replace("-", ""),
+                plus_labels_dict['scopus_id']           : f"2-s2.0-{85000000000 + pub_idx}",
+               }
+    return row_dict
+
+
+def build_synthetic_corpuses(wos_pubs_nb, scopus_pubs_nb=None, duplicate_rate=0.3, variant_rate=0.1,
+                             refs_per_pub=30, new_coding_rate=0.5, seed=0,
+                             country_affiliations_file_path=None, country_towns_file=None,
+                             country_towns_folder_path=None):
+    """Builds synthetic WoS and Scopus rawdata with a controlled rate of publications
+    common to both databases.
+
+    The publications are built through the `_build_publications` internal function
+    with addresses drawn from the raw affiliations, towns and countries
+    of the reference files of the package.
+    A fraction 'duplicate_rate' of the Scopus publications are publications
+    of the WoS corpus, a fraction 'variant_rate' of these duplicates being
+    modified through the `_set_pub_variant` internal function.
+    The Scopus cited references are coded with the new (since 07-2023) Scopus coding
+    for a fraction 'new_coding_rate' of the Scopus publications and with the old one otherwise.
+
+    Args:
+        wos_pubs_nb (int): The number of publications of the WoS corpus.
+        scopus_pubs_nb (int): The number of publications of the Scopus corpus \
+        (default: None for 'wos_pubs_nb').
+        duplicate_rate (float): The rate of Scopus publications common to the WoS corpus (default: 0.3).
+        variant_rate (float): The rate of the common publications with unknown DOI \
+        and modified title in the Scopus corpus (default: 0.1).
+        refs_per_pub (int): The mean number of cited references per publication (default: 30).
+        new_coding_rate (float): The rate of Scopus publications with the new coding \
+        of the cited references (default: 0.5).
+        seed (int): The seed of the random generator (default: 0).
+        country_affiliations_file_path (path): The full path to the data per country of raw affiliations \
+        per normalized one, optional (default=None).
+        country_towns_file (str): The name of the file of the data of towns per country, optional (default=None).
+        country_towns_folder_path (path): The full path to the folder where the 'country_towns_file' file \
+        is available, optional (default=None).
+    Returns:
+        (tup): (The WoS rawdata (dataframe), The Scopus rawdata (dataframe), \
+        The data (dataframe) of the row indexes of the common publications in the WoS \
+        and Scopus rawdata with the "WoS row", "Scopus row" and "Variant" columns).
+    """
+    rng = random.Random(seed)
+    if scopus_pubs_nb is None:
+        scopus_pubs_nb = wos_pubs_nb
+    duplicates_nb = min(int(round(scopus_pubs_nb * duplicate_rate)), wos_pubs_nb)
+    vocabulary = _read_synthetic_vocabulary(country_affiliations_file_path=country_affiliations_file_path,
+                                            country_towns_file=country_towns_file,
+                                            country_towns_folder_path=country_towns_folder_path)
+    pubs_list = _build_publications(wos_pubs_nb + scopus_pubs_nb - duplicates_nb, vocabulary, rng,
+                                    refs_per_pub=refs_per_pub)
+    wos_pubs_list = pubs_list[:wos_pubs_nb]
+
+    # Building the Scopus publications with the duplicates at random rows
+    duplicates_list = [(wos_row, rng.random()<variant_rate)
+                       for wos_row in rng.sample(range(wos_pubs_nb), duplicates_nb)]
+    scopus_rows_list = rng.sample(range(scopus_pubs_nb), duplicates_nb)
+    duplicates_dict = dict(zip(scopus_rows_list, duplicates_list))
+    new_pubs_iter = iter(pubs_list[wos_pubs_nb:])
+    scopus_pubs_list = []
+    for scopus_row in range(scopus_pubs_nb):
+        if scopus_row in duplicates_dict:
+            wos_row, variant = duplicates_dict[scopus_row]
+            pub = wos_pubs_list[wos_row]
+            scopus_pubs_list.append(_set_pub_variant(pub, rng) if variant else pub)
+        else:
+            scopus_pubs_list.append(next(new_pubs_iter))
+
+    wos_rawdata_df = pd.DataFrame([_format_wos_row(pub, pub_idx) for pub_idx, pub in enumerate(wos_pubs_list)])
+    scopus_rawdata_df = pd.DataFrame([_format_scopus_row(pub, pub_idx, new_coding=rng.random()<new_coding_rate)
+                                      for pub_idx, pub in enumerate(scopus_pubs_list)])
+    duplicates_df = pd.DataFrame([(wos_row, scopus_row, variant)
+                                  for scopus_row, (wos_row, variant) in sorted(duplicates_dict.items())],
+                                 columns=["WoS row", "Scopus row", "Variant"])
+    return wos_rawdata_df, scopus_rawdata_df, duplicates_df
+
+
+def save_synthetic_corpuses(wos_rawdata_path, scopus_rawdata_path, wos_pubs_nb, scopus_pubs_nb=None,
+                            file_name="synthetic_corpus", **build_kwargs):
+    """Saves synthetic WoS and Scopus rawdata built through the `build_synthetic_corpuses`
+    function as files readable by the `read_database_wos` and `read_database_scopus` functions.
+
+    The WoS rawdata are saved as a tab-delimited file with the extension given by
+    the 'WOS_RAWDATA_EXTENT' global and the Scopus rawdata as a csv file with the extension
+    given by the 'SCOPUS_RAWDATA_EXTENT' global.
+
+    Args:
+        wos_rawdata_path (path): The full path to the folder of the WoS rawdata file.
+        scopus_rawdata_path (path): The full path to the folder of the Scopus rawdata file.
+        wos_pubs_nb (int): The number of publications of the WoS corpus.
+        scopus_pubs_nb (int): The number of publications of the Scopus corpus \
+        (default: None for 'wos_pubs_nb').
+        file_name (str): The name without extension of the files (default: "synthetic_corpus").
+        build_kwargs (dict): The other keyword arguments passed to the `build_synthetic_corpuses` function.
+    Returns:
+        (tup): (The full path to the WoS rawdata file (path), The full path to the Scopus rawdata file (path), \
+        The data (dataframe) of the row indexes of the common publications).
+    """
+    wos_rawdata_df, scopus_rawdata_df, duplicates_df = build_synthetic_corpuses(wos_pubs_nb, scopus_pubs_nb,
+                                                                                **build_kwargs)
+    Path(wos_rawdata_path).mkdir(parents=True, exist_ok=True)
+    Path(scopus_rawdata_path).mkdir(parents=True, exist_ok=True)
+
+    wos_file_path = Path(wos_rawdata_path) / Path(f"{file_name}.{bp_sg.WOS_RAWDATA_EXTENT}")
+    with open(wos_file_path, 'w', encoding=bp_sg.ENCODING, newline='') as wos_file:
+        csv_writer = csv.writer(wos_file, delimiter='\t', lineterminator='\n')
+        csv_writer.writerow(wos_rawdata_df.columns)
+        csv_writer.writerows(wos_rawdata_df.itertuples(index=False))
+
+    scopus_file_path = Path(scopus_rawdata_path) / Path(f"{file_name}.{bp_sg.SCOPUS_RAWDATA_EXTENT}")
+    scopus_rawdata_df.to_csv(scopus_file_path, index=False, encoding=bp_sg.ENCODING)
+    return wos_file_path, scopus_file_path, duplicates_df
@@ -0,0 +1,66 @@
+"""Checks that the incremental deduplication of a split corpus keeps about the same publications
+as the full deduplication of the corpus, the possible divergence being flagged in the updated index.
+"""
+
+# 3rd party imports
+import numpy as np
+import pandas as pd
+import pytest
+
+# Local imports
+import BiblioParsing.BiblioSpecificGlobals as bp_sg
+from benchmark_utils import build_articles_rawdata
+from BiblioParsing.BiblioParsingConcat import _set_dedup_cols
+from BiblioParsing.BiblioParsingConcat import build_dedup_index
+from BiblioParsing.BiblioParsingConcat import deduplicate_parsing
+from BiblioParsing.BiblioParsingConcat import deduplicate_parsing_incremental
+
+
+PUBS_NB = 1500
+SPLIT_RATE = 0.7
+MAX_KEPT_GAP_RATE = 0.02
+
+
+def _build_split_corpus(seed):
+    cols_dic = _set_dedup_cols()
+    pub_id_col, author_idx_col = cols_dic['pub_id_col'], cols_dic['author_idx_col']
+    articles_df = build_articles_rawdata(PUBS_NB, seed=seed, duplicate_rate=0.4)
+    articles_df[cols_dic['norm_journal_col']] = articles_df[cols_dic['same_journal_col']]
+    articles_df = articles_df.drop(columns=[cols_dic['same_journal_col'], cols_dic['lc_title_col']])
+    authors_df = pd.DataFrame({pub_id_col    : np.repeat(np.arange(PUBS_NB), 2),
+                               author_idx_col: np.tile([0, 1], PUBS_NB),
+                               bp_sg.COL_NAMES['authors'][2]: "Dupont J"})
+
+    split_pub_id = int(PUBS_NB * SPLIT_RATE)
+    parsing_dicts_list = []
+    for first_pub_id, last_pub_id in [(0, PUBS_NB), (0, split_pub_id), (split_pub_id, PUBS_NB)]:
+        parsing_dict = {}
+        for item, item_df in zip(bp_sg.PARSING_ITEMS_LIST[:2], [articles_df, authors_df]):
+            item_df = item_df[item_df[pub_id_col].between(first_pub_id, last_pub_id - 1)].copy()
+            item_df[pub_id_col] -= first_pub_id
+            parsing_dict[item] = item_df.reset_index(drop=True)
+        parsing_dicts_list.append(parsing_dict)
+    return parsing_dicts_list
+
+
+@pytest.mark.parametrize("seed", [0, 5])
+def test_incremental_kept_publications(seed):
+    articles_item, authors_item = bp_sg.PARSING_ITEMS_LIST[:2]
+    full_parsing_dict, first_parsing_dict, second_parsing_dict = _build_split_corpus(seed)
+
+    full_dedup_dict = deduplicate_parsing(full_parsing_dict, progress_hook='silent')
+    first_dedup_dict = deduplicate_parsing(first_parsing_dict, progress_hook='silent')
+    dedup_index = build_dedup_index(first_dedup_dict)
+    incremental_dict, pub_ids_to_drop, updated_index = deduplicate_parsing_incremental(second_parsing_dict,
+                                                                                       dedup_index,
+                                                                                       first_dedup_dict,
+                                                                                       progress_hook='silent')
+    assert dedup_index['incremental_updates_nb']==0
+    assert updated_index['incremental_updates_nb']==1
+
+    full_kept_nb = len(full_dedup_dict[articles_item])
+    incremental_kept_nb = len(incremental_dict[articles_item])
+    assert abs(incremental_kept_nb - full_kept_nb)<=MAX_KEPT_GAP_RATE * full_kept_nb
+    kept_pub_ids_set = set(incremental_dict[articles_item][bp_sg.COL_NAMES['pub_id']])
+    assert set(incremental_dict[authors_item][bp_sg.COL_NAMES['pub_id']])==kept_pub_ids_set
+    assert not kept_pub_ids_set & pub_ids_to_drop
@@ -0,0 +1,26 @@
+"""Regression tests of the deduplication of the publications
+against the outputs of the deduplication before its rewriting.
+"""
+
+# 3rd party imports
+import pandas as pd
+import pytest
+
+# Local imports
+from BiblioParsing.BiblioParsingConcat import _deduplicate_articles
+from BiblioParsing.BiblioParsingConcat import _set_dedup_cols
+from regression_utils import REGRESSION_FIXTURES_PATH
+from regression_utils import assert_same_as_fixture
+from regression_utils import read_fixture_df
+
+
+@pytest.mark.parametrize("fixture", ["default", "variants", "unknowns"])
+def test_deduplicate_articles(fixture):
+    cols_dic = _set_dedup_cols()
+    pub_id_col = cols_dic['pub_id_col']
+    articles_df = read_fixture_df(REGRESSION_FIXTURES_PATH / f"deduplication_{fixture}_input.dat",
+                                  int_cols=[pub_id_col])
+    dedup_df, pub_ids_to_drop = _deduplicate_articles(articles_df, cols_dic)
+    assert_same_as_fixture(dedup_df, REGRESSION_FIXTURES_PATH / f"deduplication_{fixture}_expected.dat")
+    assert_same_as_fixture(pd.DataFrame({pub_id_col: sorted(pub_ids_to_drop)}),
+                           REGRESSION_FIXTURES_PATH / f"deduplication_{fixture}_expected_dropped.dat")
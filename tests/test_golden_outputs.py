@@ -0,0 +1,30 @@
+"""Checks the outputs of the parsing of the WoS and Scopus fixture corpuses, of their
+concatenation and of their deduplication against the golden files of the "golden" folder.
+
+The parsed items are limited to the ones built without the nltk data and the Scopus journals
+categories file, given by the 'GOLDEN_OFFLINE_ITEMS_DICT' global of the `golden_utils` module.
+The golden files are rebuilt, after an intended change of the outputs, from the tests folder by:
+
+    python -c "from golden_utils import *; \
+    save_golden_outputs('golden', pubs_nb=10, items_dict=GOLDEN_OFFLINE_ITEMS_DICT)"
+
+The checks are run on a copy of the golden folder since the parsing writes the IDs files
+of the publications in the folders of the fixture corpuses.
+"""
+
+# Standard library imports
+import shutil
+from pathlib import Path
+
+# Local imports
+from golden_utils import check_golden_outputs
+
+
+GOLDEN_PATH = Path(__file__).parent / Path("golden")
+
+
+def test_golden_outputs(tmp_path):
+    golden_path = tmp_path / Path("golden")
+    shutil.copytree(GOLDEN_PATH, golden_path)
+    identical, mismatches_df = check_golden_outputs(golden_path)
+    assert identical, mismatches_df.to_string()
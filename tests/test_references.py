@@ -0,0 +1,26 @@
+"""Regression tests of the parsing of the cited references
+against the outputs of the parsing before its rewriting.
+"""
+
+# 3rd party imports
+import pytest
+
+# Local imports
+from BiblioParsing.BiblioParsingScopus import _build_references_scopus
+from BiblioParsing.BiblioParsingScopus import _set_scopus_parsing_cols
+from BiblioParsing.BiblioParsingWos import _build_references_wos
+from BiblioParsing.BiblioParsingWos import _set_wos_parsing_cols
+from regression_utils import REGRESSION_FIXTURES_PATH
+from regression_utils import assert_same_as_fixture
+from regression_utils import read_fixture_df
+
+
+@pytest.mark.parametrize("database, build_refs, set_cols",
+                         [("wos", _build_references_wos, _set_wos_parsing_cols),
+                          ("scopus", _build_references_scopus, _set_scopus_parsing_cols)])
+def test_build_references(database, build_refs, set_cols):
+    cols_tup = set_cols()
+    rawdata_df = read_fixture_df(REGRESSION_FIXTURES_PATH / f"{database}_references_input.dat")
+    corpus_df = rawdata_df.rename_axis(cols_tup[1]['pub_id_col']).reset_index()
+    references_df = build_refs(corpus_df, cols_tup)
+    assert_same_as_fixture(references_df, REGRESSION_FIXTURES_PATH / f"{database}_references_expected.dat")
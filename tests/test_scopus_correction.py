@@ -0,0 +1,17 @@
+"""Regression tests of the correction of the Scopus full rawdata
+against the outputs of the correction before its vectorization.
+"""
+
+# Local imports
+from BiblioParsing.BiblioParsingScopus import _correct_scopus_full_rawdata
+from BiblioParsing.BiblioParsingScopus import _set_scopus_parsing_cols
+from regression_utils import REGRESSION_FIXTURES_PATH
+from regression_utils import assert_same_as_fixture
+from regression_utils import read_fixture_df
+
+
+def test_correct_scopus_full_rawdata():
+    rawdata_df = read_fixture_df(REGRESSION_FIXTURES_PATH / "scopus_correction_input.dat")
+    outputs_tup = _correct_scopus_full_rawdata(rawdata_df, _set_scopus_parsing_cols())
+    for file, df in zip(["corpus", "corrected_authors", "corrected_addresses"], outputs_tup):
+        assert_same_as_fixture(df, REGRESSION_FIXTURES_PATH / f"scopus_correction_expected_{file}.dat")
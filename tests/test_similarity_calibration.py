@@ -0,0 +1,35 @@
+"""Tests of the decisions of the 'lcs' similarity scorer against the ones
+of the 'difflib' reference scorer on the calibration pairs of journal names and titles.
+"""
+
+# 3rd party imports
+import numpy as np
+
+# Local imports
+import BiblioParsing.BiblioSpecificGlobals as bp_sg
+from BiblioParsing.BiblioParsingSimilarity import calibrate_similarity_threshold
+from BiblioParsing.BiblioParsingSimilarity import get_similarity_scorer
+from regression_utils import REGRESSION_FIXTURES_PATH
+from regression_utils import read_fixture_df
+
+
+def _read_calibration_pairs():
+    pairs_df = read_fixture_df(REGRESSION_FIXTURES_PATH / "similarity_calibration_pairs.dat")
+    return list(zip(pairs_df["a"], pairs_df["b"]))
+
+
+def _scorer_decisions(scorer_name, pairs_list):
+    scorer = get_similarity_scorer(scorer_name)
+    return np.array([round(scorer.ratio(a, b) * 100)>scorer.threshold for a, b in pairs_list])
+
+
+def test_lcs_same_decisions_as_difflib():
+    pairs_list = _read_calibration_pairs()
+    np.testing.assert_array_equal(_scorer_decisions('lcs', pairs_list),
+                                  _scorer_decisions('difflib', pairs_list))
+
+
+def test_lcs_calibrated_threshold():
+    pairs_list = _read_calibration_pairs()
+    threshold, agreement = calibrate_similarity_threshold('lcs', pairs_list)
+    assert (threshold, agreement)==(bp_sg.LCS_SIMILARITY_THRESHOLD, 1.0)